@@ -0,0 +1,125 @@
+"""
+Per-row cost and payload size of reading a page of places, through ORM entities,
+through the rows of the response columns and through a sparse fieldset.
+
+Run from the project root with the settings of the app available:
+
+    python -m benchmarks.place_read_path
+"""
+
+import asyncio
+import time
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.models import Location, Place, User
+from src.places.repositories.places import PlaceRepository
+from src.places.schemas.filters import PlaceFilter
+from src.places.schemas.places import (
+    PLACE_RESPONSE_FIELDS,
+    PlaceResponse,
+    get_place_list_adapter,
+)
+from src.repositories.postgres_base import Base
+
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+# Fields of a list screen showing names and dates
+LIST_SCREEN_FIELDS = ('id', 'place_name', 'visit_date')
+
+
+async def orm_read_path(session: AsyncSession, user_id: int) -> bytes:
+    """The former path: entities, a model per place and validation by the response model."""
+    result = await session.execute(select(Place).where(Place.user_id == user_id).limit(PAGE_SIZE))
+    places = [PlaceResponse.model_validate(place) for place in result.scalars()]
+
+    place_list_adapter = get_place_list_adapter(PLACE_RESPONSE_FIELDS)
+    return place_list_adapter.dump_json(
+        place_list_adapter.validate_python(places, from_attributes=True)
+    )
+
+
+async def row_read_path(
+    session: AsyncSession, user_id: int, fields: tuple[str, ...] = PLACE_RESPONSE_FIELDS
+) -> bytes:
+    """The current path: rows of the chosen columns, validated and serialized once."""
+    places = await PlaceRepository(db_session=session).get_places_by_user(
+        filters=PlaceFilter(), user_id=user_id, limit=PAGE_SIZE, fields=fields
+    )
+    place_list_adapter = get_place_list_adapter(fields)
+
+    return place_list_adapter.dump_json(
+        place_list_adapter.validate_python([place._mapping for place in places])
+    )
+
+
+async def fieldset_read_path(session: AsyncSession, user_id: int) -> bytes:
+    return await row_read_path(session=session, user_id=user_id, fields=LIST_SCREEN_FIELDS)
+
+
+async def seed(session_maker: async_sessionmaker[AsyncSession]) -> int:
+    async with session_maker() as session:
+        user = User(full_name='Benchmark', email='benchmark@mail.com')
+        location = Location(city='kyiv', country='ukraine', latitude=50.45, longitude=30.52)
+        session.add_all([user, location])
+        await session.flush()
+
+        session.add_all(
+            Place(
+                place_name=f'Place {number}',
+                city='Kyiv',
+                country='Ukraine',
+                description='A place to benchmark the read path',
+                rating=5,
+                days_spent=3,
+                visit_date=date(2024, 1, 28),
+                place_type='visited',
+                user_id=user.id,
+                location_id=location.id,
+                latitude=location.latitude,
+                longitude=location.longitude,
+            )
+            for number in range(PAGE_SIZE)
+        )
+        await session.commit()
+
+        return user.id
+
+
+async def measure(session_maker: async_sessionmaker[AsyncSession], read_path, user_id: int):
+    """Returns the mean microseconds per row and the payload bytes of the read path."""
+    async with session_maker() as session:
+        payload = await read_path(session, user_id)
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            await read_path(session, user_id)
+            session.expunge_all()
+
+        return (time.perf_counter() - started) / ROUNDS / PAGE_SIZE * 1_000_000, len(payload)
+
+
+async def main() -> None:
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    user_id = await seed(session_maker)
+
+    read_paths = (('orm', orm_read_path), ('rows', row_read_path), ('fields', fieldset_read_path))
+    for name, read_path in read_paths:
+        per_row, payload_size = await measure(session_maker, read_path, user_id)
+        print(
+            f'{name:>6}: {per_row:7.2f} us per row, {payload_size:6} bytes per page of {PAGE_SIZE}'
+        )
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -7,7 +7,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from src.settings import settings
 from src.repositories.postgres_base import Base
-from src.models import User, SocialAccount, TokenBlacklist, Place, PlannedPlace  # noqa
+from src.models import User, SocialAccount, TokenBlacklist, Place, PlannedPlace, PlaceDescription, Location  # noqa
 
 
 
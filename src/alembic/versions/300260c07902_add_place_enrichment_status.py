@@ -0,0 +1,32 @@
+"""add place enrichment status
+
+Revision ID: 300260c07902
+Revises: cc156fe30d64
+Create Date: 2026-10-17 10:03:27.541981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '300260c07902'
+down_revision: Union[str, None] = 'cc156fe30d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+enrichment_status = sa.Enum('PENDING', 'COMPLETED', 'FAILED', name='enrichmentstatus')
+
+
+def upgrade() -> None:
+    enrichment_status.create(op.get_bind(), checkfirst=True)
+    # Existing places were described synchronously, so they are already complete
+    op.add_column('places', sa.Column('enrichment_status', enrichment_status, server_default='COMPLETED', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('places', 'enrichment_status')
+    enrichment_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,124 @@
+"""add locations
+
+Revision ID: 5e8b0c3f7a21
+Revises: 7d2f4a9e1c85
+Create Date: 2026-10-17 13:02:41.227391
+
+"""
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b0c3f7a21'
+down_revision: Union[str, None] = '7d2f4a9e1c85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copies of the aliases of this revision, so that the backfill does not
+# change with the application code
+COUNTRY_ALIASES = {
+    'us': 'united states', 'usa': 'united states', 'united states of america': 'united states',
+    'america': 'united states', 'uk': 'united kingdom', 'gb': 'united kingdom',
+    'gbr': 'united kingdom', 'great britain': 'united kingdom', 'ua': 'ukraine',
+    'ukr': 'ukraine', 'de': 'germany', 'deu': 'germany', 'deutschland': 'germany',
+    'fr': 'france', 'fra': 'france', 'es': 'spain', 'esp': 'spain', 'espana': 'spain',
+    'it': 'italy', 'ita': 'italy', 'italia': 'italy', 'pl': 'poland', 'pol': 'poland',
+    'polska': 'poland', 'cz': 'czechia', 'cze': 'czechia', 'czech republic': 'czechia',
+    'nl': 'netherlands', 'nld': 'netherlands', 'holland': 'netherlands',
+    'the netherlands': 'netherlands', 'ru': 'russia', 'rus': 'russia',
+    'russian federation': 'russia', 'kr': 'south korea', 'kor': 'south korea',
+    'korea': 'south korea', 'republic of korea': 'south korea',
+    'ae': 'united arab emirates', 'uae': 'united arab emirates', 'cn': 'china',
+    'chn': 'china', 'jp': 'japan', 'jpn': 'japan', 'tr': 'turkey', 'tur': 'turkey',
+    'turkiye': 'turkey',
+}
+CITY_ALIASES = {
+    'kiev': 'kyiv', 'lvov': 'lviv', 'odessa': 'odesa', 'kharkov': 'kharkiv',
+    'dnepropetrovsk': 'dnipro', 'nikolaev': 'mykolaiv', 'zaporozhye': 'zaporizhzhia',
+    'bombay': 'mumbai', 'calcutta': 'kolkata', 'madras': 'chennai', 'peking': 'beijing',
+    'saigon': 'ho chi minh city', 'rangoon': 'yangon', 'new york city': 'new york',
+    'nyc': 'new york', 'munchen': 'munich', 'koln': 'cologne', 'wien': 'vienna',
+    'praha': 'prague', 'warszawa': 'warsaw', 'roma': 'rome', 'firenze': 'florence',
+    'venezia': 'venice', 'napoli': 'naples', 'lisboa': 'lisbon',
+}
+
+
+def fold_name(name: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+    return ' '.join(stripped.replace('.', '').split()).casefold()
+
+
+def canonicalize_location(city: str, country: str) -> tuple[str, str]:
+    canonical_city, canonical_country = fold_name(city), fold_name(country)
+
+    return (
+        CITY_ALIASES.get(canonical_city, canonical_city),
+        COUNTRY_ALIASES.get(canonical_country, canonical_country),
+    )
+
+
+def upgrade() -> None:
+    op.create_table('locations',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('city', sa.String(), nullable=False),
+    sa.Column('country', sa.String(), nullable=False),
+    sa.Column('latitude', sa.Float(), nullable=True),
+    sa.Column('longitude', sa.Float(), nullable=True),
+    sa.Column('provider_payload', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('city', 'country')
+    )
+    for table in ('places', 'planned_places'):
+        op.add_column(table, sa.Column('location_id', sa.Integer(), nullable=True))
+        op.create_index(op.f(f'ix_{table}_location_id'), table, ['location_id'], unique=False)
+        op.create_foreign_key(None, table, 'locations', ['location_id'], ['id'], ondelete='SET NULL')
+
+    # Existing rows were validated when they were stored, so their locations are
+    # created from the distinct city and country pairs, canonicalized by the aliases.
+    # They have no coordinates yet; the application validates such a location again
+    # the first time it is used and copies its coordinates to its places
+    bind = op.get_bind()
+    for table in ('places', 'planned_places'):
+        pairs = bind.execute(sa.text(
+            f'SELECT DISTINCT city, country FROM {table} '
+            'WHERE city IS NOT NULL AND country IS NOT NULL'
+        )).all()
+
+        for city, country in pairs:
+            canonical_city, canonical_country = canonicalize_location(city=city, country=country)
+            bind.execute(
+                sa.text(
+                    'INSERT INTO locations (city, country) VALUES (:city, :country) '
+                    'ON CONFLICT (city, country) DO NOTHING'
+                ),
+                {'city': canonical_city, 'country': canonical_country},
+            )
+            bind.execute(
+                sa.text(
+                    f'UPDATE {table} SET location_id = locations.id FROM locations '
+                    f'WHERE locations.city = :canonical_city '
+                    f'AND locations.country = :canonical_country '
+                    f'AND {table}.city = :city AND {table}.country = :country'
+                ),
+                {
+                    'canonical_city': canonical_city,
+                    'canonical_country': canonical_country,
+                    'city': city,
+                    'country': country,
+                },
+            )
+
+
+def downgrade() -> None:
+    for table in ('places', 'planned_places'):
+        op.drop_constraint(f'{table}_location_id_fkey', table, type_='foreignkey')
+        op.drop_index(op.f(f'ix_{table}_location_id'), table_name=table)
+        op.drop_column(table, 'location_id')
+    op.drop_table('locations')
@@ -0,0 +1,40 @@
+"""add place descriptions
+
+Revision ID: 7d2f4a9e1c85
+Revises: 300260c07902
+Create Date: 2026-10-17 11:21:08.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2f4a9e1c85'
+down_revision: Union[str, None] = '300260c07902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('place_descriptions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('place_name', sa.String(), nullable=False),
+    sa.Column('city', sa.String(), nullable=False),
+    sa.Column('country', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=False),
+    sa.Column('photo_url', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('place_name', 'city', 'country')
+    )
+
+    # The store is not seeded from places: users edit their descriptions and photos,
+    # which must not be shared, and edited rows cannot be told from generated ones.
+    # Popular places are described by the pregeneration job instead.
+
+
+def downgrade() -> None:
+    op.drop_table('place_descriptions')
@@ -0,0 +1,84 @@
+"""add place coordinates
+
+Revision ID: 9a4c6e2b8d13
+Revises: 5e8b0c3f7a21
+Create Date: 2026-10-17 14:37:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c6e2b8d13'
+down_revision: Union[str, None] = '5e8b0c3f7a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A frozen copy of the geohash encoding of this revision
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9
+
+
+def encode_geohash(latitude: float, longitude: float) -> str:
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    geohash, bits, bit_count, even_bit = [], 0, 0, True
+
+    while len(geohash) < GEOHASH_PRECISION:
+        value, value_range = (longitude, lng_range) if even_bit else (latitude, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = bits << 1 | 1
+            value_range[0] = middle
+        else:
+            bits <<= 1
+            value_range[1] = middle
+
+        even_bit = not even_bit
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+
+    return ''.join(geohash)
+
+
+def upgrade() -> None:
+    for table in ('places', 'planned_places'):
+        op.add_column(table, sa.Column('latitude', sa.Float(), nullable=True))
+        op.add_column(table, sa.Column('longitude', sa.Float(), nullable=True))
+        op.add_column(table, sa.Column('geohash', sa.String(length=12), nullable=True))
+        op.create_index(f'ix_{table}_user_id_geohash', table, ['user_id', 'geohash'], unique=False)
+
+    # Places take the coordinates of their location, the geohash is computed here
+    # as the database has no function for it
+    bind = op.get_bind()
+    locations = bind.execute(sa.text(
+        'SELECT id, latitude, longitude FROM locations '
+        'WHERE latitude IS NOT NULL AND longitude IS NOT NULL'
+    )).all()
+
+    for location_id, latitude, longitude in locations:
+        for table in ('places', 'planned_places'):
+            bind.execute(
+                sa.text(
+                    f'UPDATE {table} SET latitude = :latitude, longitude = :longitude, '
+                    'geohash = :geohash WHERE location_id = :location_id'
+                ),
+                {
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'geohash': encode_geohash(latitude=latitude, longitude=longitude),
+                    'location_id': location_id,
+                },
+            )
+
+
+def downgrade() -> None:
+    for table in ('places', 'planned_places'):
+        op.drop_index(f'ix_{table}_user_id_geohash', table_name=table)
+        op.drop_column(table, 'geohash')
+        op.drop_column(table, 'longitude')
+        op.drop_column(table, 'latitude')
@@ -0,0 +1,29 @@
+"""add place keyset indexes
+
+Revision ID: b3e1f7c94a52
+Revises: 9a4c6e2b8d13
+Create Date: 2026-10-17 16:05:48.120377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1f7c94a52'
+down_revision: Union[str, None] = '9a4c6e2b8d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_places_user_id_id', 'places', ['user_id', 'id'], unique=False)
+    op.create_index('ix_places_user_id_rating_id', 'places', ['user_id', 'rating', 'id'], unique=False)
+    op.create_index('ix_places_user_id_visit_date_id', 'places', ['user_id', 'visit_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_places_user_id_visit_date_id', table_name='places')
+    op.drop_index('ix_places_user_id_rating_id', table_name='places')
+    op.drop_index('ix_places_user_id_id', table_name='places')
@@ -0,0 +1,89 @@
+"""partition token blacklist by expiry
+
+Revision ID: cc156fe30d64
+Revises: 1b5c321d3e3d
+Create Date: 2026-10-17 09:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cc156fe30d64'
+down_revision: Union[str, None] = '1b5c321d3e3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.rename_table('token_blacklist', 'token_blacklist_legacy')
+    op.execute(
+        'ALTER TABLE token_blacklist_legacy '
+        'RENAME CONSTRAINT token_blacklist_pkey TO token_blacklist_legacy_pkey'
+    )
+
+    op.create_table('token_blacklist',
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('blacklisted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('token_hash', 'expires_at'),
+    postgresql_partition_by='RANGE (expires_at)'
+    )
+
+    # Daily partitions covering every token that has not expired yet plus a few days ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            day date := (now() AT TIME ZONE 'UTC')::date;
+            last_day date := GREATEST(
+                (SELECT max(expires_at) FROM token_blacklist_legacy)::date, day
+            ) + 3;
+        BEGIN
+            WHILE day <= last_day LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF token_blacklist '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'token_blacklist_p' || to_char(day, 'YYYYMMDD'),
+                    day::timestamp AT TIME ZONE 'UTC',
+                    (day + 1)::timestamp AT TIME ZONE 'UTC'
+                );
+                day := day + 1;
+            END LOOP;
+        END $$;
+    """)
+
+    # Digests expiring on a day without a partition, the maintenance job moves them
+    # into the partition of their day once it creates it
+    op.execute('CREATE TABLE token_blacklist_default PARTITION OF token_blacklist DEFAULT')
+
+    # Backfill digests of the tokens that are still valid, expired ones are not needed
+    op.execute("""
+        INSERT INTO token_blacklist (token_hash, expires_at, blacklisted_at)
+        SELECT encode(sha256(convert_to(token, 'UTF8')), 'hex'),
+               expires_at AT TIME ZONE 'UTC',
+               blacklisted_at
+        FROM token_blacklist_legacy
+        WHERE expires_at AT TIME ZONE 'UTC' >= now()
+        ON CONFLICT DO NOTHING
+    """)
+
+    op.drop_index('ix_token_blacklist_token', table_name='token_blacklist_legacy')
+    op.drop_index('ix_token_blacklist_id', table_name='token_blacklist_legacy')
+    op.drop_table('token_blacklist_legacy')
+
+
+def downgrade() -> None:
+    # Digests cannot be turned back into tokens, so the old table is recreated empty
+    op.drop_table('token_blacklist')
+    op.create_table('token_blacklist',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('token', sa.String(), nullable=False),
+    sa.Column('blacklisted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_token_blacklist_id'), 'token_blacklist', ['id'], unique=False)
+    op.create_index(op.f('ix_token_blacklist_token'), 'token_blacklist', ['token'], unique=False)
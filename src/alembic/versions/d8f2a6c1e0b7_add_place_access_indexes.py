@@ -0,0 +1,34 @@
+"""add place access indexes
+
+Revision ID: d8f2a6c1e0b7
+Revises: b3e1f7c94a52
+Create Date: 2026-10-17 17:22:31.904655
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f2a6c1e0b7'
+down_revision: Union[str, None] = 'b3e1f7c94a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_places_user_id_details', 'places', ['user_id', 'place_name', 'city', 'place_type', 'visit_date'], unique=False)
+    op.create_index('ix_places_user_id_place_type', 'places', ['user_id', 'place_type'], unique=False)
+    op.create_index('ix_places_user_id_location_id', 'places', ['user_id', 'location_id'], unique=False)
+    # The primary keys are indexed already
+    op.drop_index('ix_places_id', table_name='places')
+    op.drop_index('ix_planned_places_id', table_name='planned_places')
+
+
+def downgrade() -> None:
+    op.create_index('ix_planned_places_id', 'planned_places', ['id'], unique=False)
+    op.create_index('ix_places_id', 'places', ['id'], unique=False)
+    op.drop_index('ix_places_user_id_location_id', table_name='places')
+    op.drop_index('ix_places_user_id_place_type', table_name='places')
+    op.drop_index('ix_places_user_id_details', table_name='places')
@@ -0,0 +1,69 @@
+"""add place identity constraint
+
+Revision ID: f1a7c3d5e9b2
+Revises: d8f2a6c1e0b7
+Create Date: 2026-10-17 18:10:06.331842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3d5e9b2'
+down_revision: Union[str, None] = 'd8f2a6c1e0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def format_name(name: str) -> str:
+    """A frozen copy of the formatting of city and country names of this revision."""
+    return name.strip().title()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # NULLS NOT DISTINCT, which makes places without a city or date unique, needs 15
+    if bind.dialect.server_version_info < (15,):
+        raise RuntimeError('uq_places_user_id_details requires PostgreSQL 15 or later')
+
+    # Places used to be stored with the city and country the client sent, while the
+    # formatted ones were compared; they are formatted first so that the identity
+    # is enforced on the same values for the existing places as for new ones
+    for column in ('city', 'country'):
+        names = bind.execute(sa.text(
+            f'SELECT DISTINCT {column} FROM places WHERE {column} IS NOT NULL'
+        )).scalars().all()
+        for name in names:
+            if format_name(name) != name:
+                bind.execute(
+                    sa.text(f'UPDATE places SET {column} = :formatted WHERE {column} = :name'),
+                    {'formatted': format_name(name), 'name': name},
+                )
+
+    # Places sharing an identity once formatted are distinct rows the users stored,
+    # so they are not deleted here; the upgrade stops until they are merged or renamed
+    duplicates = bind.execute(sa.text(
+        'SELECT user_id, place_name, city, place_type, visit_date, array_agg(id ORDER BY id) '
+        'FROM places GROUP BY user_id, place_name, city, place_type, visit_date '
+        'HAVING count(*) > 1'
+    )).all()
+    if duplicates:
+        conflicts = '\n'.join(
+            f'user {user_id}: "{place_name}", {city}, {place_type}, {visit_date}: places {ids}'
+            for user_id, place_name, city, place_type, visit_date, ids in duplicates
+        )
+        raise RuntimeError(
+            'Places of the same user share a name, city, type and visit date, merge or '
+            f'rename them before upgrading:\n{conflicts}'
+        )
+
+    op.drop_index('ix_places_user_id_details', table_name='places')
+    op.create_index('uq_places_user_id_details', 'places', ['user_id', 'place_name', 'city', 'place_type', 'visit_date'], unique=True, postgresql_nulls_not_distinct=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_places_user_id_details', table_name='places')
+    op.create_index('ix_places_user_id_details', 'places', ['user_id', 'place_name', 'city', 'place_type', 'visit_date'], unique=False)
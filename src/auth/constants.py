@@ -7,3 +7,28 @@ GOOGLE_TOKEN_URL = 'https://oauth2.googleapis.com/token'
 GOOGLE_USERINFO_URL = 'https://www.googleapis.com/oauth2/v1/userinfo'
 
 CACHE_TTL = 100
+
+PRINCIPAL_CACHE_TEMPLATE = 'principal_${user_id}'
+
+PRINCIPAL_CACHE_TTL = 60
+
+PRINCIPAL_LOCAL_CACHE_TTL = 10
+
+PRINCIPAL_LOCAL_CACHE_SIZE = 1024
+
+REVOKED_TOKENS_CHANNEL = 'token_blacklist_revocations'
+
+REVOKED_TOKENS_FILTER_CAPACITY = 100_000
+
+REVOKED_TOKENS_FILTER_ERROR_RATE = 0.001
+
+REVOKED_TOKENS_RESYNC_DELAY = 5
+
+TOKEN_BLACKLIST_PARTITION_TEMPLATE = 'token_blacklist_p${day}'
+
+TOKEN_BLACKLIST_PARTITION_DATE_FORMAT = '%Y%m%d'
+
+# Catches digests expiring on a day whose partition was not created in time
+TOKEN_BLACKLIST_DEFAULT_PARTITION = 'token_blacklist_default'
+
+TOKEN_BLACKLIST_PARTITIONS_AHEAD = 2
@@ -1,12 +1,18 @@
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
 from httpx import AsyncClient
 
+from src.services.http_clients import GOOGLE_CLIENT, http_clients
 from src.settings import settings
 
 
-cypher = Fernet(settings.encryption_key.encode())
+@lru_cache
+def get_cypher() -> Fernet:
+    """Returns the worker-wide Fernet cypher, created on first use."""
+    return Fernet(settings.encryption_key.encode())
 
 
-async def get_async_client() -> AsyncClient:
-    async with AsyncClient() as client:
-        yield client
+def get_google_client() -> AsyncClient:
+    """Returns the pooled client used for Google OAuth requests."""
+    return http_clients.get(GOOGLE_CLIENT)
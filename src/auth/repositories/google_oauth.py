@@ -5,7 +5,7 @@ from fastapi import Depends
 from httpx import AsyncClient
 
 from src.auth.constants import GOOGLE_TOKEN_URL, GOOGLE_USERINFO_URL
-from src.auth.dependencies import get_async_client
+from src.auth.dependencies import get_google_client
 from src.auth.exceptions import GoogleOAuthError
 from src.auth.schemas.google_oauth import GoogleTokenResponse, GoogleUserInfoResponse
 from src.settings import settings
@@ -19,7 +19,7 @@ class GoogleOAuthRepository:
 
     def __init__(
         self,
-        client: Annotated[AsyncClient, Depends(get_async_client)],
+        client: Annotated[AsyncClient, Depends(get_google_client)],
     ):
         self.client = client
 
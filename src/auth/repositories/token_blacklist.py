@@ -1,14 +1,23 @@
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
+from string import Template
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import delete, select
+from sqlalchemy import exists, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.constants import (
+    TOKEN_BLACKLIST_DEFAULT_PARTITION,
+    TOKEN_BLACKLIST_PARTITION_DATE_FORMAT,
+    TOKEN_BLACKLIST_PARTITION_TEMPLATE,
+)
 from src.auth.exceptions import GoogleOAuthError, TokenError
 from src.auth.schemas.auth_schemas import TokenBlacklistRequest
+from src.auth.services.revoked_tokens import revoked_token_filter
 from src.dependencies import get_db
 from src.models import TokenBlacklist
 
@@ -21,11 +30,18 @@ class TokenBlacklistRepository:
         self.db_session = db_session
 
     async def add_token_to_blacklist(self, blacklist_entry: TokenBlacklistRequest) -> None:
-        """Adds a token to the blacklist."""
-        try:
-            blacklist_entry = TokenBlacklist(**blacklist_entry.model_dump())
+        """Adds a token digest to the blacklist, a digest already on it is kept as is."""
+        insert = postgresql_insert if self._dialect_name == 'postgresql' else sqlite_insert
 
-            self.db_session.add(blacklist_entry)
+        try:
+            stmt = (
+                insert(TokenBlacklist)
+                .values(**blacklist_entry.model_dump())
+                .on_conflict_do_nothing(
+                    index_elements=[TokenBlacklist.token_hash, TokenBlacklist.expires_at]
+                )
+            )
+            await self.db_session.execute(stmt)
             await self.db_session.commit()
 
         except SQLAlchemyError as e:
@@ -33,31 +49,149 @@ class TokenBlacklistRepository:
             logger.error(f'Failed to add token to blacklist: {e}')
             raise GoogleOAuthError()
 
-    async def is_token_blacklisted(self, token: str) -> bool:
-        """Checks if the given token is blacklisted."""
+        await revoked_token_filter.add(token_hash=blacklist_entry.token_hash)
+
+    @property
+    def _dialect_name(self) -> str:
+        return self.db_session.get_bind().dialect.name
+
+    async def is_token_blacklisted(self, token_hash: str) -> bool:
+        """Checks if the token with the given digest is blacklisted."""
         try:
             result = await self.db_session.execute(
-                select(TokenBlacklist).where(TokenBlacklist.token == token)
+                select(exists().where(TokenBlacklist.token_hash == token_hash))
             )
 
-            return result.scalars().first() is not None
+            return result.scalar()
 
         except SQLAlchemyError as e:
             logger.error(f'Failed to check if token is blacklisted: {e}')
             raise GoogleOAuthError()
 
-    async def remove_expired_tokens(self) -> int:
-        """Deletes expired tokens and returns the count of removed tokens."""
+    async def get_active_token_digests(self) -> list[str]:
+        """Returns digests of all blacklisted tokens that have not expired yet."""
+        try:
+            result = await self.db_session.execute(
+                select(TokenBlacklist.token_hash).where(
+                    TokenBlacklist.expires_at >= datetime.now(timezone.utc)
+                )
+            )
+
+            return list(result.scalars())
+
+        except SQLAlchemyError as e:
+            logger.error(f'Failed to load blacklisted tokens: {e}')
+            raise TokenError()
+
+    async def create_partitions(self, start: date, days: int) -> None:
+        """
+        Creates daily expiry partitions for the given number of days from start on.
+
+        Digests that landed in the default partition because their day had no
+        partition yet are moved into the new one.
+        """
+        try:
+            for offset in range(days):
+                day = start + timedelta(days=offset)
+                partition_name = self._partition_name(day)
+                exists = await self.db_session.scalar(
+                    text('SELECT to_regclass(:partition_name) IS NOT NULL'),
+                    {'partition_name': partition_name},
+                )
+                if exists:
+                    continue
+
+                bounds = {
+                    'day_start': datetime.combine(day, time.min, tzinfo=timezone.utc),
+                    'day_end': datetime.combine(
+                        day + timedelta(days=1), time.min, tzinfo=timezone.utc
+                    ),
+                }
+                await self.db_session.execute(
+                    text(
+                        f'CREATE TABLE {partition_name} '
+                        f'(LIKE {TokenBlacklist.__tablename__} INCLUDING DEFAULTS)'
+                    )
+                )
+                await self.db_session.execute(
+                    text(
+                        f'WITH moved AS (DELETE FROM {TOKEN_BLACKLIST_DEFAULT_PARTITION} '
+                        'WHERE expires_at >= :day_start AND expires_at < :day_end '
+                        f'RETURNING *) INSERT INTO {partition_name} SELECT * FROM moved'
+                    ),
+                    bounds,
+                )
+                await self.db_session.execute(
+                    text(
+                        f'ALTER TABLE {TokenBlacklist.__tablename__} '
+                        f'ATTACH PARTITION {partition_name} '
+                        f"FOR VALUES FROM ('{bounds['day_start'].isoformat()}') "
+                        f"TO ('{bounds['day_end'].isoformat()}')"
+                    )
+                )
+            await self.db_session.commit()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to create token blacklist partitions: {e}')
+            raise TokenError()
+
+    async def drop_expired_partitions(self) -> int:
+        """
+        Drops the expiry partitions whose whole range lies in the past and the
+        expired digests of the default partition, and returns the count of
+        dropped partitions.
+        """
         try:
-            query = delete(TokenBlacklist).where(
-                TokenBlacklist.expires_at < datetime.now(timezone.utc)
+            result = await self.db_session.execute(
+                text(
+                    'SELECT child.relname FROM pg_inherits '
+                    'JOIN pg_class parent ON pg_inherits.inhparent = parent.oid '
+                    'JOIN pg_class child ON pg_inherits.inhrelid = child.oid '
+                    'WHERE parent.relname = :table_name'
+                ),
+                {'table_name': TokenBlacklist.__tablename__},
+            )
+            today = datetime.now(timezone.utc).date()
+            expired_partitions = []
+            for partition_name in result.scalars():
+                # The default partition and tables attached by hand have no day
+                partition_day = self._partition_day(partition_name)
+                if partition_day is not None and partition_day < today:
+                    expired_partitions.append(partition_name)
+
+            for partition_name in expired_partitions:
+                await self.db_session.execute(text(f'DROP TABLE {partition_name}'))
+            await self.db_session.execute(
+                text(f'DELETE FROM {TOKEN_BLACKLIST_DEFAULT_PARTITION} WHERE expires_at < now()')
             )
-            result = await self.db_session.execute(query)
             await self.db_session.commit()
 
-            return result.rowcount()
+            return len(expired_partitions)
 
         except SQLAlchemyError as e:
             await self.db_session.rollback()
-            logger.error(f'Failed to remove expired tokens: {e}')
+            logger.error(f'Failed to drop expired token blacklist partitions: {e}')
             raise TokenError()
+
+    @staticmethod
+    def _partition_name(day: date) -> str:
+        partition_template = Template(TOKEN_BLACKLIST_PARTITION_TEMPLATE)
+
+        return partition_template.substitute(
+            day=day.strftime(TOKEN_BLACKLIST_PARTITION_DATE_FORMAT)
+        )
+
+    @staticmethod
+    def _partition_day(partition_name: str) -> date | None:
+        """Returns the expiry day of a daily partition, or None for other tables."""
+        prefix = Template(TOKEN_BLACKLIST_PARTITION_TEMPLATE).substitute(day='')
+        if not partition_name.startswith(prefix):
+            return None
+
+        try:
+            return datetime.strptime(
+                partition_name.removeprefix(prefix), TOKEN_BLACKLIST_PARTITION_DATE_FORMAT
+            ).date()
+        except ValueError:
+            return None
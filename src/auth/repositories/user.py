@@ -6,7 +6,6 @@ from pydantic import EmailStr
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from src.auth.exceptions import GoogleOAuthError
 from src.auth.schemas.user_schemas import UserBase, UserFilter
@@ -16,6 +15,8 @@ from src.models import User
 
 logger = logging.getLogger(__name__)
 
+USER_COLUMNS = tuple(User.__table__.c[field_name] for field_name in UserBase.model_fields)
+
 
 class UserRepository:
     def __init__(self, db_session: Annotated[AsyncSession, Depends(get_db)]):
@@ -24,7 +25,8 @@ class UserRepository:
     async def get_user(self, filters: UserFilter) -> UserBase | None:
         """Get a user by given filters."""
         try:
-            stmt = select(User).options(joinedload(User.social_accounts))
+            # Only the columns of the user, the social accounts are loaded on their own
+            stmt = select(*USER_COLUMNS)
 
             if filters.email:
                 stmt = stmt.filter(User.email == filters.email)
@@ -33,7 +35,7 @@ class UserRepository:
                 stmt = stmt.filter(User.id == filters.user_id)
 
             result = await self.db_session.execute(stmt)
-            user = result.scalars().first()
+            user = result.first()
 
             return UserBase.model_validate(user) if user else None
 
@@ -42,9 +42,9 @@ class TokenRefreshResponse(BaseModel):
 
 
 class TokenBlacklistRequest(BaseModel):
-    """Schema for adding tokens to the blacklist with expiration details."""
+    """Schema for adding token digests to the blacklist with expiration details."""
 
-    token: str
+    token_hash: str
     expires_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
@@ -2,11 +2,12 @@ import logging
 from typing import Annotated
 from urllib.parse import urlencode, urljoin
 
+from cryptography.fernet import Fernet
 from fastapi import Depends
 from pydantic import HttpUrl
 
 from src.auth.constants import GOOGLE_OAUTH_BASE_URL
-from src.auth.dependencies import cypher
+from src.auth.dependencies import get_cypher
 from src.auth.exceptions import GoogleOAuthError
 from src.auth.repositories.google_oauth import GoogleOAuthRepository
 from src.auth.repositories.social_account import SocialAccountRepository
@@ -21,6 +22,7 @@ from src.auth.schemas.user_schemas import (
     UserBase,
     UserWithSocialAccountsResponse,
 )
+from src.auth.services.principal_cache import PrincipalCacheService
 from src.auth.utils.security_utils import encode_token
 from src.settings import settings
 
@@ -38,10 +40,14 @@ class GoogleAuthService:
         user_repository: Annotated[UserRepository, Depends(UserRepository)],
         social_repository: Annotated[SocialAccountRepository, Depends(SocialAccountRepository)],
         google_oauth_repo: Annotated[GoogleOAuthRepository, Depends(GoogleOAuthRepository)],
+        principal_cache: Annotated[PrincipalCacheService, Depends(PrincipalCacheService)],
+        cypher: Annotated[Fernet, Depends(get_cypher)],
     ):
         self.user_repository = user_repository
         self.social_repository = social_repository
         self.google_oauth_repo = google_oauth_repo
+        self.principal_cache = principal_cache
+        self.cypher = cypher
 
     async def handle_google_callback(
         self, code: str, redirect_uri: str, state: str
@@ -89,7 +95,9 @@ class GoogleAuthService:
         """
         existing_user = await self.user_repository.get_user_by_email(email=user.email)
         if not existing_user:
-            return await self.user_repository.create_user(user=user)
+            created_user = await self.user_repository.create_user(user=user)
+            await self.principal_cache.invalidate(user_id=created_user.id)
+            return created_user
         return existing_user
 
     async def _create_or_connect_social_account(
@@ -117,8 +125,8 @@ class GoogleAuthService:
         social_account = SocialAccountLink(
             service='google',
             social_account_id=user_info.id,
-            access_token=encode_token(token=token_data.access_token, cypher=cypher),
-            refresh_token=encode_token(token=token_data.refresh_token, cypher=cypher),
+            access_token=encode_token(token=token_data.access_token, cypher=self.cypher),
+            refresh_token=encode_token(token=token_data.refresh_token, cypher=self.cypher),
             user_id=user_id,
         )
 
@@ -128,11 +136,17 @@ class GoogleAuthService:
         if existing_account:
             existing_account.access_token = social_account.access_token
             existing_account.refresh_token = social_account.refresh_token
-            return await self.social_repository.update_social_account(
+            linked_account = await self.social_repository.update_social_account(
                 social_account=existing_account
             )
+        else:
+            linked_account = await self.social_repository.create_social_account(
+                social_account=social_account
+            )
+
+        await self.principal_cache.invalidate(user_id=user_id)
 
-        return await self.social_repository.create_social_account(social_account=social_account)
+        return linked_account
 
     async def _fetch_google_tokens(self, code: str, redirect_uri: str) -> GoogleTokenResponse:
         """
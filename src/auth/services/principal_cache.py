@@ -0,0 +1,66 @@
+import logging
+from string import Template
+
+from src.auth.constants import (
+    PRINCIPAL_CACHE_TEMPLATE,
+    PRINCIPAL_CACHE_TTL,
+    PRINCIPAL_LOCAL_CACHE_SIZE,
+    PRINCIPAL_LOCAL_CACHE_TTL,
+)
+from src.auth.schemas.user_schemas import ExtendedUserResponse
+from src.services.cache import CacheService
+from src.utils.lru_cache import TTLLRUCache
+
+
+logger = logging.getLogger(__name__)
+
+
+_local_principals = TTLLRUCache(maxsize=PRINCIPAL_LOCAL_CACHE_SIZE, ttl=PRINCIPAL_LOCAL_CACHE_TTL)
+
+
+class PrincipalCacheService:
+    """
+    Two-tier cache of resolved principals (ExtendedUserResponse) keyed by user id.
+
+    The in-process LRU answers repeated requests on the same worker, Redis shares
+    principals between workers. The local TTL is kept shorter than the Redis one
+    because invalidations only reach the local tier of the worker that made the write.
+    """
+
+    @staticmethod
+    def _cache_key(user_id: int) -> str:
+        return Template(PRINCIPAL_CACHE_TEMPLATE).substitute(user_id=user_id)
+
+    async def get_principal(self, user_id: int) -> ExtendedUserResponse | None:
+        """Returns the cached principal, checking the local tier before Redis."""
+        principal = _local_principals.get(user_id)
+        if principal is not None:
+            return principal
+
+        cached_data = await CacheService.get_cache(self._cache_key(user_id=user_id))
+        if cached_data is None:
+            return None
+
+        principal = ExtendedUserResponse.model_validate(cached_data)
+        _local_principals.set(user_id, principal)
+
+        return principal
+
+    async def set_principal(self, principal: ExtendedUserResponse) -> None:
+        """Stores the resolved principal in both tiers."""
+        _local_principals.set(principal.id, principal)
+        await CacheService.set_cache(
+            self._cache_key(user_id=principal.id),
+            principal.model_dump(mode='json'),
+            ttl=PRINCIPAL_CACHE_TTL,
+        )
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drops the principal after the user or one of their social accounts changed."""
+        _local_principals.delete(user_id)
+        await CacheService.delete_cache(self._cache_key(user_id=user_id))
+
+    @staticmethod
+    def clear_local() -> None:
+        """Clears the in-process tier."""
+        _local_principals.clear()
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable
+
+from src.auth.constants import (
+    REVOKED_TOKENS_CHANNEL,
+    REVOKED_TOKENS_FILTER_CAPACITY,
+    REVOKED_TOKENS_FILTER_ERROR_RATE,
+    REVOKED_TOKENS_RESYNC_DELAY,
+)
+from src.services.cache import redis_client
+from src.utils.bloom_filter import BloomFilter
+
+
+logger = logging.getLogger(__name__)
+
+
+DigestLoader = Callable[[], Awaitable[Iterable[str]]]
+
+
+class RevokedTokenFilter:
+    """
+    Per-worker Bloom filter of revoked token digests.
+
+    A negative answer is only trusted while the filter is `ready`, i.e. it was
+    loaded from the database and the worker is subscribed to revocations
+    published by the other workers. Otherwise every check falls through to the
+    authoritative lookup.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._added_during_rebuild: set[str] | None = None
+
+    def might_be_revoked(self, token_hash: str) -> bool:
+        """Returns False only when the token is definitely not revoked."""
+        return not self.ready or token_hash in self._bloom
+
+    def add_local(self, token_hash: str) -> None:
+        self._bloom.add(token_hash)
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.add(token_hash)
+
+    async def add(self, token_hash: str) -> None:
+        """Adds the digest locally and announces it to the other workers."""
+        self.add_local(token_hash=token_hash)
+        try:
+            await redis_client.publish(REVOKED_TOKENS_CHANNEL, token_hash)
+        except Exception as e:
+            logger.error(f'Failed to publish revoked token: {e}')
+
+    async def rebuild(self, load_digests: DigestLoader) -> None:
+        """
+        Rebuilds the filter from the database, e.g. after expired tokens were removed.
+
+        Digests added while the rebuild is running are carried over to the new filter.
+        """
+        self._added_during_rebuild = set()
+        try:
+            bloom = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+            for token_hash in await load_digests():
+                bloom.add(token_hash)
+            for token_hash in self._added_during_rebuild:
+                bloom.add(token_hash)
+
+            self._bloom = bloom
+            logger.info(f'Revoked token filter loaded with {bloom.count} digests.')
+        finally:
+            self._added_during_rebuild = None
+
+    async def run(self, load_digests: DigestLoader) -> None:
+        """
+        Keeps the filter synchronized with the other workers until cancelled.
+
+        Subscribes before loading so that no revocation published during the load
+        is missed, and drops back to authoritative lookups while disconnected.
+        """
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(REVOKED_TOKENS_CHANNEL)
+                await self.rebuild(load_digests=load_digests)
+                self.ready = True
+
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        self.add_local(token_hash=message['data'].decode())
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.error(f'Revoked token filter lost synchronization: {e}')
+
+            finally:
+                self.ready = False
+                await pubsub.aclose()
+
+            await asyncio.sleep(REVOKED_TOKENS_RESYNC_DELAY)
+
+    def reset(self) -> None:
+        """Empties the filter and marks it as not ready."""
+        self.ready = False
+        self._bloom = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+
+
+revoked_token_filter = RevokedTokenFilter(
+    capacity=REVOKED_TOKENS_FILTER_CAPACITY,
+    error_rate=REVOKED_TOKENS_FILTER_ERROR_RATE,
+)
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
+from uuid import uuid4
 
 from fastapi import Depends
 from jose import JWTError, jwt
@@ -9,6 +10,8 @@ from src.auth.exceptions import TokenError
 from src.auth.repositories.token_blacklist import TokenBlacklistRepository
 from src.auth.repositories.user import UserRepository
 from src.auth.schemas.auth_schemas import TokenBlacklistRequest, TokenRefreshResponse
+from src.auth.services.revoked_tokens import revoked_token_filter
+from src.auth.utils.security_utils import hash_token
 from src.settings import settings
 
 
@@ -27,7 +30,7 @@ class TokenService:
     @staticmethod
     def create_access_token(user_id: int, expires_delta: timedelta | None = None) -> str:
         """Creates a new access token."""
-        to_encode = {'sub': str(user_id)}
+        to_encode = {'sub': str(user_id), 'jti': uuid4().hex}
         expire = datetime.now(timezone.utc) + (
             expires_delta if expires_delta else timedelta(minutes=settings.access_token_expire)
         )
@@ -40,7 +43,7 @@ class TokenService:
     @staticmethod
     def create_refresh_token(user_id: int) -> str:
         """Creates a new refresh token."""
-        to_encode = {'sub': str(user_id)}
+        to_encode = {'sub': str(user_id), 'jti': uuid4().hex}
         expire = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire)
         to_encode.update({'exp': expire})
 
@@ -118,7 +121,9 @@ class TokenService:
             expiration = self.get_token_expiration(token=token)
 
             if expiration:
-                blacklist_entry = TokenBlacklistRequest(token=token, expires_at=expiration)
+                blacklist_entry = TokenBlacklistRequest(
+                    token_hash=hash_token(token=token), expires_at=expiration
+                )
                 await self.token_repository.add_token_to_blacklist(blacklist_entry=blacklist_entry)
             else:
                 logger.warning('Failed to get expiration for token')
@@ -129,8 +134,16 @@ class TokenService:
             raise TokenError()
 
     async def is_token_blacklisted(self, token: str) -> bool:
-        """Checks if the token is on the blacklist."""
-        return await self.token_repository.is_token_blacklisted(token=token)
+        """
+        Checks if the token is on the blacklist.
+
+        Only tokens the revoked token filter cannot rule out reach the database.
+        """
+        token_hash = hash_token(token=token)
+        if not revoked_token_filter.might_be_revoked(token_hash=token_hash):
+            return False
+
+        return await self.token_repository.is_token_blacklisted(token_hash=token_hash)
 
     async def refresh_token_and_blacklist(self, refresh_token: str) -> TokenRefreshResponse:
         """
@@ -157,7 +170,7 @@ class TokenService:
 
     async def _check_if_token_blacklisted(self, refresh_token: str) -> None:
         """Checks if the refresh token is on a blacklist."""
-        if await self.token_repository.is_token_blacklisted(token=refresh_token):
+        if await self.is_token_blacklisted(token=refresh_token):
             raise TokenError()
 
     def _generate_new_tokens(self, user) -> tuple[str, str]:
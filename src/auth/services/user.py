@@ -7,6 +7,7 @@ from src.auth.exceptions import GoogleOAuthError
 from src.auth.repositories.social_account import SocialAccountRepository
 from src.auth.repositories.user import UserRepository
 from src.auth.schemas.user_schemas import ExtendedUserResponse, SocialAccountResponse
+from src.auth.services.principal_cache import PrincipalCacheService
 
 
 logger = logging.getLogger(__name__)
@@ -17,11 +18,21 @@ class UserService:
         self,
         user_repository: Annotated[UserRepository, Depends(UserRepository)],
         social_repository: Annotated[SocialAccountRepository, Depends(SocialAccountRepository)],
+        principal_cache: Annotated[PrincipalCacheService, Depends(PrincipalCacheService)],
     ):
         self.user_repository = user_repository
         self.social_repository = social_repository
+        self.principal_cache = principal_cache
 
     async def get_user_by_id(self, user_id: int) -> ExtendedUserResponse:
+        """
+        Returns the user with linked social accounts, served from the principal
+        cache when possible so that cache hits make no database calls.
+        """
+        cached_user = await self.principal_cache.get_principal(user_id=user_id)
+        if cached_user is not None:
+            return cached_user
+
         user = await self.user_repository.get_user_by_id(user_id=user_id)
 
         if not user:
@@ -32,4 +43,6 @@ class UserService:
         )
 
         user_response = ExtendedUserResponse(**user.model_dump(), social_accounts=social_accounts)
+        await self.principal_cache.set_principal(principal=user_response)
+
         return user_response
@@ -26,9 +26,13 @@ async def generate_and_cache_state(cache_service: CacheService) -> str:
 
 async def verify_state(cache_service: CacheService, state: str) -> dict[str, str]:
     """Validate that the state matches."""
-    cached_state = await cache_service.get_cache(f'google_oauth_state_{state}')
+    cache_key = Template(GOOGLE_STATE_TEMPLATE).substitute(state=state)
+    cached_state = await cache_service.get_cache(cache_key)
     if cached_state is None or cached_state.get('state') != state:
         logger.error('Invalid state parameter. State received: %s', state)
         raise GoogleOAuthError()
 
+    # A state is used once
+    await cache_service.delete_cache(cache_key)
+
     return cached_state
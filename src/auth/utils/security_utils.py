@@ -1,3 +1,4 @@
+import hashlib
 import random
 import string
 
@@ -21,3 +22,10 @@ def decode_token(token: str, cypher: Fernet) -> str:
     Decodes the token using the provided cypher.
     """
     return cypher.decrypt(token.encode()).decode()
+
+
+def hash_token(token: str) -> str:
+    """
+    Returns a fixed-width SHA-256 hex digest of the token.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
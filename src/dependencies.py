@@ -1,10 +1,12 @@
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from fastapi import Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.pagination import PaginationParams
-from src.repositories.postgres_base import async_session
+from src.pagination import CursorParams, PaginationParams
+from src.repositories.postgres_base import async_session, replica_engines
+from src.repositories.session_router import SessionRouter
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -13,6 +15,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for creating short-lived sessions"""
+    return async_session
+
+
+@lru_cache
+def get_session_router() -> SessionRouter:
+    return SessionRouter(replicas=replica_engines)
+
+
 def get_pagination_params(
     offset: int = Query(0, ge=0, description='Offset for pagination (start from this index)'),
     limit: int = Query(
@@ -20,3 +32,12 @@ def get_pagination_params(
     ),
 ) -> PaginationParams:
     return PaginationParams(offset=offset, limit=limit)
+
+
+def get_cursor_params(
+    cursor: str | None = Query(None, description='Cursor returned with the previous page'),
+    limit: int = Query(
+        10, ge=1, le=100, description='Maximum number of entries per page (1 to 100)'
+    ),
+) -> CursorParams:
+    return CursorParams(cursor=cursor, limit=limit)
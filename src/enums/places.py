@@ -18,3 +18,9 @@ class PlannedPlaceStatus(str, Enum):
     ACTIVE = 'active'
     CANCELLED = 'cancelled'
     COMPLETED = 'completed'
+
+
+class EnrichmentStatus(str, Enum):
+    PENDING = 'pending'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
@@ -6,27 +7,54 @@ from src.auth.routers import google_auth, user
 from src.config.logging_config import setup_logging
 from src.middleware import setup_middleware
 from src.places.routers import places
+from src.routers import internal
+from src.services.http_clients import http_clients
 from src.utils.lifecycle_helpers import (
     check_redis_connection,
+    prepare_token_blacklist_partitions,
     setup_scheduler,
+    start_place_enrichment_workers,
+    start_revoked_token_filter,
+    stop_place_enrichment_workers,
 )
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):  # noqa F841
+async def lifespan(app: FastAPI):
     """Controls the application lifecycle."""
 
     # Setting up the scheduler
     scheduler = setup_scheduler()
 
+    # Opening the pooled HTTP clients of the upstream services
+    http_clients.open()
+    app.state.http_clients = http_clients
+
     # Checking connection to Redis
     await check_redis_connection()
 
+    # Creating the upcoming token blacklist partitions
+    await prepare_token_blacklist_partitions()
+
+    # Loading the revoked token filter and subscribing to revocations
+    revoked_token_filter_task = start_revoked_token_filter()
+
+    # Starting the place enrichment workers
+    start_place_enrichment_workers()
+
     try:
         yield
     finally:
         scheduler.shutdown(wait=False)
 
+        await stop_place_enrichment_workers()
+
+        revoked_token_filter_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await revoked_token_filter_task
+
+        await http_clients.aclose()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI app."""
@@ -40,6 +68,7 @@ def create_app() -> FastAPI:
     travel_app.include_router(google_auth.router, prefix=pre)
     travel_app.include_router(user.router, prefix=pre)
     travel_app.include_router(places.router, prefix=pre)
+    travel_app.include_router(internal.router, prefix=pre)
 
     return travel_app
 
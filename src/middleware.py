@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from src.services.cache import CacheService
 from src.settings import settings
 
 
@@ -22,6 +23,14 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return JSONResponse(status_code=500, content={'detail': 'Internal server error'})
 
 
+class CacheWriteBatchingMiddleware(BaseHTTPMiddleware):
+    """Sends all cache writes made while handling a request in one Redis pipeline."""
+
+    async def dispatch(self, request, call_next):
+        async with CacheService.batch_writes():
+            return await call_next(request)
+
+
 def setup_middleware(app):
     app.add_middleware(
         CORSMiddleware,
@@ -33,4 +42,5 @@ def setup_middleware(app):
 
     app.add_middleware(GZipMiddleware, minimum_size=1000)
     app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
+    app.add_middleware(CacheWriteBatchingMiddleware)
     app.add_middleware(ErrorHandlingMiddleware)
@@ -1,6 +1,8 @@
 from src.models.users import User
+from src.models.locations import Location
 from src.models.token_blacklist import TokenBlacklist
 from src.models.places import Place, PlannedPlace
 from src.models.social_account import SocialAccount
+from src.models.place_descriptions import PlaceDescription
 
-__all__ = ["User", "SocialAccount", "TokenBlacklist", "Place", "PlannedPlace"]
+__all__ = ["User", "SocialAccount", "TokenBlacklist", "Place", "PlannedPlace", "PlaceDescription", "Location"]
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.repositories.postgres_base import Base
+
+
+class Location(Base):
+    """A validated location, identified by its canonical (folded) city and country."""
+
+    __tablename__ = 'locations'
+    __table_args__ = (UniqueConstraint('city', 'country'),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    city: Mapped[str]
+    country: Mapped[str]
+    latitude: Mapped[float | None]
+    longitude: Mapped[float | None]
+    provider_payload: Mapped[dict | None] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.repositories.postgres_base import Base
+
+
+class PlaceDescription(Base):
+    __tablename__ = 'place_descriptions'
+    __table_args__ = (UniqueConstraint('place_name', 'city', 'country'),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    place_name: Mapped[str]
+    city: Mapped[str]
+    country: Mapped[str]
+    description: Mapped[str]
+    photo_url: Mapped[str]
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
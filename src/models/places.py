@@ -1,10 +1,10 @@
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.enums.places import PlaceRating, PlaceType, PlannedPlaceStatus
+from src.enums.places import EnrichmentStatus, PlaceRating, PlaceType, PlannedPlaceStatus
 from src.repositories.postgres_base import Base
 
 
@@ -14,8 +14,29 @@ if TYPE_CHECKING:
 
 class Place(Base):
     __tablename__ = 'places'
+    __table_args__ = (
+        # Identity of a place, new places conflicting with it are not inserted; NULLS NOT
+        # DISTINCT needs PostgreSQL 15
+        Index(
+            'uq_places_user_id_details',
+            'user_id',
+            'place_name',
+            'city',
+            'place_type',
+            'visit_date',
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index('ix_places_user_id_place_type', 'user_id', 'place_type'),
+        Index('ix_places_user_id_location_id', 'user_id', 'location_id'),
+        Index('ix_places_user_id_geohash', 'user_id', 'geohash'),
+        # Keyset pagination seeks by (sort key, id) within the places of a user
+        Index('ix_places_user_id_id', 'user_id', 'id'),
+        Index('ix_places_user_id_rating_id', 'user_id', 'rating', 'id'),
+        Index('ix_places_user_id_visit_date_id', 'user_id', 'visit_date', 'id'),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     place_name: Mapped[str]
     city: Mapped[str | None]
     country: Mapped[str | None]
@@ -26,6 +47,15 @@ class Place(Base):
     visit_date: Mapped[datetime.date | None]
     place_type: Mapped[PlaceType] = mapped_column(Enum(PlaceType))
     user_id: Mapped[int] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'))
+    location_id: Mapped[int | None] = mapped_column(
+        ForeignKey('locations.id', ondelete='SET NULL'), index=True
+    )
+    latitude: Mapped[float | None]
+    longitude: Mapped[float | None]
+    geohash: Mapped[str | None] = mapped_column(String(12))
+    enrichment_status: Mapped[EnrichmentStatus] = mapped_column(
+        Enum(EnrichmentStatus), default=EnrichmentStatus.COMPLETED, nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -44,8 +74,10 @@ class Place(Base):
 
 class PlannedPlace(Base):
     __tablename__ = 'planned_places'
+    # Also serves the lookups of the planned places of a user
+    __table_args__ = (Index('ix_planned_places_user_id_geohash', 'user_id', 'geohash'),)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     place_name: Mapped[str]
     city: Mapped[str | None]
     country: Mapped[str | None]
@@ -54,6 +86,12 @@ class PlannedPlace(Base):
     planned_visit_date: Mapped[datetime.date | None]
     planned_days_spent: Mapped[int]
     user_id: Mapped[int] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'))
+    location_id: Mapped[int | None] = mapped_column(
+        ForeignKey('locations.id', ondelete='SET NULL'), index=True
+    )
+    latitude: Mapped[float | None]
+    longitude: Mapped[float | None]
+    geohash: Mapped[str | None] = mapped_column(String(12))
     planned_status: Mapped[PlannedPlaceStatus] = mapped_column(
         Enum(PlannedPlaceStatus), default=PlannedPlaceStatus.ACTIVE, nullable=False
     )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, func
+from sqlalchemy import DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.repositories.postgres_base import Base
@@ -8,10 +8,10 @@ from src.repositories.postgres_base import Base
 
 class TokenBlacklist(Base):
     __tablename__ = 'token_blacklist'
+    __table_args__ = {'postgresql_partition_by': 'RANGE (expires_at)'}
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(index=True)
+    token_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     blacklisted_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
-    expires_at: Mapped[datetime]
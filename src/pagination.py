@@ -1,6 +1,49 @@
+import base64
+import json
+from typing import Any, Generic, TypeVar
+
 from pydantic import BaseModel, Field
 
 
+T = TypeVar('T')
+
+
 class PaginationParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(10, ge=1, le=100)
+
+
+class CursorParams(BaseModel):
+    cursor: str | None = None
+    limit: int = Field(10, ge=1, le=100)
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """A page of items with the cursor of the next page, if there is one."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Encodes the position after the last item of a page as an opaque token."""
+    data = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decodes a token of `encode_cursor`.
+
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Malformed cursor') from e
+
+    if not isinstance(values, dict):
+        raise ValueError('Malformed cursor')
+
+    return values
@@ -1,3 +1,142 @@
 OPEN_CAGE_API_URL = 'https://api.opencagedata.com/geocode/v1/json'
 
 PLACES_CACHE_KEY = 'geo_${city}_${country}'
+
+LOCATION_COMPONENT_KEYS = ('city', 'country')
+
+LOCATION_GEOMETRY_KEYS = ('lat', 'lng')
+
+GEOHASH_PRECISION = 9
+
+GEOHASH_MAX_COVERING_CELLS = 16
+
+KM_PER_DEGREE = 111.32
+
+NEARBY_MAX_RADIUS_KM = 500
+
+# Response models built for the `fields` chosen by clients
+PLACE_FIELDSETS_CACHE_SIZE = 64
+
+PLACE_CLUSTERS_MAX_ZOOM = 22
+
+# Map zoom levels per geohash character, a character divides the cell size by 4 to 8
+PLACE_CLUSTERS_ZOOM_PER_PRECISION = 2.5
+
+PLACE_CLUSTERS_MAX_TILES = 16
+
+PLACE_CLUSTERS_VERSION_KEY = 'place_clusters_version_${user_id}'
+
+PLACE_CLUSTERS_TILE_KEY = 'place_clusters_tile_${user_id}_${version}_${tile}_${precision}'
+
+# Aliases of folded (lowercase, without diacritics) country names mapped to
+# the folded GeoNames name; ISO codes of other countries come from the gazetteer
+COUNTRY_ALIASES = {
+    'us': 'united states',
+    'usa': 'united states',
+    'united states of america': 'united states',
+    'america': 'united states',
+    'uk': 'united kingdom',
+    'gb': 'united kingdom',
+    'gbr': 'united kingdom',
+    'great britain': 'united kingdom',
+    'ua': 'ukraine',
+    'ukr': 'ukraine',
+    'de': 'germany',
+    'deu': 'germany',
+    'deutschland': 'germany',
+    'fr': 'france',
+    'fra': 'france',
+    'es': 'spain',
+    'esp': 'spain',
+    'espana': 'spain',
+    'it': 'italy',
+    'ita': 'italy',
+    'italia': 'italy',
+    'pl': 'poland',
+    'pol': 'poland',
+    'polska': 'poland',
+    'cz': 'czechia',
+    'cze': 'czechia',
+    'czech republic': 'czechia',
+    'nl': 'netherlands',
+    'nld': 'netherlands',
+    'holland': 'netherlands',
+    'the netherlands': 'netherlands',
+    'ru': 'russia',
+    'rus': 'russia',
+    'russian federation': 'russia',
+    'kr': 'south korea',
+    'kor': 'south korea',
+    'korea': 'south korea',
+    'republic of korea': 'south korea',
+    'ae': 'united arab emirates',
+    'uae': 'united arab emirates',
+    'cn': 'china',
+    'chn': 'china',
+    'jp': 'japan',
+    'jpn': 'japan',
+    'tr': 'turkey',
+    'tur': 'turkey',
+    'turkiye': 'turkey',
+}
+
+# Exonyms and former names of cities mapped to one folded name
+CITY_ALIASES = {
+    'kiev': 'kyiv',
+    'lvov': 'lviv',
+    'odessa': 'odesa',
+    'kharkov': 'kharkiv',
+    'dnepropetrovsk': 'dnipro',
+    'nikolaev': 'mykolaiv',
+    'zaporozhye': 'zaporizhzhia',
+    'bombay': 'mumbai',
+    'calcutta': 'kolkata',
+    'madras': 'chennai',
+    'peking': 'beijing',
+    'saigon': 'ho chi minh city',
+    'rangoon': 'yangon',
+    'new york city': 'new york',
+    'nyc': 'new york',
+    'munchen': 'munich',
+    'koln': 'cologne',
+    'wien': 'vienna',
+    'praha': 'prague',
+    'warszawa': 'warsaw',
+    'roma': 'rome',
+    'firenze': 'florence',
+    'venezia': 'venice',
+    'napoli': 'naples',
+    'lisboa': 'lisbon',
+}
+
+PLACE_ENRICHMENT_STREAM = 'place_enrichment'
+
+PLACE_ENRICHMENT_DEAD_LETTER_STREAM = 'place_enrichment_dead'
+
+PLACE_ENRICHMENT_GROUP = 'place_enrichment_workers'
+
+PLACE_ENRICHMENT_STREAM_MAXLEN = 100_000
+
+PLACE_ENRICHMENT_WORKERS = 4
+
+PLACE_ENRICHMENT_MAX_ATTEMPTS = 3
+
+PLACE_ENRICHMENT_RETRY_DELAY = 2
+
+PLACE_ENRICHMENT_BLOCK_MS = 5000
+
+PLACE_ENRICHMENT_CLAIM_IDLE_MS = 300_000
+
+PLACE_ENRICHMENT_ERROR_DELAY = 5
+
+PLACE_ENRICHMENT_REQUEUE_AFTER_MINUTES = 15
+
+PLACE_DESCRIPTION_CACHE_KEY = 'place_description_${key}'
+
+PLACE_DESCRIPTION_CACHE_TTL = 7 * 24 * 3600
+
+PLACE_DESCRIPTION_LOCAL_CACHE_SIZE = 1024
+
+PLACE_DESCRIPTION_LOCAL_CACHE_TTL = 3600
+
+PLACE_DESCRIPTION_PREGENERATE_LIMIT = 50
@@ -0,0 +1,90 @@
+import logging
+from functools import lru_cache
+from typing import Annotated, AsyncGenerator
+
+from fastapi import Depends, Request
+from httpx import AsyncClient
+from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.current_user import get_current_user
+from src.auth.schemas.user_schemas import UserBase
+from src.dependencies import get_db, get_session_router
+from src.places.gazetteer.index import GazetteerIndex
+from src.places.schemas.openai import PlaceDetailResponse
+from src.repositories.session_router import SessionRouter
+from src.services.http_clients import OPENAI_CLIENT, OPENCAGE_CLIENT, http_clients
+from src.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Requests that only read; the others use the primary for their reads as well
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+
+def get_opencage_client() -> AsyncClient:
+    """Returns the pooled client used for OpenCage geocoding requests."""
+    return http_clients.get(OPENCAGE_CLIENT)
+
+
+@lru_cache
+def get_description_agent() -> Agent:
+    """
+    Returns the worker-wide Agent used to interact with OpenAI, created on first use.
+    """
+    model = OpenAIModel(
+        model_name=settings.pydantic_ai_model,
+        api_key=settings.openai_api_key,
+        http_client=http_clients.get(OPENAI_CLIENT),
+    )
+    return Agent(
+        model=model,
+        result_type=PlaceDetailResponse,
+        system_prompt='You are a helpful assistant.',
+    )
+
+
+@lru_cache
+def get_gazetteer() -> GazetteerIndex | None:
+    """
+    Returns the worker-wide gazetteer index, or None if it is not configured or
+    cannot be opened, in which case locations are only validated by OpenCage.
+    """
+    if not settings.gazetteer_index_path:
+        return None
+
+    try:
+        return GazetteerIndex(settings.gazetteer_index_path)
+    except (OSError, ValueError) as e:
+        logger.error(f'Failed to open the gazetteer index: {e}')
+        return None
+
+
+async def get_read_db(
+    request: Request,
+    db_session: Annotated[AsyncSession, Depends(get_db)],
+    session_router: Annotated[SessionRouter, Depends(get_session_router)],
+    current_user: Annotated[UserBase, Depends(get_current_user)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting async session for the read-only queries of places.
+
+    Reads of the authenticated user go to a read replica unless they wrote
+    recently; requests that write read from the primary without that lookup.
+    """
+    session_factory = None
+    if (
+        session_router.has_replicas
+        and request.method in READ_ONLY_METHODS
+        and not await SessionRouter.reads_from_primary(user_id=current_user.id)
+    ):
+        session_factory = session_router.replica_session_factory()
+
+    if session_factory is None:
+        yield db_session
+        return
+
+    async with session_factory() as session:
+        yield session
@@ -39,6 +39,14 @@ class PlaceAlreadyExistsError(PlaceError):
         super().__init__(self.message)
 
 
+class InvalidCursorError(PlaceError):
+    """Exception raised when a pagination cursor is malformed or does not match the query."""
+
+    def __init__(self, message: str = 'Invalid pagination cursor.'):
+        self.message = message
+        super().__init__(self.message)
+
+
 class GeoServiceError(Exception):
     """Exception raised when there is a geo service error."""
 
@@ -0,0 +1,179 @@
+"""
+Builds the gazetteer index from GeoNames dumps.
+
+    python -m src.places.gazetteer.build \
+        --cities cities15000.txt --countries countryInfo.txt --output gazetteer.idx
+
+The dumps are available at https://download.geonames.org/export/dump/.
+"""
+
+import argparse
+import logging
+from typing import Iterator
+
+from src.places.gazetteer.index import (
+    HEADER,
+    INDEX_MAGIC,
+    INDEX_VERSION,
+    RECORD,
+    SEPARATOR,
+    VALUE_LENGTH,
+    city_key,
+    hash_key,
+    normalize_name,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Columns of the GeoNames geoname table
+NAME_COLUMN = 1
+ASCII_NAME_COLUMN = 2
+ALTERNATE_NAMES_COLUMN = 3
+LATITUDE_COLUMN = 4
+LONGITUDE_COLUMN = 5
+FEATURE_CLASS_COLUMN = 6
+COUNTRY_CODE_COLUMN = 8
+POPULATION_COLUMN = 14
+
+# Columns of the GeoNames countryInfo table
+ISO_COLUMN = 0
+ISO3_COLUMN = 1
+COUNTRY_NAME_COLUMN = 4
+
+POPULATED_PLACE_FEATURE_CLASS = 'P'
+
+# Ranks of the names of a city; on conflicts the higher rank wins, then the larger city
+PRIMARY_NAME_RANK = 2
+ASCII_NAME_RANK = 1
+ALTERNATE_NAME_RANK = 0
+
+
+def _read_rows(path: str) -> Iterator[list[str]]:
+    with open(path, encoding='utf-8') as dump:
+        for line in dump:
+            if not line.strip() or line.startswith('#'):
+                continue
+            yield line.rstrip('\n').split('\t')
+
+
+def read_countries(path: str) -> dict[str, tuple[str, str]]:
+    """Reads the country names and ISO codes, keyed by the normalized name or code."""
+    countries = {}
+    for row in _read_rows(path):
+        code, name = row[ISO_COLUMN].upper(), row[COUNTRY_NAME_COLUMN]
+        for key in (name, code, row[ISO3_COLUMN]):
+            if key:
+                countries[normalize_name(key)] = (code, name)
+
+    return countries
+
+
+def read_cities(path: str, country_codes: set[str], min_population: int = 0) -> dict[str, str]:
+    """
+    Reads the canonical names and coordinates of the populated places, keyed by
+    every name of the city with and without its country code; without it, the
+    largest city with a name wins.
+    """
+    cities: dict[str, tuple[tuple[int, int], str]] = {}
+    for row in _read_rows(path):
+        country_code = row[COUNTRY_CODE_COLUMN].upper()
+        population = int(row[POPULATION_COLUMN] or 0)
+        if (
+            row[FEATURE_CLASS_COLUMN] != POPULATED_PLACE_FEATURE_CLASS
+            or country_code not in country_codes
+            or population < min_population
+        ):
+            continue
+
+        name = row[NAME_COLUMN]
+        value = SEPARATOR.join((name, row[LATITUDE_COLUMN], row[LONGITUDE_COLUMN]))
+        names = [(name, PRIMARY_NAME_RANK), (row[ASCII_NAME_COLUMN], ASCII_NAME_RANK)]
+        names += [
+            (alternate_name, ALTERNATE_NAME_RANK)
+            for alternate_name in row[ALTERNATE_NAMES_COLUMN].split(',')
+        ]
+
+        for city_name, rank in names:
+            if not city_name:
+                continue
+            priority = (rank, population)
+            # Names are also keyed without a country to canonicalize a city on its own
+            for key in (city_key(city_name, country_code), city_key(city_name, '')):
+                if key not in cities or cities[key][0] < priority:
+                    cities[key] = (priority, value)
+
+    return {key: value for key, (_, value) in cities.items()}
+
+
+def _hash_entries(entries: dict[str, str]) -> list[tuple[int, str]]:
+    records = {}
+    for key, value in entries.items():
+        key_hash = hash_key(key)
+        if key_hash in records and records[key_hash] != value:
+            logger.warning(f'Skipping "{key}", its hash collides with another key.')
+            continue
+        records[key_hash] = value
+
+    return sorted(records.items())
+
+
+def write_index(path: str, cities: dict[str, str], countries: dict[str, str]) -> None:
+    """Writes the hashed, sorted tables followed by the deduplicated string table."""
+    tables = [_hash_entries(cities), _hash_entries(countries)]
+    strings_offset = HEADER.size + sum(len(table) for table in tables) * RECORD.size
+    strings = bytearray()
+    string_offsets: dict[str, int] = {}
+
+    with open(path, 'wb') as index_file:
+        index_file.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, *map(len, tables)))
+        for table in tables:
+            for key_hash, value in table:
+                if value not in string_offsets:
+                    encoded_value = value.encode()
+                    string_offsets[value] = strings_offset + len(strings)
+                    strings += VALUE_LENGTH.pack(len(encoded_value)) + encoded_value
+
+                index_file.write(RECORD.pack(key_hash, string_offsets[value]))
+        index_file.write(strings)
+
+
+def build_index(
+    cities_path: str, countries_path: str, output_path: str, min_population: int = 0
+) -> tuple[int, int]:
+    """Builds the index file and returns the number of city and country keys."""
+    countries = read_countries(countries_path)
+    cities = read_cities(
+        cities_path,
+        country_codes={code for code, _ in countries.values()},
+        min_population=min_population,
+    )
+    write_index(
+        output_path,
+        cities=cities,
+        countries={key: f'{code}{SEPARATOR}{name}' for key, (code, name) in countries.items()},
+    )
+
+    return len(cities), len(countries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Build the gazetteer index from GeoNames dumps.')
+    parser.add_argument('--cities', required=True, help='GeoNames cities dump')
+    parser.add_argument('--countries', required=True, help='GeoNames countryInfo.txt')
+    parser.add_argument('--output', required=True, help='Path of the index file to write')
+    parser.add_argument('--min-population', type=int, default=0)
+    args = parser.parse_args()
+
+    city_count, country_count = build_index(
+        cities_path=args.cities,
+        countries_path=args.countries,
+        output_path=args.output,
+        min_population=args.min_population,
+    )
+    print(f'Indexed {city_count} city names and {country_count} country names.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import hashlib
+import mmap
+import struct
+from typing import NamedTuple
+
+
+# Header: magic, version, city count, country count
+HEADER = struct.Struct('<8sIII')
+# Record: key hash, offset of the value in the string table
+RECORD = struct.Struct('<QI')
+# Length prefix of the values in the string table
+VALUE_LENGTH = struct.Struct('<H')
+
+INDEX_MAGIC = b'GAZETTER'
+INDEX_VERSION = 2
+
+# Separates the parts of keys and values
+SEPARATOR = '\x1f'
+
+
+class GazetteerLocation(NamedTuple):
+    city: str
+    country: str
+    latitude: float
+    longitude: float
+
+
+def normalize_name(name: str) -> str:
+    """Normalizes a name into the case and whitespace insensitive form used in keys."""
+    return ' '.join(name.split()).casefold()
+
+
+def city_key(city: str, country_code: str) -> str:
+    return f'{normalize_name(city)}{SEPARATOR}{country_code.upper()}'
+
+
+def hash_key(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+
+
+class GazetteerIndex:
+    """
+    Read-only, memory-mapped index of city and country names built by
+    `src.places.gazetteer.build`.
+
+    The file holds two tables of fixed-size (hash, value offset) records sorted by
+    hash, followed by a string table of canonical names. Lookups binary search
+    the mapped file, so the index is shared by all workers through the page cache
+    and nothing is loaded into the process heap. The values of cities hold their
+    GeoNames coordinates after the canonical name.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.city_count, self.country_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._mmap.close()
+            raise ValueError(f'{path} is not a gazetteer index of version {INDEX_VERSION}')
+
+        self._cities_offset = HEADER.size
+        self._countries_offset = self._cities_offset + self.city_count * RECORD.size
+
+    def find_country(self, country: str) -> tuple[str, str] | None:
+        """Returns the ISO code and canonical name of a country name or ISO code."""
+        value = self._find(
+            hash_key(normalize_name(country)), self._countries_offset, self.country_count
+        )
+        if value is None:
+            return None
+
+        code, name = value.split(SEPARATOR, 1)
+        return code, name
+
+    def find_city(self, city: str, country_code: str) -> str | None:
+        """
+        Returns the canonical name of a city (or one of its alternate names) in a
+        country, or of the largest city with the name if the country code is empty.
+        """
+        city_record = self._find_city_record(city, country_code)
+
+        return city_record[0] if city_record else None
+
+    def resolve(self, city: str, country: str) -> GazetteerLocation | None:
+        """
+        Returns the canonical city and country names and the coordinates of the
+        city, or None if the location is unknown.
+        """
+        country_match = self.find_country(country)
+        if country_match is None:
+            return None
+
+        country_code, country_name = country_match
+        city_record = self._find_city_record(city, country_code)
+        if city_record is None:
+            return None
+
+        city_name, latitude, longitude = city_record
+        return GazetteerLocation(
+            city=city_name, country=country_name, latitude=latitude, longitude=longitude
+        )
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _find_city_record(self, city: str, country_code: str) -> tuple[str, float, float] | None:
+        value = self._find(
+            hash_key(city_key(city, country_code)), self._cities_offset, self.city_count
+        )
+        if value is None:
+            return None
+
+        name, latitude, longitude = value.split(SEPARATOR)
+        return name, float(latitude), float(longitude)
+
+    def _find(self, key_hash: int, table_offset: int, count: int) -> str | None:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            record_hash, value_offset = RECORD.unpack_from(
+                self._mmap, table_offset + middle * RECORD.size
+            )
+            if record_hash < key_hash:
+                low = middle + 1
+            elif record_hash > key_hash:
+                high = middle
+            else:
+                return self._read_value(value_offset)
+
+        return None
+
+    def _read_value(self, offset: int) -> str:
+        (length,) = VALUE_LENGTH.unpack_from(self._mmap, offset)
+        start = offset + VALUE_LENGTH.size
+
+        return self._mmap[start : start + length].decode()
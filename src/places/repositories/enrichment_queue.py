@@ -0,0 +1,111 @@
+import logging
+
+from redis.exceptions import ResponseError
+
+from src.places.constants import (
+    PLACE_ENRICHMENT_BLOCK_MS,
+    PLACE_ENRICHMENT_CLAIM_IDLE_MS,
+    PLACE_ENRICHMENT_DEAD_LETTER_STREAM,
+    PLACE_ENRICHMENT_GROUP,
+    PLACE_ENRICHMENT_STREAM,
+    PLACE_ENRICHMENT_STREAM_MAXLEN,
+)
+from src.places.schemas.enrichment import PlaceEnrichmentJob
+from src.services.cache import redis_client
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlaceEnrichmentQueue:
+    """
+    Durable queue of place enrichment jobs backed by a Redis stream.
+
+    Jobs stay pending in the consumer group until they are acknowledged, so jobs
+    of a worker that died are claimed again by the others after an idle timeout.
+    """
+
+    async def enqueue(self, job: PlaceEnrichmentJob) -> bool:
+        """Adds the job to the stream and returns whether it was accepted."""
+        try:
+            await redis_client.xadd(
+                PLACE_ENRICHMENT_STREAM,
+                job.model_dump(mode='json'),
+                maxlen=PLACE_ENRICHMENT_STREAM_MAXLEN,
+                approximate=True,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f'Failed to enqueue enrichment of place {job.place_id}: {e}')
+            return False
+
+    @staticmethod
+    async def ensure_group() -> None:
+        """Creates the stream and its consumer group if they do not exist yet."""
+        try:
+            await redis_client.xgroup_create(
+                PLACE_ENRICHMENT_STREAM, PLACE_ENRICHMENT_GROUP, id='0', mkstream=True
+            )
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    async def read(self, consumer: str, count: int = 1) -> list[tuple[str, PlaceEnrichmentJob]]:
+        """Blocks until new jobs are delivered to the consumer."""
+        response = await redis_client.xreadgroup(
+            PLACE_ENRICHMENT_GROUP,
+            consumer,
+            {PLACE_ENRICHMENT_STREAM: '>'},
+            count=count,
+            block=PLACE_ENRICHMENT_BLOCK_MS,
+        )
+        if not response:
+            return []
+
+        _, messages = response[0]
+
+        return self._parse_messages(messages)
+
+    async def claim_stale(
+        self, consumer: str, count: int = 1
+    ) -> list[tuple[str, PlaceEnrichmentJob]]:
+        """Takes over jobs that another consumer left unacknowledged for too long."""
+        response = await redis_client.xautoclaim(
+            PLACE_ENRICHMENT_STREAM,
+            PLACE_ENRICHMENT_GROUP,
+            consumer,
+            min_idle_time=PLACE_ENRICHMENT_CLAIM_IDLE_MS,
+            count=count,
+        )
+
+        return self._parse_messages(response[1])
+
+    @staticmethod
+    async def ack(message_id: str) -> None:
+        await redis_client.xack(PLACE_ENRICHMENT_STREAM, PLACE_ENRICHMENT_GROUP, message_id)
+
+    @staticmethod
+    async def dead_letter(job: PlaceEnrichmentJob, error: str) -> None:
+        """Moves a job that exhausted its retries to the dead letter stream."""
+        await redis_client.xadd(
+            PLACE_ENRICHMENT_DEAD_LETTER_STREAM,
+            {**job.model_dump(mode='json'), 'error': error},
+            maxlen=PLACE_ENRICHMENT_STREAM_MAXLEN,
+            approximate=True,
+        )
+
+    @staticmethod
+    def _parse_messages(messages: list) -> list[tuple[str, PlaceEnrichmentJob]]:
+        jobs = []
+        for message_id, fields in messages:
+            # Entries trimmed from the stream are returned without fields
+            if not fields:
+                continue
+
+            job = PlaceEnrichmentJob(
+                **{key.decode(): value.decode() for key, value in fields.items()}
+            )
+            jobs.append((message_id.decode(), job))
+
+        return jobs
@@ -1,8 +1,11 @@
 import logging
+from typing import Annotated
 
 import httpx
+from fastapi import Depends
 
 from src.places.constants import OPEN_CAGE_API_URL
+from src.places.dependencies import get_opencage_client
 from src.places.exceptions import GeoServiceError
 from src.settings import settings
 
@@ -11,8 +14,10 @@ logger = logging.getLogger(__name__)
 
 
 class GeoRepository:
-    @staticmethod
-    async def get_location_data(city: str, country: str) -> dict:
+    def __init__(self, client: Annotated[httpx.AsyncClient, Depends(get_opencage_client)]):
+        self.client = client
+
+    async def get_location_data(self, city: str, country: str) -> dict:
         """
         Checks whether the location specified by the city and country exists
         using OpenCage API.
@@ -20,8 +25,7 @@ class GeoRepository:
         params = {'q': f'{city}, {country}', 'key': settings.geo_name_data}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(OPEN_CAGE_API_URL, params=params)
+            response = await self.client.get(OPEN_CAGE_API_URL, params=params)
             response.raise_for_status()
             data = response.json()
             results = data.get('results', [])
@@ -0,0 +1,107 @@
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dependencies import get_db
+from src.models import Location, Place, PlannedPlace
+from src.places.exceptions import PlaceError
+from src.places.utils.geohash import encode_geohash
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocationRepository:
+    def __init__(self, db_session: Annotated[AsyncSession, Depends(get_db)]):
+        self.db_session = db_session
+
+    async def get_location(self, city: str, country: str) -> Location | None:
+        """
+        Retrieves a validated location by its canonical city and country.
+        """
+        try:
+            stmt = select(Location).where(Location.city == city, Location.country == country)
+            result = await self.db_session.execute(stmt)
+
+            return result.scalar_one_or_none()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to get location {city}, {country}: {str(e)}')
+            raise PlaceError()
+
+    async def create_location(
+        self, city: str, country: str, location_data: dict | None = None
+    ) -> Location:
+        """
+        Stores a validated location and returns it; if the location was stored
+        concurrently, the existing row is returned.
+        """
+        location_data = location_data or {}
+        geometry = location_data.get('geometry', {})
+
+        try:
+            location = Location(
+                city=city,
+                country=country,
+                latitude=geometry.get('lat'),
+                longitude=geometry.get('lng'),
+                provider_payload=location_data or None,
+            )
+            self.db_session.add(location)
+            await self.db_session.commit()
+
+            return location
+
+        except IntegrityError:
+            await self.db_session.rollback()
+            return await self.get_location(city=city, country=country)
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to create location {city}, {country}: {str(e)}')
+            raise PlaceError()
+
+    async def add_coordinates(self, location: Location, location_data: dict) -> set[int]:
+        """
+        Stores the coordinates of a location stored without them and copies them to
+        its places, so that the spatial queries find them; returns the IDs of the
+        users owning the places.
+        """
+        latitude, longitude = location_data['geometry']['lat'], location_data['geometry']['lng']
+        coordinates = {
+            'latitude': latitude,
+            'longitude': longitude,
+            'geohash': encode_geohash(latitude=latitude, longitude=longitude),
+        }
+
+        try:
+            await self.db_session.execute(
+                update(Location)
+                .where(Location.id == location.id)
+                .values(latitude=latitude, longitude=longitude, provider_payload=location_data)
+            )
+            user_ids = set()
+            for model in (Place, PlannedPlace):
+                result = await self.db_session.execute(
+                    update(model)
+                    .where(model.location_id == location.id)
+                    .values(**coordinates)
+                    .returning(model.user_id)
+                )
+                user_ids.update(result.scalars())
+            await self.db_session.commit()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to add coordinates to location {location.id}: {str(e)}')
+            raise PlaceError()
+
+        location.latitude, location.longitude = latitude, longitude
+        location.provider_payload = location_data
+
+        return user_ids
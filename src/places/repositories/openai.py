@@ -1,34 +1,23 @@
 import logging
 
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
 
+from src.places.dependencies import get_description_agent
 from src.places.exceptions import OpenAIError
 from src.places.schemas.openai import PlaceDetailResponse
-from src.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
 
 class DescriptionOpenAIRepository:
-    def __init__(self):
-        self.agent = self._create_agent()
-
-    @staticmethod
-    def _create_agent() -> Agent:
+    @property
+    def agent(self) -> Agent:
         """
-        Creates and returns an Agent object to interact with OpenAI.
+        The shared agent is only built when a description is actually requested,
+        so resolving this repository costs nothing on read paths.
         """
-        model = OpenAIModel(
-            model_name=settings.pydantic_ai_model,
-            api_key=settings.openai_api_key,
-        )
-        return Agent(
-            model=model,
-            result_type=PlaceDetailResponse,
-            system_prompt='You are a helpful assistant.',
-        )
+        return get_description_agent()
 
     async def get_place_detail(self, prompt: str) -> PlaceDetailResponse:
         """
@@ -37,7 +26,6 @@ class DescriptionOpenAIRepository:
         """
         try:
             response = await self.agent.run(user_prompt=prompt)
-            print(response)
             return PlaceDetailResponse(
                 description=response.data.description, photo_url=response.data.photo_url
             )
@@ -0,0 +1,110 @@
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import ColumnElement, and_, func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.dependencies import get_db
+from src.models import Place, PlaceDescription
+from src.places.exceptions import PlaceError
+from src.places.schemas.openai import PlaceDetailResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlaceDescriptionRepository:
+    def __init__(self, db_session: Annotated[AsyncSession, Depends(get_db)]):
+        self.db_session = db_session
+
+    async def get_description(
+        self, place_name: str, city: str, country: str
+    ) -> PlaceDetailResponse | None:
+        """
+        Retrieves the stored description of a place by its normalized key.
+        """
+        try:
+            stmt = select(PlaceDescription.description, PlaceDescription.photo_url).where(
+                PlaceDescription.place_name == place_name,
+                PlaceDescription.city == city,
+                PlaceDescription.country == country,
+            )
+            result = await self.db_session.execute(stmt)
+            row = result.first()
+
+            return PlaceDetailResponse(description=row[0], photo_url=row[1]) if row else None
+
+        except SQLAlchemyError as e:
+            logger.error(f'Failed to get description of {place_name}, {city}: {str(e)}')
+            raise PlaceError()
+
+    async def save_description(
+        self, place_name: str, city: str, country: str, place_detail: PlaceDetailResponse
+    ) -> None:
+        """
+        Stores the description of a place; a description stored concurrently wins.
+        """
+        try:
+            self.db_session.add(
+                PlaceDescription(
+                    place_name=place_name,
+                    city=city,
+                    country=country,
+                    **place_detail.model_dump(),
+                )
+            )
+            await self.db_session.commit()
+
+        except IntegrityError:
+            await self.db_session.rollback()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to save description of {place_name}, {city}: {str(e)}')
+            raise PlaceError()
+
+    async def get_popular_undescribed_places(self, limit: int) -> list[tuple[str, str, str]]:
+        """
+        Retrieves the normalized keys of the places added most often that do not
+        have a stored description yet.
+        """
+        try:
+            place_name = _normalized_key_part(Place.place_name)
+            city = _normalized_key_part(Place.city)
+            country = _normalized_key_part(Place.country)
+
+            stmt = (
+                select(place_name, city, country)
+                .outerjoin(
+                    PlaceDescription,
+                    and_(
+                        PlaceDescription.place_name == place_name,
+                        PlaceDescription.city == city,
+                        PlaceDescription.country == country,
+                    ),
+                )
+                .where(
+                    PlaceDescription.id.is_(None),
+                    Place.city.is_not(None),
+                    Place.country.is_not(None),
+                )
+                .group_by(place_name, city, country)
+                .having(func.count() > 1)
+                .order_by(func.count().desc())
+                .limit(limit)
+            )
+            result = await self.db_session.execute(stmt)
+
+            return [tuple(row) for row in result]
+
+        except SQLAlchemyError as e:
+            logger.error(f'Failed to get popular places without description: {str(e)}')
+            raise PlaceError()
+
+
+def _normalized_key_part(column: InstrumentedAttribute) -> ColumnElement[str]:
+    """The SQL counterpart of `normalize_place_key` for one part of the key."""
+    return func.lower(func.trim(func.regexp_replace(column, r'\s+', ' ', 'g')))
@@ -1,150 +1,498 @@
 import logging
-from datetime import date
-from typing import Annotated
+import math
+from datetime import datetime
+from typing import Annotated, Any
 
 from fastapi import Depends
-from sqlalchemy import delete, select, update
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    case,
+    delete,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from src.dependencies import get_db
-from src.models import Place
-from src.places.exceptions import PlaceError
+from src.enums.places import EnrichmentStatus
+from src.models import Location, Place
+from src.places.constants import KM_PER_DEGREE
+from src.places.dependencies import get_read_db
+from src.places.exceptions import PlaceAlreadyExistsError, PlaceError
 from src.places.schemas.filters import PlaceFilter
+from src.places.schemas.geo import PlaceClusterResponse
 from src.places.schemas.openai import PlaceDetailResponse
-from src.places.schemas.places import PlaceCreationRequest, PlaceUpdateRequest
+from src.places.schemas.places import PLACE_RESPONSE_FIELDS, PlaceCreationRequest
+from src.places.utils.geohash import (
+    covering_prefixes,
+    encode_geohash,
+    longitude_ranges,
+    prefix_ranges,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Columns of uq_places_user_id_details, the identity of a place of a user
+PLACE_IDENTITY_COLUMNS = (
+    Place.user_id,
+    Place.place_name,
+    Place.city,
+    Place.place_type,
+    Place.visit_date,
+)
+
+
 class PlaceRepository:
     def __init__(
         self,
         db_session: Annotated[AsyncSession, Depends(get_db)],
+        read_session: Annotated[AsyncSession | None, Depends(get_read_db)] = None,
     ):
         self.db_session = db_session
+        # Read-only queries, on a read replica when the request can use one
+        self.read_session = read_session or db_session
+
+    @staticmethod
+    def _location_values(location: Location | None) -> dict:
+        """
+        Returns the location reference and coordinates stored on a place; places in
+        locations without coordinates are not found by the spatial queries.
+        """
+        if location is None:
+            return {'location_id': None, 'latitude': None, 'longitude': None, 'geohash': None}
+
+        geohash = None
+        if location.latitude is not None and location.longitude is not None:
+            geohash = encode_geohash(latitude=location.latitude, longitude=location.longitude)
+
+        return {
+            'location_id': location.id,
+            'latitude': location.latitude,
+            'longitude': location.longitude,
+            'geohash': geohash,
+        }
 
     async def create_place(
-        self, user_id: int, place: PlaceCreationRequest, place_detail: PlaceDetailResponse
-    ) -> Place:
+        self, user_id: int, place: PlaceCreationRequest, location: Location | None = None
+    ) -> Place | None:
         """
-        Creates a new place for the user.
+        Creates a new place for the user, waiting to be enriched with a description.
+
+        The place is inserted and returned in one statement; None is returned if the
+        user already has a place with the same identity.
         """
-        try:
-            place_data_dict = place.model_dump()
-            place_data_dict['description'] = place_detail.description
-            place_data_dict['photo_url'] = place_detail.photo_url
+        insert = postgresql_insert if self._dialect_name == 'postgresql' else sqlite_insert
 
-            place = Place(**place_data_dict)
-            place.user_id = user_id
+        try:
+            stmt = (
+                insert(Place)
+                .values(
+                    **place.model_dump(),
+                    **self._location_values(location),
+                    user_id=user_id,
+                    enrichment_status=EnrichmentStatus.PENDING,
+                )
+                .on_conflict_do_nothing(index_elements=PLACE_IDENTITY_COLUMNS)
+                .returning(Place)
+            )
+            result = await self.db_session.execute(stmt)
+            created_place = result.scalar_one_or_none()
 
-            self.db_session.add(place)
             await self.db_session.commit()
-            await self.db_session.refresh(place)
 
-            return place
+            return created_place
 
         except SQLAlchemyError as e:
             await self.db_session.rollback()
             logger.error(f'Failed to create place for user {user_id}: {str(e)}')
             raise PlaceError()
 
-    async def get_place_by_details(
+    @property
+    def _dialect_name(self) -> str:
+        return self.db_session.get_bind().dialect.name
+
+    async def _get_places(self, stmt: Select) -> list[Place]:
+        result = await self.read_session.execute(stmt)
+
+        return list(result.scalars())
+
+    async def get_places_by_user(
         self,
+        filters: PlaceFilter,
         user_id: int,
-        place_name: str,
-        city: str,
-        place_type: str,
-        visit_date: date | None,
-    ) -> Place | None:
+        limit: int = 10,
+        offset: int = 0,
+        fields: tuple[str, ...] = PLACE_RESPONSE_FIELDS,
+    ) -> list[Row]:
         """
-        Retrieves a place by its details.
+        Retrieves places for a user with filters applied, as rows of the given
+        response fields.
         """
         try:
-            stmt = select(Place).where(
-                Place.user_id == user_id,
-                Place.place_name == place_name,
-                Place.city == city,
-                Place.place_type == place_type,
-                Place.visit_date == visit_date,
+            stmt = select(*_place_columns(fields)).where(Place.user_id == user_id)
+            stmt = filters.filter(stmt)
+            stmt = filters.sort(stmt)
+            stmt = stmt.offset(offset).limit(limit)
+
+            result = await self.read_session.execute(stmt)
+
+            return list(result.all())
+
+        except SQLAlchemyError as e:
+            await self.read_session.rollback()
+            logger.error(f'Failed to get places for user {user_id}: {str(e)}')
+            raise PlaceError()
+
+    async def get_places_page(
+        self,
+        filters: PlaceFilter,
+        user_id: int,
+        sort_field: str,
+        descending: bool,
+        after: tuple[Any, int] | None = None,
+        limit: int = 10,
+    ) -> list[Place]:
+        """
+        Retrieves places for a user with filters applied, ordered by the sort field
+        and ID, starting after the (sort value, ID) of the last place of the previous
+        page; places without a sort value come last.
+
+        The places with a sort value and the ones without it are read in turn, each
+        as a seek on the (user_id, sort field, id) index in its natural order, so
+        a page costs the same however deep it is.
+        """
+        column = getattr(Place, sort_field)
+        id_order = Place.id.desc() if descending else Place.id.asc()
+        stmt = filters.filter(select(Place).where(Place.user_id == user_id))
+
+        try:
+            if column is Place.id:
+                if after is not None:
+                    stmt = stmt.where(_after_id(descending, after[1]))
+                return await self._get_places(stmt.order_by(id_order).limit(limit))
+
+            places = []
+            if after is None or after[0] is not None:
+                values_stmt = stmt.where(column.is_not(None))
+                if after is not None:
+                    values_stmt = values_stmt.where(_after_keyset(column, descending, *after))
+                column_order = column.desc() if descending else column.asc()
+                places = await self._get_places(
+                    values_stmt.order_by(column_order, id_order).limit(limit)
+                )
+
+            if len(places) < limit:
+                nulls_stmt = stmt.where(column.is_(None))
+                if after is not None and after[0] is None:
+                    nulls_stmt = nulls_stmt.where(_after_id(descending, after[1]))
+                places += await self._get_places(
+                    nulls_stmt.order_by(id_order).limit(limit - len(places))
+                )
+
+            return places
+
+        except SQLAlchemyError as e:
+            await self.read_session.rollback()
+            logger.error(f'Failed to get page of places for user {user_id}: {str(e)}')
+            raise PlaceError()
+
+    async def get_places_nearby(
+        self,
+        user_id: int,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[Place]:
+        """
+        Retrieves places of a user within the radius of the point.
+
+        The geohash cells covering the bounding box of the circle narrow the rows
+        down through the index, then the equirectangular distance, which is accurate
+        enough at these radii, drops the places in the corners of the box.
+        """
+        lat_delta = radius_km / KM_PER_DEGREE
+        cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+        lng_delta = lat_delta / cos_lat
+
+        # Longitudes wrap around the antimeridian, so does the box of the circle
+        if lng_delta >= 180.0:
+            min_lng, max_lng = -180.0, 180.0
+        else:
+            min_lng = _wrap_longitude(longitude - lng_delta)
+            max_lng = _wrap_longitude(longitude + lng_delta)
+
+        lng_difference = Place.longitude - longitude
+        lat_distance = (Place.latitude - latitude) * KM_PER_DEGREE
+        lng_distance = case(
+            (lng_difference > 180.0, lng_difference - 360.0),
+            (lng_difference < -180.0, lng_difference + 360.0),
+            else_=lng_difference,
+        ) * (KM_PER_DEGREE * cos_lat)
+
+        try:
+            stmt = self._select_in_box(
+                user_id=user_id,
+                min_lat=max(latitude - lat_delta, -90.0),
+                min_lng=min_lng,
+                max_lat=min(latitude + lat_delta, 90.0),
+                max_lng=max_lng,
+            )
+            stmt = stmt.where(
+                lat_distance * lat_distance + lng_distance * lng_distance <= radius_km**2
             )
+            stmt = stmt.offset(offset).limit(limit)
 
-            result = await self.db_session.execute(stmt)
+            result = await self.read_session.execute(stmt)
 
-            return result.scalars().first()
+            return list(result.scalars())
 
         except SQLAlchemyError as e:
-            await self.db_session.rollback()
-            logger.error(f'Failed to get place for user {user_id}: {str(e)}')
+            await self.read_session.rollback()
+            logger.error(f'Failed to get places nearby for user {user_id}: {str(e)}')
             raise PlaceError()
 
-    async def get_places_by_user(
-        self, filters: PlaceFilter, user_id: int, limit: int = 10, offset: int = 0
+    async def get_places_in_bounding_box(
+        self,
+        user_id: int,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: int = 10,
+        offset: int = 0,
     ) -> list[Place]:
         """
-        Retrieves places for a user with filters applied.
+        Retrieves places of a user within the bounding box.
         """
         try:
-            stmt = select(Place).where(Place.user_id == user_id).offset(offset).limit(limit)
-            stmt = filters.filter(stmt)
-            stmt = filters.sort(stmt)
+            stmt = self._select_in_box(
+                user_id=user_id, min_lat=min_lat, min_lng=min_lng, max_lat=max_lat, max_lng=max_lng
+            )
+            stmt = stmt.offset(offset).limit(limit)
 
-            result = await self.db_session.execute(stmt)
-            places = [row for row in result.scalars()]
+            result = await self.read_session.execute(stmt)
 
-            return places
+            return list(result.scalars())
 
         except SQLAlchemyError as e:
-            await self.db_session.rollback()
-            logger.error(f'Failed to get places for user {user_id}: {str(e)}')
+            await self.read_session.rollback()
+            logger.error(f'Failed to get places within bounding box for user {user_id}: {str(e)}')
             raise PlaceError()
 
-    async def get_place_by_id(self, place_id: int, user_id: int) -> Place | None:
+    @staticmethod
+    def _select_in_box(
+        user_id: int, min_lat: float, min_lng: float, max_lat: float, max_lng: float
+    ) -> Select:
+        """
+        Selects places of a user within the bounding box, as index range scans over
+        the geohash prefixes of the covering cells, ordered by geohash; a box whose
+        minimum longitude exceeds the maximum one crosses the antimeridian.
         """
-        Retrieves a place by ID and user ID.
+        prefixes = covering_prefixes(min_lat, min_lng, max_lat, max_lng)
+
+        return (
+            select(Place)
+            .where(
+                Place.user_id == user_id,
+                _in_geohash_prefixes(prefixes),
+                Place.latitude.between(min_lat, max_lat),
+                or_(
+                    *(
+                        Place.longitude.between(range_min_lng, range_max_lng)
+                        for range_min_lng, range_max_lng in longitude_ranges(min_lng, max_lng)
+                    )
+                ),
+            )
+            .order_by(Place.geohash, Place.id)
+        )
+
+    async def get_place_clusters(
+        self, user_id: int, prefixes: list[str], precision: int
+    ) -> list[PlaceClusterResponse]:
+        """
+        Aggregates the places of a user within the geohash prefixes into clusters
+        of the cells of the precision, with their count and centroid; the oldest and
+        the newest place represent a cluster.
+        """
+        cell = func.substr(Place.geohash, 1, precision).label('cell')
+
+        try:
+            stmt = (
+                select(
+                    cell,
+                    func.count(Place.id),
+                    func.avg(Place.latitude),
+                    func.avg(Place.longitude),
+                    func.min(Place.id),
+                    func.max(Place.id),
+                )
+                .where(Place.user_id == user_id, _in_geohash_prefixes(prefixes))
+                .group_by(cell)
+                .order_by(cell)
+            )
+            result = await self.read_session.execute(stmt)
+
+            return [
+                PlaceClusterResponse(
+                    geohash=geohash,
+                    count=count,
+                    latitude=latitude,
+                    longitude=longitude,
+                    place_ids=sorted({first_id, last_id}),
+                )
+                for geohash, count, latitude, longitude, first_id, last_id in result
+            ]
+
+        except SQLAlchemyError as e:
+            await self.read_session.rollback()
+            logger.error(f'Failed to get place clusters for user {user_id}: {str(e)}')
+            raise PlaceError()
+
+    async def get_place_by_id(
+        self, place_id: int, user_id: int, fields: tuple[str, ...] = PLACE_RESPONSE_FIELDS
+    ) -> Row | None:
+        """
+        Retrieves a place by ID and user ID, as a row of the given response fields.
         """
         try:
-            stmt = select(Place).where(
+            stmt = select(*_place_columns(fields)).where(
                 Place.id == place_id,
                 Place.user_id == user_id,
             )
-            result = await self.db_session.execute(stmt)
+            result = await self.read_session.execute(stmt)
 
-            return result.scalars().first()
+            return result.first()
 
         except SQLAlchemyError as e:
-            await self.db_session.rollback()
+            await self.read_session.rollback()
             logger.error(f'Failed to get place by ID {place_id} for user {user_id}: {str(e)}')
             raise PlaceError()
 
     async def update_place(
-        self, place_id: int, user_id: int, place_data: PlaceUpdateRequest
+        self,
+        place_id: int,
+        user_id: int,
+        place_data: dict[str, Any],
+        location: Location | None = None,
     ) -> Place | None:
         """
-        Updates a place by ID and user ID.
+        Updates the given columns of a place by ID and user ID, and its location if
+        one is given, returning the updated place in the same statement.
+
+        Raises PlaceAlreadyExistsError if the user has another place with the new identity.
         """
+        values = dict(place_data)
+        if location is not None:
+            values.update(self._location_values(location))
+
         try:
             stmt = (
                 update(Place)
                 .where(Place.id == place_id, Place.user_id == user_id)
-                .values(**place_data.model_dump())
-                .execution_options(synchronize_session='fetch')
+                .values(**values)
+                .returning(Place)
             )
             result = await self.db_session.execute(stmt)
+            place = result.scalar_one_or_none()
 
             await self.db_session.commit()
 
-            if result.rowcount == 0:
-                return None
+            return place
 
-            return await self.db_session.get(Place, place_id)
+        except IntegrityError:
+            # The changes give the place the identity of another place of the user
+            await self.db_session.rollback()
+            stored_place = await self.get_place_by_id(place_id=place_id, user_id=user_id)
+            raise PlaceAlreadyExistsError(
+                place_name=values.get('place_name', stored_place.place_name),
+                city=values.get('city', stored_place.city),
+                place_type=values.get('place_type', stored_place.place_type),
+            )
 
         except SQLAlchemyError as e:
             await self.db_session.rollback()
             logger.error(f'Failed to update place by ID {place_id} for user {user_id}: {str(e)}')
             raise PlaceError()
 
+    async def update_place_detail(self, place_id: int, place_detail: PlaceDetailResponse) -> bool:
+        """
+        Stores the generated description and photo of a place that is still pending enrichment.
+        """
+        try:
+            stmt = (
+                update(Place)
+                .where(
+                    Place.id == place_id,
+                    Place.enrichment_status == EnrichmentStatus.PENDING,
+                )
+                .values(
+                    description=place_detail.description,
+                    photo_url=place_detail.photo_url,
+                    enrichment_status=EnrichmentStatus.COMPLETED,
+                )
+            )
+            result = await self.db_session.execute(stmt)
+            await self.db_session.commit()
+
+            return result.rowcount > 0
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to store details of place {place_id}: {str(e)}')
+            raise PlaceError()
+
+    async def set_enrichment_status(self, place_id: int, status: EnrichmentStatus) -> None:
+        """
+        Sets the enrichment status of a place.
+        """
+        try:
+            stmt = update(Place).where(Place.id == place_id).values(enrichment_status=status)
+            await self.db_session.execute(stmt)
+            await self.db_session.commit()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to set enrichment status of place {place_id}: {str(e)}')
+            raise PlaceError()
+
+    async def get_pending_places(self, created_before: datetime, limit: int) -> list[Place]:
+        """
+        Retrieves places that have been waiting for enrichment since before the given time.
+        """
+        try:
+            stmt = (
+                select(Place)
+                .where(
+                    Place.enrichment_status == EnrichmentStatus.PENDING,
+                    Place.created_at < created_before,
+                )
+                .order_by(Place.id)
+                .limit(limit)
+            )
+            result = await self.db_session.execute(stmt)
+
+            return list(result.scalars())
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            logger.error(f'Failed to get places pending enrichment: {str(e)}')
+            raise PlaceError()
+
     async def delete_place(self, place_id: int, user_id: int) -> bool:
         """
         Deletes a place by ID and user ID.
@@ -164,3 +512,53 @@ class PlaceRepository:
             await self.db_session.rollback()
             logger.error(f'Failed to delete place by ID {place_id} for user {user_id}: {str(e)}')
             raise PlaceError()
+
+
+def _place_columns(fields: tuple[str, ...]) -> list[Column]:
+    """
+    Returns the place columns of the response fields, the hot reads load them as
+    plain rows, skipping entity construction and the identity map.
+    """
+    return [Place.__table__.c[field_name] for field_name in fields]
+
+
+def _wrap_longitude(longitude: float) -> float:
+    """Wraps a longitude past the antimeridian back into [-180, 180]."""
+    if longitude > 180.0:
+        return longitude - 360.0
+    if longitude < -180.0:
+        return longitude + 360.0
+
+    return longitude
+
+
+def _in_geohash_prefixes(prefixes: list[str]) -> ColumnElement[bool]:
+    """
+    Matches places whose geohash starts with one of the sorted prefixes, as
+    range conditions the (user_id, geohash) index can scan.
+    """
+    geohash_ranges = []
+    for start, end in prefix_ranges(prefixes):
+        condition = Place.geohash >= start
+        if end is not None:
+            condition = and_(condition, Place.geohash < end)
+        geohash_ranges.append(condition)
+
+    return and_(Place.geohash.is_not(None), or_(*geohash_ranges))
+
+
+def _after_id(descending: bool, last_id: int) -> ColumnElement[bool]:
+    return Place.id < last_id if descending else Place.id > last_id
+
+
+def _after_keyset(
+    column: InstrumentedAttribute, descending: bool, value: Any, last_id: int
+) -> ColumnElement[bool]:
+    """
+    Matches the rows with a value of the column after (value, last_id) in the
+    order of (column, id); the bound on the column lets the index seek to it.
+    """
+    if descending:
+        return and_(column <= value, tuple_(column, Place.id) < (value, last_id))
+
+    return and_(column >= value, tuple_(column, Place.id) > (value, last_id))
@@ -1,25 +1,39 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Query, Response
 from fastapi.params import Depends
 from fastapi_filter import FilterDepends
 from starlette import status
 
 from src.auth.current_user import get_current_user
-from src.dependencies import get_pagination_params
+from src.dependencies import get_cursor_params, get_pagination_params
 from src.models import User
-from src.pagination import PaginationParams
+from src.pagination import CursorPage, CursorParams, PaginationParams
 from src.places.exceptions import (
     GeoServiceError,
+    InvalidCursorError,
     LocationValidationError,
-    OpenAIError,
     PlaceAlreadyExistsError,
     PlaceError,
     PlaceNotFoundError,
 )
+from src.places.schemas.enrichment import PlaceEnrichmentResponse
 from src.places.schemas.filters import PlaceFilter
-from src.places.schemas.places import PlaceCreationRequest, PlaceResponse, PlaceUpdateRequest
+from src.places.schemas.geo import (
+    BoundingBoxQuery,
+    ClusterQuery,
+    NearbyQuery,
+    PlaceClusterResponse,
+)
+from src.places.schemas.places import (
+    PlaceCreationRequest,
+    PlaceFieldsQuery,
+    PlaceResponse,
+    PlaceUpdateRequest,
+    get_place_list_adapter,
+)
+from src.places.services.place_clusters import PlaceClusterService
 from src.places.services.places import PlaceService
 
 
@@ -60,12 +74,6 @@ async def create_place(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=e.message,
         )
-    except OpenAIError as e:
-        logger.exception('OpenAI error occurred while creating a place.')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=e.message,
-        )
 
 
 @router.get(
@@ -79,14 +87,19 @@ async def get_places(
     current_user: Annotated[User, Depends(get_current_user)],
     pagination: Annotated[PaginationParams, Depends(get_pagination_params)],
     place_filter: Annotated[PlaceFilter, FilterDepends(PlaceFilter)],
+    fields_query: Annotated[PlaceFieldsQuery, Query()],
 ):
     try:
-        return await place_service.get_places(
+        places = await place_service.get_places(
             user_id=current_user.id,
             filters=place_filter,
             offset=pagination.offset,
             limit=pagination.limit,
+            fields=fields_query.field_names,
         )
+        # The places are validated already, the response model is only documented
+        place_list_adapter = get_place_list_adapter(fields_query.field_names)
+        return Response(content=place_list_adapter.dump_json(places), media_type='application/json')
 
     except PlaceNotFoundError as e:
         logger.exception('Place not found while retrieving places.')
@@ -100,6 +113,115 @@ async def get_places(
         )
 
 
+@router.get(
+    '/page',
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[PlaceResponse],
+    summary='Get a page of places after a cursor',
+)
+async def get_places_page(
+    place_service: Annotated[PlaceService, Depends(PlaceService)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    cursor_params: Annotated[CursorParams, Depends(get_cursor_params)],
+    place_filter: Annotated[PlaceFilter, FilterDepends(PlaceFilter)],
+):
+    try:
+        return await place_service.get_places_page(
+            user_id=current_user.id,
+            filters=place_filter,
+            cursor=cursor_params.cursor,
+            limit=cursor_params.limit,
+        )
+
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    except PlaceError as e:
+        logger.exception('Place error occurred while retrieving a page of places.')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message,
+        )
+
+
+@router.get(
+    '/nearby',
+    status_code=status.HTTP_200_OK,
+    response_model=list[PlaceResponse],
+    summary='Get places within a radius of a point',
+)
+async def get_places_nearby(
+    place_service: Annotated[PlaceService, Depends(PlaceService)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    pagination: Annotated[PaginationParams, Depends(get_pagination_params)],
+    nearby_query: Annotated[NearbyQuery, Query()],
+):
+    try:
+        return await place_service.get_places_nearby(
+            user_id=current_user.id,
+            query=nearby_query,
+            offset=pagination.offset,
+            limit=pagination.limit,
+        )
+
+    except PlaceError as e:
+        logger.exception('Place error occurred while retrieving places nearby.')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message,
+        )
+
+
+@router.get(
+    '/within',
+    status_code=status.HTTP_200_OK,
+    response_model=list[PlaceResponse],
+    summary='Get places within a bounding box',
+)
+async def get_places_within(
+    place_service: Annotated[PlaceService, Depends(PlaceService)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    pagination: Annotated[PaginationParams, Depends(get_pagination_params)],
+    bounding_box: Annotated[BoundingBoxQuery, Query()],
+):
+    try:
+        return await place_service.get_places_within(
+            user_id=current_user.id,
+            query=bounding_box,
+            offset=pagination.offset,
+            limit=pagination.limit,
+        )
+
+    except PlaceError as e:
+        logger.exception('Place error occurred while retrieving places within a bounding box.')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message,
+        )
+
+
+@router.get(
+    '/clusters',
+    status_code=status.HTTP_200_OK,
+    response_model=list[PlaceClusterResponse],
+    summary='Get clusters of places within a bounding box for a map zoom level',
+)
+async def get_place_clusters(
+    cluster_service: Annotated[PlaceClusterService, Depends(PlaceClusterService)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    cluster_query: Annotated[ClusterQuery, Query()],
+):
+    try:
+        return await cluster_service.get_clusters(user_id=current_user.id, query=cluster_query)
+
+    except PlaceError as e:
+        logger.exception('Place error occurred while clustering places.')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message,
+        )
+
+
 @router.get(
     '/{place_id}',
     status_code=status.HTTP_200_OK,
@@ -110,9 +232,13 @@ async def get_place_by_id(
     current_user: Annotated[User, Depends(get_current_user)],
     place_service: Annotated[PlaceService, Depends(PlaceService)],
     place_id: int,
+    fields_query: Annotated[PlaceFieldsQuery, Query()],
 ):
     try:
-        return await place_service.get_place_by_id(place_id=place_id, user_id=current_user.id)
+        place = await place_service.get_place_by_id(
+            place_id=place_id, user_id=current_user.id, fields=fields_query.field_names
+        )
+        return Response(content=place.model_dump_json(), media_type='application/json')
 
     except PlaceNotFoundError as e:
         logger.exception(f'Place with ID {place_id} not found.')
@@ -126,6 +252,32 @@ async def get_place_by_id(
         )
 
 
+@router.get(
+    '/{place_id}/enrichment',
+    status_code=status.HTTP_200_OK,
+    response_model=PlaceEnrichmentResponse,
+    summary='Get the enrichment status of a place',
+)
+async def get_place_enrichment_status(
+    current_user: Annotated[User, Depends(get_current_user)],
+    place_service: Annotated[PlaceService, Depends(PlaceService)],
+    place_id: int,
+):
+    try:
+        return await place_service.get_enrichment_status(place_id=place_id, user_id=current_user.id)
+
+    except PlaceNotFoundError as e:
+        logger.exception(f'Place with ID {place_id} not found.')
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+    except PlaceError as e:
+        logger.exception('Place error occurred while retrieving the enrichment status.')
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message,
+        )
+
+
 @router.put(
     '/{place_id}',
     status_code=status.HTTP_200_OK,
@@ -148,7 +300,7 @@ async def update_place_by_id(
         logger.exception(f'Place with ID {place_id} not found for update.')
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
 
-    except LocationValidationError as e:
+    except (PlaceAlreadyExistsError, LocationValidationError) as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message,
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict
+
+from src.enums.places import EnrichmentStatus
+
+
+class PlaceEnrichmentJob(BaseModel):
+    """Job that fills in the description and photo of a created place."""
+
+    place_id: int
+    user_id: int
+
+
+class PlaceEnrichmentResponse(BaseModel):
+    """Schema for the enrichment status of a place."""
+
+    place_id: int
+    enrichment_status: EnrichmentStatus
+
+    model_config = ConfigDict(use_enum_values=True)
@@ -1,7 +1,13 @@
 from fastapi_filter.contrib.sqlalchemy import Filter
 from pydantic import ConfigDict, Field, field_validator
+from sqlalchemy import Select, select
 
-from src.models import Place
+from src.models import Location, Place
+from src.places.utils.location_utils import canonicalize_city, canonicalize_country
+
+
+# Filters applied to the referenced location rather than to the place columns
+LOCATION_FILTER_FIELDS = ('city__in', 'country__in')
 
 
 class PlaceFilter(Filter):
@@ -29,5 +35,38 @@ class PlaceFilter(Filter):
 
         return value
 
+    @property
+    def filtering_fields(self):
+        return [
+            (field_name, value)
+            for field_name, value in super().filtering_fields
+            if field_name not in LOCATION_FILTER_FIELDS
+        ]
+
+    def filter(self, query: Select) -> Select:
+        """
+        Applies the filters; cities and countries are matched by their canonical
+        names through an integer semi-join on the locations table.
+        """
+        query = super().filter(query)
+
+        location_ids = select(Location.id)
+        if self.city__in:
+            # A city is resolved the same way as when its location was stored
+            cities = {
+                canonicalize_city(city=city, country=country)
+                for city in self.city__in
+                for country in self.country__in or ['']
+            }
+            location_ids = location_ids.where(Location.city.in_(cities))
+        if self.country__in:
+            countries = {canonicalize_country(country) for country in self.country__in}
+            location_ids = location_ids.where(Location.country.in_(countries))
+
+        if self.city__in or self.country__in:
+            query = query.where(Place.location_id.in_(location_ids))
+
+        return query
+
     class Constants(Filter.Constants):
         model = Place
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field, model_validator
+
+from src.places.constants import NEARBY_MAX_RADIUS_KM, PLACE_CLUSTERS_MAX_ZOOM
+
+
+class NearbyQuery(BaseModel):
+    """Schema for searching places within a radius of a point."""
+
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+    radius_km: float = Field(gt=0, le=NEARBY_MAX_RADIUS_KM)
+
+
+class BoundingBoxQuery(BaseModel):
+    """
+    Schema for searching places within a bounding box; a box whose minimum
+    longitude exceeds the maximum one crosses the antimeridian.
+    """
+
+    min_lat: float = Field(ge=-90, le=90)
+    min_lng: float = Field(ge=-180, le=180)
+    max_lat: float = Field(ge=-90, le=90)
+    max_lng: float = Field(ge=-180, le=180)
+
+    @model_validator(mode='after')
+    def check_bounds(self):
+        if self.min_lat > self.max_lat:
+            raise ValueError('The minimum latitude must not exceed the maximum one')
+
+        return self
+
+
+class ClusterQuery(BoundingBoxQuery):
+    """Schema for clustering places within a bounding box at a map zoom level."""
+
+    zoom: int = Field(ge=0, le=PLACE_CLUSTERS_MAX_ZOOM)
+
+
+class PlaceClusterResponse(BaseModel):
+    """Schema for a cluster of places sharing a geohash cell."""
+
+    geohash: str
+    count: int
+    latitude: float
+    longitude: float
+    place_ids: list[int]
@@ -1,8 +1,19 @@
 from datetime import date, datetime
-
-from pydantic import BaseModel, ConfigDict, conint, constr, field_validator
-
-from src.enums.places import PlaceRating, PlaceType
+from functools import lru_cache
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    conint,
+    constr,
+    create_model,
+    field_validator,
+)
+
+from src.enums.places import EnrichmentStatus, PlaceRating, PlaceType
+from src.places.constants import PLACE_FIELDSETS_CACHE_SIZE
 from src.places.utils.date_utils import check_future_date
 
 
@@ -38,12 +49,69 @@ class PlaceResponse(BaseModel):
     days_spent: int | None = None
     visit_date: date | None = None
     place_type: PlaceType
+    enrichment_status: EnrichmentStatus
+    latitude: float | None = None
+    longitude: float | None = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(use_enum_values=True, from_attributes=True)
 
 
+PLACE_RESPONSE_FIELDS = tuple(PlaceResponse.model_fields)
+
+
+class PlaceFieldsQuery(BaseModel):
+    """Schema for choosing the fields of the returned places."""
+
+    fields: str | None = Field(
+        default=None,
+        description='Comma-separated fields to return, all by default; the ID is always returned',
+    )
+
+    @field_validator('fields')
+    def check_fields(cls, value):  # noqa
+        if value is None:
+            return None
+
+        unknown_fields = {name.strip() for name in value.split(',')} - set(PLACE_RESPONSE_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"You may only choose from: {', '.join(PLACE_RESPONSE_FIELDS)}")
+
+        return value
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """Returns the chosen fields with the ID, in the order of PlaceResponse."""
+        if self.fields is None:
+            return PLACE_RESPONSE_FIELDS
+
+        chosen_fields = {name.strip() for name in self.fields.split(',')} | {'id'}
+        return tuple(name for name in PLACE_RESPONSE_FIELDS if name in chosen_fields)
+
+
+@lru_cache(maxsize=PLACE_FIELDSETS_CACHE_SIZE)
+def get_place_response_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    """Returns the response model with only the given fields of PlaceResponse."""
+    if fields == PLACE_RESPONSE_FIELDS:
+        return PlaceResponse
+
+    return create_model(
+        'PlaceFieldsetResponse',
+        __config__=PlaceResponse.model_config,
+        **{
+            name: (PlaceResponse.model_fields[name].annotation, PlaceResponse.model_fields[name])
+            for name in fields
+        },
+    )
+
+
+@lru_cache(maxsize=PLACE_FIELDSETS_CACHE_SIZE)
+def get_place_list_adapter(fields: tuple[str, ...]) -> TypeAdapter:
+    """Returns the adapter validating and serializing lists of places with the given fields."""
+    return TypeAdapter(list[get_place_response_model(fields)])
+
+
 class PlaceUpdateRequest(BaseModel):
     """Schema for updating a place with optional fields."""
 
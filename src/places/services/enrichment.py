@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import os
+import socket
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.enums.places import EnrichmentStatus
+from src.places.constants import (
+    PLACE_ENRICHMENT_ERROR_DELAY,
+    PLACE_ENRICHMENT_MAX_ATTEMPTS,
+    PLACE_ENRICHMENT_REQUEUE_AFTER_MINUTES,
+    PLACE_ENRICHMENT_RETRY_DELAY,
+)
+from src.places.exceptions import OpenAIError
+from src.places.repositories.enrichment_queue import PlaceEnrichmentQueue
+from src.places.repositories.places import PlaceRepository
+from src.places.schemas.enrichment import PlaceEnrichmentJob
+from src.places.schemas.openai import PlaceDetailResponse
+from src.places.services.place_descriptions import (
+    PlaceDescriptionService,
+    place_description_service,
+)
+from src.repositories.postgres_base import async_session
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlaceEnrichmentService:
+    """
+    Fills in the description and photo of created places in the background.
+
+    A bounded pool of asyncio workers consumes jobs from the enrichment queue.
+    No database session is held while waiting for OpenAI.
+    """
+
+    def __init__(
+        self,
+        queue: PlaceEnrichmentQueue,
+        description_service: PlaceDescriptionService,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
+        self.queue = queue
+        self.description_service = description_service
+        self.session_factory = session_factory
+        self._workers: list[asyncio.Task] = []
+
+    async def process(self, job: PlaceEnrichmentJob) -> None:
+        """
+        Generates the details of the place, retrying failed OpenAI calls and
+        dead-lettering the job once the retries are exhausted.
+        """
+        async with self.session_factory() as session:
+            place = await PlaceRepository(db_session=session).get_place_by_id(
+                place_id=job.place_id, user_id=job.user_id
+            )
+
+        if place is None or place.enrichment_status != EnrichmentStatus.PENDING:
+            return
+
+        try:
+            place_detail = await self._generate_place_detail(
+                place_name=place.place_name, city=place.city, country=place.country
+            )
+        except OpenAIError as e:
+            await self.queue.dead_letter(job=job, error=e.message)
+            async with self.session_factory() as session:
+                await PlaceRepository(db_session=session).set_enrichment_status(
+                    place_id=job.place_id, status=EnrichmentStatus.FAILED
+                )
+            return
+
+        async with self.session_factory() as session:
+            await PlaceRepository(db_session=session).update_place_detail(
+                place_id=job.place_id, place_detail=place_detail
+            )
+
+    async def _generate_place_detail(
+        self, place_name: str, city: str, country: str
+    ) -> PlaceDetailResponse:
+        """
+        Retrieves the shared description of a place, retrying failed OpenAI calls
+        with exponential backoff.
+        """
+        for attempt in range(1, PLACE_ENRICHMENT_MAX_ATTEMPTS + 1):
+            try:
+                return await self.description_service.get_place_detail(
+                    place_name=place_name, city=city, country=country
+                )
+
+            except OpenAIError:
+                logger.warning(f'Attempt {attempt} to describe "{place_name}" failed.')
+                if attempt == PLACE_ENRICHMENT_MAX_ATTEMPTS:
+                    raise
+
+                await asyncio.sleep(PLACE_ENRICHMENT_RETRY_DELAY * 2 ** (attempt - 1))
+
+    async def requeue_stale_jobs(self, limit: int = 100) -> int:
+        """
+        Enqueues again places that have been pending for too long, e.g. because
+        the queue was unavailable when they were created.
+        """
+        created_before = datetime.now(timezone.utc) - timedelta(
+            minutes=PLACE_ENRICHMENT_REQUEUE_AFTER_MINUTES
+        )
+        async with self.session_factory() as session:
+            places = await PlaceRepository(db_session=session).get_pending_places(
+                created_before=created_before, limit=limit
+            )
+
+        requeued_count = 0
+        for place in places:
+            job = PlaceEnrichmentJob(place_id=place.id, user_id=place.user_id)
+            requeued_count += await self.queue.enqueue(job=job)
+
+        return requeued_count
+
+    def start(self, workers: int) -> None:
+        """Starts the given number of workers."""
+        consumer_prefix = f'{socket.gethostname()}-{os.getpid()}'
+        self._workers = [
+            asyncio.create_task(self._run_worker(consumer=f'{consumer_prefix}-{index}'))
+            for index in range(workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancels the workers; unfinished jobs are picked up again later."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+
+    async def _run_worker(self, consumer: str) -> None:
+        group_ready = False
+        while True:
+            try:
+                if not group_ready:
+                    await self.queue.ensure_group()
+                    group_ready = True
+
+                messages = await self.queue.claim_stale(consumer=consumer)
+                if not messages:
+                    messages = await self.queue.read(consumer=consumer)
+
+                for message_id, job in messages:
+                    await self.process(job=job)
+                    await self.queue.ack(message_id=message_id)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.error(f'Place enrichment worker {consumer} failed: {e}', exc_info=True)
+                group_ready = False
+                await asyncio.sleep(PLACE_ENRICHMENT_ERROR_DELAY)
+
+
+place_enrichment_service = PlaceEnrichmentService(
+    queue=PlaceEnrichmentQueue(),
+    description_service=place_description_service,
+)
@@ -0,0 +1,103 @@
+import secrets
+from string import Template
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.places.constants import (
+    GEOHASH_PRECISION,
+    PLACE_CLUSTERS_MAX_TILES,
+    PLACE_CLUSTERS_TILE_KEY,
+    PLACE_CLUSTERS_VERSION_KEY,
+    PLACE_CLUSTERS_ZOOM_PER_PRECISION,
+)
+from src.places.repositories.places import PlaceRepository
+from src.places.schemas.geo import ClusterQuery, PlaceClusterResponse
+from src.places.utils.geohash import covering_prefixes
+from src.services.cache import CacheService
+
+
+class PlaceClusterService:
+    """
+    Clusters the places of a user for the map, aggregated by the database.
+
+    The bounding box is covered by at most PLACE_CLUSTERS_MAX_TILES geohash tiles,
+    each split into at most 32 clusters, so the response size does not depend on
+    the number of places. Tiles are cached per user, version, tile and precision;
+    the version changes whenever the places of the user do.
+    """
+
+    def __init__(self, place_repository: Annotated[PlaceRepository, Depends(PlaceRepository)]):
+        self.place_repository = place_repository
+
+    async def get_clusters(self, user_id: int, query: ClusterQuery) -> list[PlaceClusterResponse]:
+        """
+        Returns the clusters of the places within the tiles covering the bounding box.
+        """
+        zoom_precision = min(
+            int(query.zoom / PLACE_CLUSTERS_ZOOM_PER_PRECISION) + 1, GEOHASH_PRECISION
+        )
+        tiles = covering_prefixes(
+            query.min_lat,
+            query.min_lng,
+            query.max_lat,
+            query.max_lng,
+            max_cells=PLACE_CLUSTERS_MAX_TILES,
+            max_precision=zoom_precision,
+        )
+        tile_precision = len(tiles[0])
+        precision = min(tile_precision + 1, zoom_precision)
+
+        version = await self._get_version(user_id=user_id)
+        tile_keys = {
+            tile: Template(PLACE_CLUSTERS_TILE_KEY).substitute(
+                user_id=user_id, version=version, tile=tile, precision=precision
+            )
+            for tile in tiles
+        }
+        cached_tiles = await CacheService.get_many(list(tile_keys.values()))
+
+        missing_tiles = [tile for tile, key in tile_keys.items() if cached_tiles[key] is None]
+        if missing_tiles:
+            clusters = await self.place_repository.get_place_clusters(
+                user_id=user_id, prefixes=missing_tiles, precision=precision
+            )
+
+            tile_clusters = {tile: [] for tile in missing_tiles}
+            for cluster in clusters:
+                tile_clusters[cluster.geohash[:tile_precision]].append(cluster.model_dump())
+
+            new_tiles = {
+                tile_keys[tile]: {'clusters': clusters} for tile, clusters in tile_clusters.items()
+            }
+            await CacheService.set_many(new_tiles)
+            cached_tiles.update(new_tiles)
+
+        return [
+            PlaceClusterResponse.model_validate(cluster)
+            for tile in tiles
+            for cluster in cached_tiles[tile_keys[tile]]['clusters']
+        ]
+
+    @staticmethod
+    async def _get_version(user_id: int) -> str:
+        cached_version = await CacheService.get_cache(
+            Template(PLACE_CLUSTERS_VERSION_KEY).substitute(user_id=user_id)
+        )
+        if cached_version is not None:
+            return cached_version['version']
+
+        return await PlaceClusterService.invalidate(user_id=user_id)
+
+    @staticmethod
+    async def invalidate(user_id: int) -> str:
+        """
+        Starts a new version of the clusters of the user, the tiles of the previous
+        versions are no longer read and expire.
+        """
+        version = secrets.token_hex(6)
+        await CacheService.set_cache(
+            Template(PLACE_CLUSTERS_VERSION_KEY).substitute(user_id=user_id), {'version': version}
+        )
+
+        return version
@@ -0,0 +1,131 @@
+import logging
+from string import Template
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.places.constants import (
+    PLACE_DESCRIPTION_CACHE_KEY,
+    PLACE_DESCRIPTION_CACHE_TTL,
+    PLACE_DESCRIPTION_LOCAL_CACHE_SIZE,
+    PLACE_DESCRIPTION_LOCAL_CACHE_TTL,
+)
+from src.places.exceptions import OpenAIError, PlaceError
+from src.places.repositories.openai import DescriptionOpenAIRepository
+from src.places.repositories.place_descriptions import PlaceDescriptionRepository
+from src.places.schemas.openai import PlaceDetailResponse
+from src.places.utils.location_utils import normalize_place_key
+from src.places.utils.prompts import generate_description_prompt
+from src.repositories.postgres_base import async_session
+from src.services.cache import CacheService
+from src.utils.lru_cache import TTLLRUCache
+from src.utils.singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+
+_local_descriptions = TTLLRUCache(
+    maxsize=PLACE_DESCRIPTION_LOCAL_CACHE_SIZE, ttl=PLACE_DESCRIPTION_LOCAL_CACHE_TTL
+)
+_in_flight = SingleFlight()
+
+
+class PlaceDescriptionService:
+    """
+    Shared store of generated place descriptions keyed by the normalized
+    (place name, city, country), so a place is only described by OpenAI once
+    no matter how many users add it.
+
+    Lookups go through the in-process LRU, Redis and the place_descriptions table;
+    concurrent misses for the same place on a worker share a single OpenAI call.
+    """
+
+    def __init__(
+        self,
+        openai_repository: DescriptionOpenAIRepository,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
+        self.openai_repository = openai_repository
+        self.session_factory = session_factory
+
+    @staticmethod
+    def _cache_key(key: tuple[str, str, str]) -> str:
+        return Template(PLACE_DESCRIPTION_CACHE_KEY).substitute(key='_'.join(key))
+
+    async def get_place_detail(
+        self, place_name: str, city: str, country: str
+    ) -> PlaceDetailResponse:
+        """
+        Returns the description of the place, generating and storing it on the first request.
+        """
+        key = normalize_place_key(place_name=place_name, city=city, country=country)
+
+        place_detail = _local_descriptions.get(key)
+        if place_detail is not None:
+            return place_detail
+
+        cached_data = await CacheService.get_cache(self._cache_key(key=key))
+        if cached_data is not None:
+            place_detail = PlaceDetailResponse.model_validate(cached_data)
+            _local_descriptions.set(key, place_detail)
+            return place_detail
+
+        return await _in_flight.do(
+            key, lambda: self._load(key=key, place_name=place_name, city=city, country=country)
+        )
+
+    async def _load(
+        self, key: tuple[str, str, str], place_name: str, city: str, country: str
+    ) -> PlaceDetailResponse:
+        async with self.session_factory() as session:
+            place_detail = await PlaceDescriptionRepository(db_session=session).get_description(
+                *key
+            )
+
+        if place_detail is None:
+            place_detail = await self.openai_repository.get_place_detail(
+                prompt=generate_description_prompt(
+                    place_name=place_name, city=city, country=country
+                )
+            )
+            async with self.session_factory() as session:
+                await PlaceDescriptionRepository(db_session=session).save_description(
+                    *key, place_detail=place_detail
+                )
+
+        await CacheService.set_cache(
+            self._cache_key(key=key),
+            place_detail.model_dump(mode='json'),
+            ttl=PLACE_DESCRIPTION_CACHE_TTL,
+        )
+        _local_descriptions.set(key, place_detail)
+
+        return place_detail
+
+    async def pregenerate_popular(self, limit: int) -> int:
+        """
+        Generates descriptions of the most added places that do not have one yet,
+        so the first users adding them do not wait for OpenAI.
+        """
+        async with self.session_factory() as session:
+            keys = await PlaceDescriptionRepository(
+                db_session=session
+            ).get_popular_undescribed_places(limit=limit)
+
+        generated_count = 0
+        for place_name, city, country in keys:
+            try:
+                await self.get_place_detail(place_name=place_name, city=city, country=country)
+                generated_count += 1
+            except (OpenAIError, PlaceError) as e:
+                logger.warning(f'Failed to pregenerate description of "{place_name}": {e}')
+
+        return generated_count
+
+    @staticmethod
+    def clear_local() -> None:
+        """Clears the in-process tier."""
+        _local_descriptions.clear()
+
+
+place_description_service = PlaceDescriptionService(openai_repository=DescriptionOpenAIRepository())
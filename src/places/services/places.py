@@ -1,205 +1,432 @@
 import logging
-from typing import Annotated
+from datetime import date
+from typing import Annotated, Any, Callable
 
 from fastapi import Depends
+from pydantic import BaseModel
 
+from src.enums.places import PlaceRating
+from src.models import Location
+from src.pagination import CursorPage, decode_cursor, encode_cursor
 from src.places.exceptions import (
+    GeoServiceError,
+    InvalidCursorError,
     LocationValidationError,
-    OpenAIError,
     PlaceAlreadyExistsError,
     PlaceNotFoundError,
 )
+from src.places.repositories.enrichment_queue import PlaceEnrichmentQueue
 from src.places.repositories.geo_names import GeoRepository
-from src.places.repositories.openai import DescriptionOpenAIRepository
+from src.places.repositories.locations import LocationRepository
 from src.places.repositories.places import PlaceRepository
+from src.places.schemas.enrichment import PlaceEnrichmentJob, PlaceEnrichmentResponse
 from src.places.schemas.filters import PlaceFilter
-from src.places.schemas.openai import PlaceDetailResponse
-from src.places.schemas.places import PlaceCreationRequest, PlaceResponse, PlaceUpdateRequest
-from src.places.utils.location_utils import format_location, generate_cache_key, is_location_valid
-from src.places.utils.prompts import generate_description_prompt
+from src.places.schemas.geo import BoundingBoxQuery, NearbyQuery
+from src.places.schemas.places import (
+    PLACE_RESPONSE_FIELDS,
+    PlaceCreationRequest,
+    PlaceResponse,
+    PlaceUpdateRequest,
+    get_place_list_adapter,
+    get_place_response_model,
+)
+from src.places.services.place_clusters import PlaceClusterService
+from src.places.utils.location_utils import (
+    canonicalize_location,
+    format_location,
+    generate_cache_key,
+    get_known_location_data,
+    is_location_valid,
+    project_location_data,
+)
+from src.repositories.session_router import SessionRouter
+from src.repositories.unit_of_work import UnitOfWork
 from src.services.cache import CacheService
+from src.utils.metrics import HitRateCounter
 
 
 logger = logging.getLogger(__name__)
 
 
+# Geo cache hits and misses per canonical location key
+geo_cache_stats = HitRateCounter()
+
+# Columns a place cannot be without
+REQUIRED_PLACE_FIELDS = ('place_name', 'city', 'country', 'place_type')
+
+# Sort fields of cursor pages, with the conversions of their values to and from the cursor
+CURSOR_SORT_FIELDS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    'id': (int, int),
+    'rating': (lambda rating: rating.value, PlaceRating),
+    'visit_date': (date.isoformat, date.fromisoformat),
+}
+
+
 class PlaceService:
     def __init__(
         self,
         place_repository: Annotated[PlaceRepository, Depends(PlaceRepository)],
         geo_repository: Annotated[GeoRepository, Depends(GeoRepository)],
         cache_service: Annotated[CacheService, Depends(CacheService)],
-        openai_repository: Annotated[
-            DescriptionOpenAIRepository, Depends(DescriptionOpenAIRepository)
-        ],
+        enrichment_queue: Annotated[PlaceEnrichmentQueue, Depends(PlaceEnrichmentQueue)],
+        unit_of_work: Annotated[UnitOfWork, Depends(UnitOfWork)],
     ):
         self.place_repository = place_repository
+        self.unit_of_work = unit_of_work
         self.geo_repository = geo_repository
         self.cache_service = cache_service
-        self.openai_repository = openai_repository
+        self.enrichment_queue = enrichment_queue
 
     async def create_place(self, user_id: int, place_data: PlaceCreationRequest) -> PlaceResponse:
         """
         Creates a new place after validating and formatting the data.
 
-        Validates the location (city and country), checks for uniqueness,
-        and then creates a new place entry.
+        Validates the location (city and country) and then creates a new place
+        entry, unless the user already has it. The description and photo are
+        generated in the background after the place is stored.
+
+        Database work happens in short transactions, no connection is held while
+        the location is validated by the geo service.
         """
+        await self.unit_of_work.release()
 
         # Format the city and country before validation
         formatted_city, formatted_country = format_location(
             city=place_data.city, country=place_data.country
         )
 
-        # Validate the city and country
-        await self._validate_location(city=formatted_city, country=formatted_country)
+        # Validate the city and country on first use and get their location
+        location = await self._get_location(city=formatted_city, country=formatted_country)
 
-        # Ensure that the place is unique for the user
-        await self._ensure_place_is_unique(
-            user_id=user_id, place_data=place_data, formatted_city=formatted_city
-        )
-
-        # Generate description for the place
-        place_detail = await self._generate_place_detail(
-            place_data=place_data, city=formatted_city, country=formatted_country
-        )
+        async with self.unit_of_work.session() as session:
+            place = await PlaceRepository(db_session=session).create_place(
+                place=place_data.model_copy(
+                    update={'city': formatted_city, 'country': formatted_country}
+                ),
+                user_id=user_id,
+                location=location,
+            )
+        if not place:
+            raise PlaceAlreadyExistsError(
+                place_name=place_data.place_name,
+                city=formatted_city,
+                place_type=place_data.place_type,
+            )
+        await PlaceClusterService.invalidate(user_id=user_id)
+        await SessionRouter.mark_write(user_id=user_id)
 
-        place = await self.place_repository.create_place(
-            place=place_data,
-            user_id=user_id,
-            place_detail=place_detail,
+        # Enqueue generation of the description, a place left pending is requeued later
+        await self.enrichment_queue.enqueue(
+            job=PlaceEnrichmentJob(place_id=place.id, user_id=user_id)
         )
 
         return PlaceResponse.model_validate(place)
 
-    async def _generate_place_detail(
-        self, place_data: PlaceCreationRequest, city: str, country: str
-    ) -> PlaceDetailResponse:
+    async def _get_location(self, city: str, country: str) -> Location:
         """
-        Generates a description for a place using OpenAI.
+        Returns the location, validating and storing it the first time it is used;
+        afterwards it is a local lookup by the canonical names.
         """
-        description_prompt = generate_description_prompt(
-            place_name=place_data.place_name,
-            city=city,
-            country=country,
-        )
+        canonical_city, canonical_country = canonicalize_location(city=city, country=country)
 
-        try:
-            description_response = await self.openai_repository.get_place_detail(
-                prompt=description_prompt
-            )
-            return PlaceDetailResponse(
-                description=description_response.description,
-                photo_url=description_response.photo_url,
+        async with self.unit_of_work.session() as session:
+            location = await LocationRepository(db_session=session).get_location(
+                city=canonical_city, country=canonical_country
             )
+        if location is not None:
+            if location.latitude is None or location.longitude is None:
+                await self._add_location_coordinates(location=location, city=city, country=country)
+            return location
 
-        except Exception as e:
-            logger.error(f'Error generating description: {e}')
-            raise OpenAIError()
+        location_data = await self._validate_location(city=city, country=country)
 
-    async def _ensure_place_is_unique(
-        self, user_id: int, place_data: PlaceCreationRequest, formatted_city: str
-    ) -> None:
+        async with self.unit_of_work.session() as session:
+            return await LocationRepository(db_session=session).create_location(
+                city=canonical_city, country=canonical_country, location_data=location_data
+            )
+
+    async def _add_location_coordinates(self, location: Location, city: str, country: str) -> None:
         """
-        Ensures that the place is unique for the user by checking if it already exists.
+        Validates a location stored without coordinates, e.g. by the migration that
+        created the locations, and adds its coordinates if the validation has them.
+        The location stays usable if it cannot be validated now.
         """
-        existing_place = await self.place_repository.get_place_by_details(
-            user_id=user_id,
-            place_name=place_data.place_name,
-            city=formatted_city,
-            place_type=place_data.place_type,
-            visit_date=place_data.visit_date,
-        )
-        if existing_place:
-            raise PlaceAlreadyExistsError(
-                place_name=place_data.place_name,
-                city=formatted_city,
-                place_type=place_data.place_type,
+        try:
+            location_data = await self._validate_location(city=city, country=country)
+        except (LocationValidationError, GeoServiceError) as e:
+            logger.warning(f'Failed to get the coordinates of location {location.id}: {e}')
+            return
+
+        if 'geometry' not in location_data:
+            return
+
+        async with self.unit_of_work.session() as session:
+            user_ids = await LocationRepository(db_session=session).add_coordinates(
+                location=location, location_data=location_data
             )
+        for user_id in user_ids:
+            await PlaceClusterService.invalidate(user_id=user_id)
 
-    async def _validate_location(self, city: str, country: str) -> None:
+    async def _validate_location(self, city: str, country: str) -> dict[str, dict]:
         """
-        Validates the city and country using the geo repository or cache.
+        Validates the city and country using the gazetteer, falling back to the
+        geo repository or cache for locations it does not know, and returns the
+        components and coordinates of the location found by either.
         """
+        known_location_data = get_known_location_data(city=city, country=country)
+        if known_location_data is not None:
+            return known_location_data
+
         location_data = await self._get_location_data(city=city, country=country)
         components = location_data.get('components', {})
 
         if not is_location_valid(components=components, city=city, country=country):
             raise LocationValidationError(city=city, country=country)
 
-    async def _get_location_data(self, city: str, country: str) -> dict[str, str]:
+        return location_data
+
+    async def _get_location_data(self, city: str, country: str) -> dict[str, dict]:
         """
         Retrieves location data from cache or geo repository.
 
         If the data is not in the cache, fetches it from the geo repository and
-        stores it in the cache.
+        stores it in the cache; concurrent misses share a single request and
+        unknown locations are cached as well, for a shorter time.
         """
-        cached_data = await self._get_cache_data(city=city, country=country)
-        if cached_data:
-            return cached_data
+        cache_key = generate_cache_key(city=city, country=country)
+        fetched = False
+
+        async def fetch_location_data() -> dict[str, dict]:
+            nonlocal fetched
+            fetched = True
+            return await self._fetch_location_data(city=city, country=country)
+
+        location_data = await self.cache_service.get_or_set(
+            key=cache_key, loader=fetch_location_data
+        )
+        geo_cache_stats.record(key=cache_key, hit=not fetched)
 
-        location_data = await self.geo_repository.get_location_data(city=city, country=country)
         if not location_data:
             raise LocationValidationError(city=city, country=country)
 
-        # Store the data in the cache
-        cache_key = generate_cache_key(city=city, country=country)
-        await self.cache_service.set_cache(key=cache_key, value=location_data)
-
         return location_data
 
-    async def _get_cache_data(self, city: str, country: str) -> dict[str, str] | None:
+    async def _fetch_location_data(self, city: str, country: str) -> dict[str, dict]:
         """
-        Retrieves the location data from the cache using the generated key.
+        Fetches the location from the geo repository, keeping only the components
+        needed to validate it and its coordinates; an empty dict means that the
+        location is unknown.
         """
-        cache_key = generate_cache_key(city=city, country=country)
+        location_data = await self.geo_repository.get_location_data(city=city, country=country)
+        if not location_data:
+            return {}
 
-        return await self.cache_service.get_cache(key=cache_key)
+        return project_location_data(location_data)
 
     async def get_places(
-        self, user_id: int, filters: PlaceFilter, offset: int, limit: int
-    ) -> list[PlaceResponse]:
+        self,
+        user_id: int,
+        filters: PlaceFilter,
+        offset: int,
+        limit: int,
+        fields: tuple[str, ...] = PLACE_RESPONSE_FIELDS,
+    ) -> list[BaseModel]:
         """
         Retrieves a list of places for a given user with the provided filters,
-        offset, and limit for pagination.
+        offset, and limit for pagination, with only the given fields.
         """
         places = await self.place_repository.get_places_by_user(
-            user_id=user_id, filters=filters, offset=offset, limit=limit
+            user_id=user_id, filters=filters, offset=offset, limit=limit, fields=fields
+        )
+
+        place_list_adapter = get_place_list_adapter(fields)
+        return place_list_adapter.validate_python([place._mapping for place in places])
+
+    async def get_places_page(
+        self, user_id: int, filters: PlaceFilter, cursor: str | None, limit: int
+    ) -> CursorPage[PlaceResponse]:
+        """
+        Retrieves a page of places for a given user with the provided filters,
+        continuing after the place encoded in the cursor of the previous page.
+        """
+        if filters.order_by and len(filters.order_by) > 1:
+            raise InvalidCursorError(message='Cursor pagination supports sorting by one field.')
+
+        sort = filters.order_by[0].lstrip('+') if filters.order_by else 'id'
+        sort_field = sort.lstrip('-')
+
+        after = None
+        if cursor is not None:
+            after = self._decode_place_cursor(cursor=cursor, sort=sort)
+
+        places = await self.place_repository.get_places_page(
+            user_id=user_id,
+            filters=filters,
+            sort_field=sort_field,
+            descending=sort.startswith('-'),
+            after=after,
+            limit=limit + 1,
+        )
+
+        next_cursor = None
+        if len(places) > limit:
+            places = places[:limit]
+            value = getattr(places[-1], sort_field)
+            next_cursor = encode_cursor(
+                {
+                    'sort': sort,
+                    'value': None if value is None else CURSOR_SORT_FIELDS[sort_field][0](value),
+                    'id': places[-1].id,
+                }
+            )
+
+        return CursorPage[PlaceResponse](
+            items=[PlaceResponse.model_validate(place) for place in places],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _decode_place_cursor(cursor: str, sort: str) -> tuple[Any, int]:
+        """
+        Returns the (sort value, ID) of the cursor, which must come from a page
+        with the same sort order.
+        """
+        try:
+            values = decode_cursor(cursor)
+            if values.get('sort') != sort:
+                raise ValueError('Cursor of a different sort order')
+
+            value = values['value']
+            if value is not None:
+                value = CURSOR_SORT_FIELDS[sort.lstrip('-')][1](value)
+
+            return value, int(values['id'])
+
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursorError()
+
+    async def get_places_nearby(
+        self, user_id: int, query: NearbyQuery, offset: int, limit: int
+    ) -> list[PlaceResponse]:
+        """
+        Retrieves the places of the user within the radius of the point.
+        """
+        places = await self.place_repository.get_places_nearby(
+            user_id=user_id,
+            latitude=query.lat,
+            longitude=query.lng,
+            radius_km=query.radius_km,
+            offset=offset,
+            limit=limit,
         )
 
         return [PlaceResponse.model_validate(place) for place in places]
 
-    async def get_place_by_id(self, place_id: int, user_id: int) -> PlaceResponse:
+    async def get_places_within(
+        self, user_id: int, query: BoundingBoxQuery, offset: int, limit: int
+    ) -> list[PlaceResponse]:
         """
-        Retrieves a place by its ID and user ID.
+        Retrieves the places of the user within the bounding box.
+        """
+        places = await self.place_repository.get_places_in_bounding_box(
+            user_id=user_id,
+            min_lat=query.min_lat,
+            min_lng=query.min_lng,
+            max_lat=query.max_lat,
+            max_lng=query.max_lng,
+            offset=offset,
+            limit=limit,
+        )
+
+        return [PlaceResponse.model_validate(place) for place in places]
+
+    async def get_place_by_id(
+        self, place_id: int, user_id: int, fields: tuple[str, ...] = PLACE_RESPONSE_FIELDS
+    ) -> BaseModel:
+        """
+        Retrieves a place by its ID and user ID, with only the given fields.
+        """
+        place = await self.place_repository.get_place_by_id(
+            place_id=place_id, user_id=user_id, fields=fields
+        )
+        if not place:
+            raise PlaceNotFoundError(place_id=place_id)
+
+        return get_place_response_model(fields).model_validate(place._mapping)
+
+    async def get_enrichment_status(self, place_id: int, user_id: int) -> PlaceEnrichmentResponse:
+        """
+        Retrieves the enrichment status of a place by its ID and user ID.
         """
         place = await self.place_repository.get_place_by_id(place_id=place_id, user_id=user_id)
         if not place:
             raise PlaceNotFoundError(place_id=place_id)
 
-        return PlaceResponse.model_validate(place)
+        return PlaceEnrichmentResponse(place_id=place.id, enrichment_status=place.enrichment_status)
 
     async def update_place_by_id(self, place_id: int, user_id: int, place_data: PlaceUpdateRequest):
         """
-        Updates an existing place by its ID, ensuring that the city and country
-        are properly formatted and validated before saving the changes.
+        Updates the fields of an existing place sent by the client. The city and
+        country are formatted and validated only if they differ from the stored ones.
         """
-        # Format the city and country before validation
-        formatted_city, formatted_country = format_location(
-            city=place_data.city, country=place_data.country
-        )
-        # Validate the city and country
-        await self._validate_location(city=formatted_city, country=formatted_country)
+        changes = place_data.model_dump(exclude_unset=True)
+        # A place always has a name, type and location, null leaves them unchanged
+        for field_name in REQUIRED_PLACE_FIELDS:
+            if field_name in changes and changes[field_name] is None:
+                del changes[field_name]
+
+        if not changes:
+            return await self.get_place_by_id(place_id=place_id, user_id=user_id)
+
+        location = None
+        if 'city' in changes or 'country' in changes:
+            await self.unit_of_work.release()
+            location = await self._get_changed_location(
+                place_id=place_id, user_id=user_id, changes=changes
+            )
 
-        # Perform the update in the repository.
-        place = await self.place_repository.update_place(
-            place_id=place_id, user_id=user_id, place_data=place_data
-        )
+        async with self.unit_of_work.session() as session:
+            place = await PlaceRepository(db_session=session).update_place(
+                place_id=place_id, user_id=user_id, place_data=changes, location=location
+            )
         if not place:
             raise PlaceNotFoundError(place_id=place_id)
+        await PlaceClusterService.invalidate(user_id=user_id)
+        await SessionRouter.mark_write(user_id=user_id)
 
         return PlaceResponse.model_validate(place)
 
+    async def _get_changed_location(
+        self, place_id: int, user_id: int, changes: dict[str, Any]
+    ) -> Location | None:
+        """
+        Compares the sent city and country with the stored ones and returns the new
+        location, or None if it did not change; the changes are updated in place
+        with the formatted names, or without them.
+        """
+        async with self.unit_of_work.session() as session:
+            stored_place = await PlaceRepository(db_session=session).get_place_by_id(
+                place_id=place_id, user_id=user_id
+            )
+        if not stored_place:
+            raise PlaceNotFoundError(place_id=place_id)
+
+        formatted_city, formatted_country = format_location(
+            city=changes.get('city', stored_place.city),
+            country=changes.get('country', stored_place.country),
+        )
+        if canonicalize_location(
+            city=formatted_city, country=formatted_country
+        ) == canonicalize_location(city=stored_place.city, country=stored_place.country):
+            changes.pop('city', None)
+            changes.pop('country', None)
+            return None
+
+        changes.update(city=formatted_city, country=formatted_country)
+
+        # Validate the city and country on first use and get their location
+        return await self._get_location(city=formatted_city, country=formatted_country)
+
     async def delete_place_by_id(self, place_id: int, user_id: int) -> None:
         """
         Deletes a place by its ID, ensuring that the place exists and is owned by the user.
@@ -207,3 +434,5 @@ class PlaceService:
         deleted = await self.place_repository.delete_place(place_id=place_id, user_id=user_id)
         if not deleted:
             raise PlaceNotFoundError(place_id=place_id)
+        await PlaceClusterService.invalidate(user_id=user_id)
+        await SessionRouter.mark_write(user_id=user_id)
@@ -0,0 +1,123 @@
+import math
+
+from src.places.constants import GEOHASH_MAX_COVERING_CELLS, GEOHASH_PRECISION
+
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Encodes the coordinates into a geohash; nearby points share long prefixes and
+    the hashes of a cell sort together, so a prefix is a range of a B-tree index.
+    """
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    geohash, bits, bit_count, even_bit = [], 0, 0, True
+
+    while len(geohash) < precision:
+        value, value_range = (longitude, lng_range) if even_bit else (latitude, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = bits << 1 | 1
+            value_range[0] = middle
+        else:
+            bits <<= 1
+            value_range[1] = middle
+
+        even_bit = not even_bit
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+
+    return ''.join(geohash)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """Returns the height and width in degrees of the cells of a precision."""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def covering_prefixes(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    max_cells: int = GEOHASH_MAX_COVERING_CELLS,
+    max_precision: int = GEOHASH_PRECISION,
+) -> list[str]:
+    """
+    Returns the sorted geohash prefixes of the cells covering the bounding box,
+    using the longest prefixes, up to `max_precision`, for which at most
+    `max_cells` cells are needed. A box whose minimum longitude exceeds the
+    maximum one crosses the antimeridian.
+    """
+    for precision in range(max_precision, 0, -1):
+        height, width = cell_size(precision)
+        first_row, last_row = _cell_index(min_lat + 90, height), _cell_index(max_lat + 90, height)
+        last_row = min(last_row, round(180 / height) - 1)
+        columns = [
+            column
+            for range_min_lng, range_max_lng in longitude_ranges(min_lng, max_lng)
+            for column in range(
+                _cell_index(range_min_lng + 180, width),
+                min(_cell_index(range_max_lng + 180, width), round(360 / width) - 1) + 1,
+            )
+        ]
+
+        if (last_row - first_row + 1) * len(columns) > max_cells:
+            continue
+
+        return sorted(
+            {
+                encode_geohash(-90 + (row + 0.5) * height, -180 + (col + 0.5) * width, precision)
+                for row in range(first_row, last_row + 1)
+                for col in columns
+            }
+        )
+
+    # The box is larger than the coarsest cells allow, every geohash matches
+    return ['']
+
+
+def longitude_ranges(min_lng: float, max_lng: float) -> list[tuple[float, float]]:
+    """
+    Returns the longitude ranges of a box, split in two at the antimeridian if the
+    minimum longitude exceeds the maximum one.
+    """
+    if min_lng <= max_lng:
+        return [(min_lng, max_lng)]
+
+    return [(min_lng, 180.0), (-180.0, max_lng)]
+
+
+def prefix_ranges(prefixes: list[str]) -> list[tuple[str, str | None]]:
+    """
+    Merges sorted prefixes into half-open [start, end) ranges of geohashes, joining
+    prefixes that follow each other; a range without an end is open-ended.
+    """
+    ranges: list[tuple[str, str | None]] = []
+    for prefix in prefixes:
+        if ranges and ranges[-1][1] == prefix:
+            ranges[-1] = (ranges[-1][0], next_prefix(prefix))
+        else:
+            ranges.append((prefix, next_prefix(prefix)))
+
+    return ranges
+
+
+def next_prefix(prefix: str) -> str | None:
+    """Returns the first prefix of the same length after all hashes starting with the prefix."""
+    stripped = prefix.rstrip(GEOHASH_ALPHABET[-1])
+    if not stripped:
+        return None
+
+    next_char = GEOHASH_ALPHABET[GEOHASH_ALPHABET.index(stripped[-1]) + 1]
+    return stripped[:-1] + next_char + GEOHASH_ALPHABET[0] * (len(prefix) - len(stripped))
+
+
+def _cell_index(offset: float, size: float) -> int:
+    return max(int(offset // size), 0)
@@ -1,32 +1,144 @@
+import unicodedata
 from string import Template
 
-from src.places.constants import PLACES_CACHE_KEY
+from src.places.constants import (
+    CITY_ALIASES,
+    COUNTRY_ALIASES,
+    LOCATION_COMPONENT_KEYS,
+    LOCATION_GEOMETRY_KEYS,
+    PLACES_CACHE_KEY,
+)
+from src.places.dependencies import get_gazetteer
+
+
+def fold_name(name: str) -> str:
+    """
+    Folds a name into lowercase without diacritics, dots and repeated whitespace.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+    return ' '.join(stripped.replace('.', '').split()).casefold()
+
+
+def canonicalize_location(city: str, country: str) -> tuple[str, str]:
+    """
+    Maps the spellings, ISO codes and exonyms of a location to one folded
+    (city, country) pair, e.g. "Kiev, USA" and "kyiv, United States of America"
+    both become ("kyiv", "united states"). A city of an empty or unknown country
+    is looked up among the cities of all countries.
+    """
+    canonical_city, canonical_country = fold_name(city), fold_name(country)
+
+    gazetteer = get_gazetteer()
+    if gazetteer is not None:
+        country_match = gazetteer.find_country(country) if country else None
+        country_code = ''
+        if country_match is not None:
+            country_code, country_name = country_match
+            canonical_country = fold_name(country_name)
+
+        city_name = gazetteer.find_city(city, country_code) if city else None
+        if city_name is not None:
+            canonical_city = fold_name(city_name)
+
+    return (
+        CITY_ALIASES.get(canonical_city, canonical_city),
+        COUNTRY_ALIASES.get(canonical_country, canonical_country),
+    )
+
+
+def canonicalize_city(city: str, country: str = '') -> str:
+    """
+    Maps the spellings and exonyms of a city name, of the country if one is given,
+    to the folded name stored for its location.
+    """
+    return canonicalize_location(city=city, country=country)[0]
+
+
+def canonicalize_country(country: str) -> str:
+    """
+    Maps the spellings, ISO codes and exonyms of a country to the folded name
+    stored for its locations.
+    """
+    return canonicalize_location(city='', country=country)[1]
 
 
 def generate_cache_key(city: str, country: str) -> str:
     """
-    Generates a cache key for location data based on city and country.
+    Generates a cache key for location data based on the canonical city and country.
     """
+    canonical_city, canonical_country = canonicalize_location(city=city, country=country)
     cache_key_template = Template(template=PLACES_CACHE_KEY)
 
-    return cache_key_template.substitute(city=city, country=country)
+    return cache_key_template.substitute(city=canonical_city, country=canonical_country)
 
 
 def format_location(city: str, country: str) -> tuple[str, str]:
     """
-    Formats the city and country into title case.
+    Formats the city and country into their canonical names from the gazetteer,
+    or into title case if the gazetteer does not know the location.
     """
+    gazetteer = get_gazetteer()
+    location = gazetteer.resolve(city=city, country=country) if gazetteer else None
+    if location is not None:
+        return location.city, location.country
+
     formatted_city = city.strip().title()
     formatted_country = country.strip().title()
 
     return formatted_city, formatted_country
 
 
+def project_location_data(location_data: dict) -> dict[str, dict]:
+    """
+    Keeps only the address components used to validate a location and its coordinates.
+    """
+    components = location_data.get('components', {})
+    geometry = location_data.get('geometry', {})
+
+    projection = {
+        'components': {key: components[key] for key in LOCATION_COMPONENT_KEYS if key in components}
+    }
+    if all(key in geometry for key in LOCATION_GEOMETRY_KEYS):
+        projection['geometry'] = {key: geometry[key] for key in LOCATION_GEOMETRY_KEYS}
+
+    return projection
+
+
+def get_known_location_data(city: str, country: str) -> dict[str, dict] | None:
+    """
+    Returns the names and coordinates of a location the gazetteer knows, in the
+    form of the projected geo service data; unknown locations may still exist
+    and have to be validated by the geo service.
+    """
+    gazetteer = get_gazetteer()
+    location = gazetteer.resolve(city=city, country=country) if gazetteer else None
+    if location is None:
+        return None
+
+    return {
+        'components': {'city': location.city, 'country': location.country},
+        'geometry': {'lat': location.latitude, 'lng': location.longitude},
+    }
+
+
 def is_location_valid(components: dict[str, str], city: str, country: str) -> bool:
     """
-    Checks if the API response matches the provided city and country.
+    Checks if the API response matches the provided city and country, comparing
+    their canonical forms so that aliases match as well.
     """
-    return (
-        components.get('city', '').lower() == city.lower()
-        and components.get('country', '').lower() == country.lower()
-    )
+    if not components.get('city') or not components.get('country'):
+        return False
+
+    return canonicalize_location(
+        city=components['city'], country=components['country']
+    ) == canonicalize_location(city=city, country=country)
+
+
+def normalize_place_key(place_name: str, city: str, country: str) -> tuple[str, str, str]:
+    """
+    Normalizes the place name, city and country into a case and whitespace
+    insensitive key shared by all users adding the same place.
+    """
+    return tuple(' '.join(value.split()).lower() for value in (place_name, city, country))
@@ -0,0 +1,37 @@
+import time
+
+from sqlalchemy import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry
+
+from src.utils.metrics import LatencyStats
+
+
+# Time checkouts of the worker spend waiting for a pooled connection
+pool_wait_stats = LatencyStats()
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_stats.record(time.perf_counter() - started)
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, int]:
+    """Returns the current utilization of the connection pool of the engine."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+
+    return {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        # The counter starts below zero until the pool has opened `size` connections
+        'overflow': max(pool.overflow(), 0),
+    }
@@ -1,22 +1,57 @@
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
 
+from src.repositories.pool_metrics import TimedAsyncQueuePool
 from src.settings import settings
 
 
 Base = declarative_base()
 
-engine = create_async_engine(
-    settings.database_url,
-    future=True,
-    echo=True,
-)
+
+def create_database_engine(database_url: str) -> AsyncEngine:
+    """Creates an engine with the pool and driver options from the settings."""
+    statement_cache_size = (
+        0 if settings.postgres_pgbouncer else settings.postgres_statement_cache_size
+    )
+    connect_args = {
+        'statement_cache_size': statement_cache_size,
+        'prepared_statement_cache_size': statement_cache_size,
+    }
+    if settings.postgres_pgbouncer:
+        # Unique names keep statements of clients sharing a server connection apart
+        connect_args['prepared_statement_name_func'] = lambda: f'__asyncpg_{uuid4()}__'
+
+    return create_async_engine(
+        database_url,
+        future=True,
+        echo=settings.postgres_echo,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=settings.postgres_pool_size,
+        max_overflow=settings.postgres_max_overflow,
+        pool_timeout=settings.postgres_pool_timeout,
+        pool_recycle=settings.postgres_pool_recycle,
+        pool_pre_ping=settings.postgres_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
+engine = create_database_engine(settings.database_url)
 
 async_session = async_sessionmaker(
     bind=engine,
     autocommit=False,
     autoflush=False,
+    # Objects stay usable after the short transactions they were loaded or written in
+    expire_on_commit=False,
 )
+
+# Read replicas answer read-only queries, see src.repositories.session_router
+replica_engines = [
+    create_database_engine(replica_url) for replica_url in settings.replica_database_urls
+]
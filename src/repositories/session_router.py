@@ -0,0 +1,93 @@
+import itertools
+import logging
+import time
+from string import Template
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.services.cache import CacheService
+
+
+logger = logging.getLogger(__name__)
+
+
+PRIMARY_READS_CACHE_KEY = 'db_primary_reads_${user_id}'
+
+# Longer than the replication lag the replicas are expected to have
+PRIMARY_READS_SECONDS = 5
+
+# How long a replica that failed to connect is left out of the rotation
+REPLICA_RETRY_SECONDS = 30
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            bind=engine, autocommit=False, autoflush=False, expire_on_commit=False
+        )
+        self.unhealthy_until = 0.0
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.unhealthy_until <= time.monotonic()
+
+    def mark_unhealthy(self) -> None:
+        self.unhealthy_until = time.monotonic() + REPLICA_RETRY_SECONDS
+
+
+class SessionRouter:
+    """
+    Routes read-only queries to the read replicas in turn, skipping the ones that
+    recently failed to connect, and falls back to the primary without replicas.
+
+    Reads of a user go to the primary for a few seconds after their writes, so
+    they see them regardless of the replication lag.
+    """
+
+    def __init__(self, replicas: list[AsyncEngine]):
+        self.replicas = [Replica(engine=engine) for engine in replicas]
+        self._turns = itertools.count()
+
+        for replica in self.replicas:
+            event.listen(replica.engine.sync_engine, 'handle_error', self._handle_error(replica))
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def replica_session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Returns the session factory of the next healthy replica, if there is one."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._turns) % len(self.replicas)]
+            if replica.is_healthy:
+                return replica.session_factory
+
+        return None
+
+    @staticmethod
+    async def reads_from_primary(user_id: int) -> bool:
+        """Checks if the user wrote recently enough to read from the primary."""
+        cache_key = Template(PRIMARY_READS_CACHE_KEY).substitute(user_id=user_id)
+        return await CacheService.get_cache(cache_key) is not None
+
+    @staticmethod
+    async def mark_write(user_id: int) -> None:
+        """Sends the reads of the user to the primary for the next few seconds."""
+        await CacheService.set_cache(
+            Template(PRIMARY_READS_CACHE_KEY).substitute(user_id=user_id),
+            {'written_at': time.time()},
+            ttl=PRIMARY_READS_SECONDS,
+        )
+
+    @staticmethod
+    def _handle_error(replica: Replica):
+        def handle_error(context: ExceptionContext) -> None:
+            # Failed connection attempts have no connection in the context
+            if context.is_disconnect or context.connection is None:
+                logger.warning(f'Read replica {replica.engine.url.host} is unavailable')
+                replica.mark_unhealthy()
+
+        return handle_error
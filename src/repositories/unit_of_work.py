@@ -0,0 +1,38 @@
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.dependencies import get_db, get_session_factory
+
+
+class UnitOfWork:
+    """
+    Short transactions for write paths that also call external services.
+
+    Each `session()` block checks a connection out for its first query and returns it
+    to the pool when it ends, so no connection is held while the service waits
+    on the network between blocks.
+    """
+
+    def __init__(
+        self,
+        db_session: Annotated[AsyncSession, Depends(get_db)],
+        session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
+    ):
+        self.db_session = db_session
+        self.session_factory = session_factory
+
+    async def release(self) -> None:
+        """
+        Ends the transaction the request session may have open from earlier reads,
+        such as loading the current user, returning its connection to the pool.
+        """
+        if self.db_session.in_transaction():
+            await self.db_session.commit()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        async with self.session_factory() as session:
+            yield session
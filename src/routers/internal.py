@@ -0,0 +1,76 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from starlette import status
+
+from src.places.services.places import geo_cache_stats
+from src.repositories.pool_metrics import get_pool_stats, pool_wait_stats
+from src.repositories.postgres_base import engine, replica_engines
+from src.services.cache import CacheService
+from src.services.http_clients import http_clients
+from src.settings import settings
+
+
+def verify_internal_token(x_internal_token: Annotated[str | None, Header()] = None) -> None:
+    """
+    Lets through requests with the internal API token; without a configured
+    token, or with a wrong one, the endpoints do not exist.
+    """
+    if (
+        not settings.internal_api_token
+        or x_internal_token is None
+        or not secrets.compare_digest(x_internal_token, settings.internal_api_token)
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Not Found')
+
+
+router = APIRouter(
+    tags=['internal'],
+    prefix='/internal',
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+
+
+@router.get(
+    '/http-pools',
+    status_code=status.HTTP_200_OK,
+    summary='Get utilization of the outbound HTTP connection pools',
+)
+async def get_http_pool_stats() -> dict[str, dict[str, int | bool]]:
+    return http_clients.stats()
+
+
+@router.get(
+    '/cache',
+    status_code=status.HTTP_200_OK,
+    summary='Get utilization of the in-process cache tier',
+)
+async def get_cache_stats() -> dict[str, int]:
+    return CacheService.local_stats()
+
+
+@router.get(
+    '/geo-cache',
+    status_code=status.HTTP_200_OK,
+    summary='Get hit rates of the geo cache per canonical location',
+)
+async def get_geo_cache_stats(top: int = Query(50, ge=1, le=1000)) -> dict:
+    return geo_cache_stats.stats(top=top)
+
+
+@router.get(
+    '/db-pool',
+    status_code=status.HTTP_200_OK,
+    summary='Get utilization of the database connection pools and the time spent waiting on them',
+)
+async def get_db_pool_stats() -> dict:
+    return {
+        'primary': get_pool_stats(engine),
+        'replicas': {
+            f'{replica.url.host}:{replica.url.port}': get_pool_stats(replica)
+            for replica in replica_engines
+        },
+        'wait': pool_wait_stats.stats(),
+    }
@@ -1,9 +1,20 @@
-import json
+import asyncio
 import logging
+import math
+import random
+import secrets
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, NamedTuple
 
 import redis.asyncio as redis
+from pydantic import BaseModel
 
+from src.services.cache_codecs import decode_value, encode_value
 from src.settings import settings
+from src.utils.lru_cache import TTLLRUCache
+from src.utils.singleflight import SingleFlight
 
 
 logger = logging.getLogger(__name__)
@@ -12,24 +23,260 @@ logger = logging.getLogger(__name__)
 redis_client = redis.from_url(settings.redis_url)
 
 
+class CachePolicy(BaseModel):
+    """Expiration rules of the keys of a namespace."""
+
+    # Lifetime of the value in Redis
+    ttl: int = 3600
+    # How long a worker serves the value from memory, 0 disables the local tier; the
+    # local copies of other workers are not invalidated, so only namespaces that
+    # tolerate stale values opt in
+    local_ttl: float = 0
+    # How long `get_or_set` may serve an expired local value while it is refreshed
+    stale_ttl: float = 0
+    # Eagerness of the probabilistic early refresh, 0 disables it
+    beta: float = 1.0
+    # Lifetime of empty values (negative results) stored by `get_or_set`, defaults to `ttl`
+    negative_ttl: int | None = None
+    # How long a worker loading a missing value keeps the others waiting, 0 disables it
+    lock_ms: int = 0
+
+
+DEFAULT_CACHE_POLICY = CachePolicy()
+
+# Policies by key prefix, the longest matching prefix wins
+CACHE_POLICIES = {
+    'geo_': CachePolicy(ttl=3600, local_ttl=300, stale_ttl=600, negative_ttl=300, lock_ms=5000),
+    # One-time values, a state used or deleted on one worker must not live on in another
+    'google_oauth_state_': CachePolicy(ttl=100, local_ttl=0),
+    # Tiles are keyed by the version of the places of the user, bumped on every change
+    'place_clusters_tile_': CachePolicy(ttl=3600, local_ttl=60),
+    'place_clusters_version_': CachePolicy(ttl=24 * 3600, local_ttl=0),
+    # The worker that served a write keeps reading from the primary even without Redis
+    'db_primary_reads_': CachePolicy(ttl=5, local_ttl=5),
+    # These namespaces keep their own local tier with explicit invalidation
+    'principal_': CachePolicy(ttl=60, local_ttl=0),
+    'place_description_': CachePolicy(ttl=7 * 24 * 3600, local_ttl=0),
+}
+
+LOCAL_CACHE_SIZE = 10_000
+LOCAL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Rough per-entry overhead of the key, the decoded objects and the LRU bookkeeping
+LOCAL_CACHE_ENTRY_OVERHEAD = 256
+
+RECOMPUTE_TIME_SUFFIX = ':delta'
+
+LOCK_SUFFIX = ':lock'
+LOCK_POLL_INTERVAL = 0.05
+# Deletes the lock only if it is still held by the caller
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _LocalEntry(NamedTuple):
+    value: Any
+    fresh_until: float
+
+
+class _CacheWrite(NamedTuple):
+    """A pending write; writes without data are deletions."""
+
+    key: str
+    value: Any = None
+    data: bytes | None = None
+    ttl: int | None = None
+
+
+class _WriteBatch:
+    def __init__(self):
+        self.writes: dict[str, _CacheWrite] = {}
+        self.closed = False
+
+
+_local_cache = TTLLRUCache(
+    maxsize=LOCAL_CACHE_SIZE, ttl=DEFAULT_CACHE_POLICY.local_ttl, maxbytes=LOCAL_CACHE_MAX_BYTES
+)
+_revalidating = SingleFlight()
+_recomputing = SingleFlight()
+_background_tasks: set[asyncio.Task] = set()
+_write_batch: ContextVar[_WriteBatch | None] = ContextVar('cache_write_batch', default=None)
+
+
+def get_cache_policy(key: str) -> CachePolicy:
+    """Returns the policy of the longest prefix matching the key."""
+    matching_prefixes = [prefix for prefix in CACHE_POLICIES if key.startswith(prefix)]
+    if not matching_prefixes:
+        return DEFAULT_CACHE_POLICY
+
+    return CACHE_POLICIES[max(matching_prefixes, key=len)]
+
+
 class CacheService:
+    """
+    Two-tier cache: a bounded in-process LRU in front of Redis.
+
+    Values are stored in Redis in the versioned format of `cache_codecs`, large
+    values compressed; values written before the format was introduced are
+    still read as plain JSON.
+
+    Values are served from the memory of the worker for the `local_ttl` of their
+    namespace, so local reads may lag behind writes made by other workers by up
+    to that long. Values returned from the local tier are shared and must not be
+    mutated by the caller.
+    """
+
     @staticmethod
     async def get_cache(key: str) -> dict | None:
+        found, value = _get_unflushed(key)
+        if found:
+            return value
+
         try:
             cached_data = await redis_client.get(key)
             if cached_data:
-                return json.loads(cached_data)
+                value = decode_value(cached_data)
+                _set_local(key, value, size=len(cached_data))
+                return value
             return None
         except Exception as e:
             logger.error(f'Unexpected error while retrieving data from Redis: {e}')
         return None
 
     @staticmethod
-    async def set_cache(key: str, value: dict, ttl: int = 3600) -> None:
+    async def get_many(keys: list[str]) -> dict[str, dict | None]:
+        """
+        Returns the values of all keys, fetching the ones missing locally with a single MGET.
+        """
+        values: dict[str, dict | None] = {}
+        missing_keys = []
+        for key in keys:
+            found, value = _get_unflushed(key)
+            if found:
+                values[key] = value
+            else:
+                missing_keys.append(key)
+
+        if not missing_keys:
+            return values
+
         try:
-            await redis_client.set(key, json.dumps(value), ex=ttl)
+            cached_values = await redis_client.mget(missing_keys)
         except Exception as e:
-            logger.error(f'Unexpected error while setting data to Redis: {e}')
+            logger.error(f'Unexpected error while retrieving data from Redis: {e}')
+            cached_values = [None] * len(missing_keys)
+
+        for key, cached_data in zip(missing_keys, cached_values):
+            values[key] = None
+            if not cached_data:
+                continue
+
+            try:
+                values[key] = decode_value(cached_data)
+            except ValueError as e:
+                logger.error(f'Failed to decode cached value of {key}: {e}')
+                continue
+
+            _set_local(key, values[key], size=len(cached_data))
+
+        return values
+
+    @staticmethod
+    async def set_cache(key: str, value: dict, ttl: int | None = None) -> None:
+        await CacheService.set_many({key: value}, ttl=ttl)
+
+    @staticmethod
+    async def set_many(values: dict[str, dict], ttl: int | None = None) -> None:
+        """
+        Stores all values in one pipeline, or in the batch of the current request.
+
+        Without an explicit TTL every key expires according to its namespace policy.
+        """
+        writes = []
+        for key, value in values.items():
+            key_ttl = get_cache_policy(key).ttl if ttl is None else ttl
+            cached_data = encode_value(value)
+            _set_local(key, value, size=len(cached_data), ttl=key_ttl)
+            writes.append(_CacheWrite(key=key, value=value, data=cached_data, ttl=key_ttl))
+
+        await _write(writes)
+
+    @staticmethod
+    async def delete_cache(key: str) -> None:
+        await CacheService.delete_many([key])
+
+    @staticmethod
+    async def delete_many(keys: list[str]) -> None:
+        """Deletes all keys in one pipeline, or in the batch of the current request."""
+        for key in keys:
+            _local_cache.delete(key)
+
+        await _write([_CacheWrite(key=key) for key in keys])
+
+    @staticmethod
+    @asynccontextmanager
+    async def batch_writes() -> AsyncIterator[None]:
+        """
+        Buffers the cache writes made inside the block and sends them to Redis
+        in one pipeline when it exits, even if it exits with an error.
+
+        Reads inside the block see the buffered writes. Nested blocks join the
+        outermost one, and writes made after the block exited (e.g. by tasks it
+        started) are sent right away.
+        """
+        if _write_batch.get() is not None:
+            yield
+            return
+
+        batch = _WriteBatch()
+        token = _write_batch.set(batch)
+        try:
+            yield
+        finally:
+            _write_batch.reset(token)
+            batch.closed = True
+            await _flush(list(batch.writes.values()))
+
+    @staticmethod
+    async def get_or_set(
+        key: str, loader: Callable[[], Awaitable[dict | None]], ttl: int | None = None
+    ) -> dict | None:
+        """
+        Returns the cached value, calling the loader to compute it when it is missing.
+
+        Each worker runs at most one load of a key at a time, and namespaces with a
+        `lock_ms` policy also make the other workers wait for it. An expired local value
+        is served while a background task revalidates it, and values close to their
+        Redis expiry are recomputed early with a probability that grows as the
+        expiry approaches (XFetch), so a hot key never expires for everybody at once.
+        """
+        ttl = get_cache_policy(key).ttl if ttl is None else ttl
+
+        entry = _local_cache.get(key)
+        if entry is not None:
+            if entry.fresh_until <= time.monotonic():
+                _spawn(_revalidating, key, lambda: _revalidate(key, loader, ttl))
+            return entry.value
+
+        return await _revalidating.do(key, lambda: _revalidate(key, loader, ttl))
+
+    @staticmethod
+    def clear_local() -> None:
+        """Clears the in-process tier."""
+        _local_cache.clear()
+
+    @staticmethod
+    def local_stats() -> dict[str, int]:
+        """Returns the utilization of the in-process tier."""
+        return {
+            'entries': len(_local_cache),
+            'max_entries': _local_cache.maxsize,
+            'bytes': _local_cache.nbytes,
+            'max_bytes': _local_cache.maxbytes,
+        }
 
     @staticmethod
     async def check_connection() -> bool:
@@ -47,3 +294,195 @@ class CacheService:
         except Exception as e:
             logger.error(f'Error while connecting to Redis: {e}')
             return False
+
+
+def _get_unflushed(key: str) -> tuple[bool, Any]:
+    """Looks the key up in the write batch of the request and in the local tier."""
+    batch = _write_batch.get()
+    if batch is not None and key in batch.writes:
+        return True, batch.writes[key].value
+
+    entry = _local_cache.get(key)
+    if entry is not None and entry.fresh_until > time.monotonic():
+        return True, entry.value
+
+    return False, None
+
+
+async def _write(writes: list[_CacheWrite]) -> None:
+    batch = _write_batch.get()
+    if batch is None or batch.closed:
+        await _flush(writes)
+        return
+
+    for write in writes:
+        batch.writes[write.key] = write
+
+
+async def _flush(writes: list[_CacheWrite]) -> None:
+    if not writes:
+        return
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for write in writes:
+                if write.data is None:
+                    pipe.delete(write.key, write.key + RECOMPUTE_TIME_SUFFIX)
+                else:
+                    pipe.set(write.key, write.data, ex=write.ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f'Unexpected error while writing data to Redis: {e}')
+
+
+def _set_local(key: str, value: Any, size: int, ttl: float | None = None) -> None:
+    policy = get_cache_policy(key)
+    local_ttl = policy.local_ttl if ttl is None else min(policy.local_ttl, ttl)
+    if local_ttl <= 0:
+        return
+
+    _local_cache.set(
+        key,
+        _LocalEntry(value=value, fresh_until=time.monotonic() + local_ttl),
+        ttl=local_ttl + policy.stale_ttl,
+        size=size + LOCAL_CACHE_ENTRY_OVERHEAD,
+    )
+
+
+def _should_refresh_early(recompute_time: float, remaining: float, beta: float) -> bool:
+    """XFetch: refresh when delta * beta * -ln(rand) reaches the remaining lifetime."""
+    if recompute_time <= 0 or beta <= 0:
+        return False
+
+    return recompute_time * beta * -math.log(1.0 - random.random()) >= remaining
+
+
+async def _revalidate(
+    key: str, loader: Callable[[], Awaitable[dict | None]], ttl: int
+) -> dict | None:
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            pipe.get(key + RECOMPUTE_TIME_SUFFIX)
+            cached_data, remaining_ms, recompute_time = await pipe.execute()
+        value = decode_value(cached_data) if cached_data else None
+    except Exception as e:
+        logger.error(f'Unexpected error while retrieving data from Redis: {e}')
+        value = None
+
+    if value is None:
+        return await _recomputing.do(key, lambda: _recompute(key, loader, ttl))
+
+    _set_local(
+        key, value, size=len(cached_data), ttl=remaining_ms / 1000 if remaining_ms > 0 else None
+    )
+
+    if remaining_ms > 0 and _should_refresh_early(
+        recompute_time=float(recompute_time or 0),
+        remaining=remaining_ms / 1000,
+        beta=get_cache_policy(key).beta,
+    ):
+        _spawn(_recomputing, key, lambda: _recompute(key, loader, ttl))
+
+    return value
+
+
+async def _recompute(
+    key: str, loader: Callable[[], Awaitable[dict | None]], ttl: int
+) -> dict | None:
+    policy = get_cache_policy(key)
+
+    lock_token = await _acquire_lock(key, lock_ms=policy.lock_ms)
+    if lock_token is None:
+        # Another worker is loading the value, wait for it before loading it ourselves
+        value = await _wait_for_value(key, timeout_ms=policy.lock_ms)
+        if value is not None:
+            return value
+
+    try:
+        started_at = time.monotonic()
+        value = await loader()
+        if value is None:
+            return None
+
+        recompute_time = time.monotonic() - started_at
+        if not value and policy.negative_ttl is not None:
+            ttl = policy.negative_ttl
+
+        cached_data = encode_value(value)
+        _set_local(key, value, size=len(cached_data), ttl=ttl)
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(key, cached_data, ex=ttl)
+                pipe.set(key + RECOMPUTE_TIME_SUFFIX, f'{recompute_time:.6f}', ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f'Unexpected error while setting data to Redis: {e}')
+
+        return value
+
+    finally:
+        if lock_token:
+            await _release_lock(key, token=lock_token)
+
+
+async def _acquire_lock(key: str, lock_ms: int) -> str | None:
+    """
+    Takes the short-lived load lock of the key shared by all workers.
+
+    Returns the lock token, an empty token if locking is disabled or Redis is not
+    available, or None if another worker holds the lock.
+    """
+    if lock_ms <= 0:
+        return ''
+
+    token = secrets.token_hex(8)
+    try:
+        acquired = await redis_client.set(key + LOCK_SUFFIX, token, nx=True, px=lock_ms)
+    except Exception as e:
+        logger.error(f'Unexpected error while locking {key} in Redis: {e}')
+        return ''
+
+    return token if acquired else None
+
+
+async def _release_lock(key: str, token: str) -> None:
+    try:
+        await redis_client.eval(RELEASE_LOCK_SCRIPT, 1, key + LOCK_SUFFIX, token)
+    except Exception as e:
+        logger.error(f'Unexpected error while unlocking {key} in Redis: {e}')
+
+
+async def _wait_for_value(key: str, timeout_ms: int) -> dict | None:
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            cached_data = await redis_client.get(key)
+            if cached_data:
+                value = decode_value(cached_data)
+                _set_local(key, value, size=len(cached_data))
+                return value
+        except Exception as e:
+            logger.error(f'Unexpected error while retrieving data from Redis: {e}')
+            return None
+
+    return None
+
+
+def _spawn(flight: SingleFlight, key: str, func: Callable[[], Awaitable[Any]]) -> None:
+    """Runs the call in the background unless the same call is already running."""
+    if flight.in_flight(key):
+        return
+
+    task = asyncio.ensure_future(flight.do(key, func))
+    _background_tasks.add(task)
+    task.add_done_callback(_finish_background_task)
+
+
+def _finish_background_task(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f'Background cache refresh failed: {task.exception()}')
@@ -0,0 +1,98 @@
+import importlib.util
+import json
+import zlib
+from typing import Any, Callable, NamedTuple
+
+
+# orjson is used when it is installed; both serializers produce the same JSON
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+
+# Values written by this module start with the header byte followed by a byte
+# holding the codec id (high nibble) and the compression id (low nibble).
+# JSON text never starts with this byte, so values without it are legacy JSON.
+CACHE_FORMAT_HEADER = 0x01
+
+COMPRESSION_THRESHOLD = 1024
+ZLIB_LEVEL = 6
+
+
+class Codec(NamedTuple):
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+def _json_dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        # Non-string keys become strings, as with the standard library
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+JSON_CODEC = 0
+
+NO_COMPRESSION = 0
+ZLIB_COMPRESSION = 1
+
+CODECS = {JSON_CODEC: Codec(name='json', dumps=_json_dumps, loads=_json_loads)}
+
+COMPRESSORS: dict[int, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    ZLIB_COMPRESSION: (lambda data: zlib.compress(data, ZLIB_LEVEL), zlib.decompress),
+}
+
+DEFAULT_CODEC = JSON_CODEC
+DEFAULT_COMPRESSION = ZLIB_COMPRESSION
+
+
+def encode_value(
+    value: Any, codec: int = DEFAULT_CODEC, compression: int = DEFAULT_COMPRESSION
+) -> bytes:
+    """
+    Serializes the value with the codec and compresses payloads larger than the
+    threshold, as long as compression actually makes them smaller.
+    """
+    payload = CODECS[codec].dumps(value)
+
+    used_compression = NO_COMPRESSION
+    if compression != NO_COMPRESSION and len(payload) > COMPRESSION_THRESHOLD:
+        compressed = COMPRESSORS[compression][0](payload)
+        if len(compressed) < len(payload):
+            payload, used_compression = compressed, compression
+
+    return bytes((CACHE_FORMAT_HEADER, codec << 4 | used_compression)) + payload
+
+
+def decode_value(data: bytes) -> Any:
+    """
+    Deserializes a value written by `encode_value` or a legacy JSON value.
+
+    Raises ValueError if the value uses a codec or compression that is not
+    available in this process.
+    """
+    if not data or data[0] != CACHE_FORMAT_HEADER:
+        return json.loads(data)
+
+    if len(data) < 2:
+        raise ValueError('Truncated cache value header')
+
+    codec, compression = data[1] >> 4, data[1] & 0x0F
+    if codec not in CODECS or (compression != NO_COMPRESSION and compression not in COMPRESSORS):
+        raise ValueError(
+            f'Unsupported cache value format: codec {codec}, compression {compression}'
+        )
+
+    payload = data[2:]
+    if compression != NO_COMPRESSION:
+        payload = COMPRESSORS[compression][1](payload)
+
+    return CODECS[codec].loads(payload)
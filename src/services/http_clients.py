@@ -0,0 +1,116 @@
+import logging
+
+import httpx
+from pydantic import BaseModel
+
+
+logger = logging.getLogger(__name__)
+
+
+GOOGLE_CLIENT = 'google'
+OPENCAGE_CLIENT = 'opencage'
+OPENAI_CLIENT = 'openai'
+
+
+class HttpClientConfig(BaseModel):
+    """Connection pool limits and timeouts of a single upstream."""
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float = 30.0
+    timeout: float
+    connect_timeout: float = 5.0
+
+
+HTTP_CLIENT_CONFIGS = {
+    GOOGLE_CLIENT: HttpClientConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        timeout=10.0,
+    ),
+    OPENCAGE_CLIENT: HttpClientConfig(
+        max_connections=50,
+        max_keepalive_connections=20,
+        timeout=5.0,
+    ),
+    OPENAI_CLIENT: HttpClientConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=60.0,
+        timeout=60.0,
+    ),
+}
+
+
+class HttpClientRegistry:
+    """
+    Long-lived, keep-alive HTTP client pools, one per upstream service.
+
+    Clients are opened in the application lifespan and shared by all requests
+    of the worker; a client requested outside of the lifespan is opened lazily.
+    """
+
+    def __init__(self, configs: dict[str, HttpClientConfig]):
+        self.configs = configs
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def open(self) -> None:
+        """Opens the clients of all configured upstreams."""
+        for name in self.configs:
+            self.get(name)
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Returns the pooled client of the upstream."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create_client(config=self.configs[name])
+            self._clients[name] = client
+
+        return client
+
+    async def aclose(self) -> None:
+        """Closes all clients and their connections."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def stats(self) -> dict[str, dict[str, int | bool]]:
+        """Returns the pool utilization of every opened client."""
+        return {name: self._pool_stats(name, client) for name, client in self._clients.items()}
+
+    def _pool_stats(self, name: str, client: httpx.AsyncClient) -> dict[str, int | bool]:
+        stats = {'max_connections': self.configs[name].max_connections}
+
+        # httpx has no public pool statistics, its transport and the httpcore pool
+        # are read defensively and reported as unavailable if their layout changes
+        pool = getattr(getattr(client, '_transport', None), '_pool', None)
+        try:
+            connections = list(pool.connections)
+            requests = list(pool._requests)
+            idle = sum(1 for connection in connections if connection.is_idle())
+            queued = sum(1 for request in requests if request.is_queued())
+        except (AttributeError, TypeError):
+            return {**stats, 'available': False}
+
+        return {
+            **stats,
+            'available': True,
+            'connections': len(connections),
+            'active': len(connections) - idle,
+            'idle': idle,
+            'queued': queued,
+        }
+
+    @staticmethod
+    def _create_client(config: HttpClientConfig) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        )
+
+
+http_clients = HttpClientRegistry(configs=HTTP_CLIENT_CONFIGS)
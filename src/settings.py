@@ -15,14 +15,42 @@ class DatabaseSettings(BaseSettings):
     postgres_password: str
     postgres_host: str
     postgres_port: int
+    # Comma-separated host[:port] of read replicas with the same database and credentials
+    postgres_replica_hosts: str | None = None
+    # Connection pool of every engine in each worker
+    postgres_pool_size: int = 10
+    postgres_max_overflow: int = 10
+    postgres_pool_timeout: float = 30
+    # Seconds after which connections are reopened, below the idle timeouts of the server
+    postgres_pool_recycle: int = 1800
+    postgres_pool_pre_ping: bool = True
+    # Prepared statements cached per connection
+    postgres_statement_cache_size: int = 100
+    # Transaction pooling of PgBouncer cannot keep named prepared statements
+    postgres_pgbouncer: bool = False
+    postgres_echo: bool = False
 
     @property
     def database_url(self) -> str:
+        return self._build_database_url(host=self.postgres_host, port=self.postgres_port)
+
+    @property
+    def replica_database_urls(self) -> list[str]:
+        urls = []
+        for replica_host in (self.postgres_replica_hosts or '').split(','):
+            if not replica_host.strip():
+                continue
+            host, _, port = replica_host.strip().partition(':')
+            urls.append(self._build_database_url(host=host, port=int(port or self.postgres_port)))
+
+        return urls
+
+    def _build_database_url(self, host: str, port: int) -> str:
         return (
             f'postgresql+asyncpg://'
             f'{self.postgres_user}:'
             f'{self.postgres_password}@'
-            f'{self.postgres_host}:{self.postgres_port}/'
+            f'{host}:{port}/'
             f'{self.postgres_db}'
         )
 
@@ -34,6 +62,8 @@ class SecuritySettings(BaseSettings):
     refresh_token_expire: int
     jwt_secret_key: str
     encryption_key: str
+    # Token the /internal endpoints require, they are disabled without it
+    internal_api_token: str | None = None
 
 
 class OAuthSettings(BaseSettings):
@@ -44,6 +74,7 @@ class OAuthSettings(BaseSettings):
 
 class GeonamesSettings(BaseSettings):
     geo_name_data: str
+    gazetteer_index_path: str | None = None
 
 
 class RedisSettings(BaseSettings):
@@ -1,11 +1,20 @@
+import asyncio
 import logging
+from datetime import datetime, timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from src.auth.constants import TOKEN_BLACKLIST_PARTITIONS_AHEAD
+from src.auth.exceptions import TokenError
 from src.auth.repositories.token_blacklist import TokenBlacklistRepository
+from src.auth.services.revoked_tokens import revoked_token_filter
 from src.dependencies import get_db
+from src.places.constants import PLACE_DESCRIPTION_PREGENERATE_LIMIT, PLACE_ENRICHMENT_WORKERS
+from src.places.services.enrichment import place_enrichment_service
+from src.places.services.place_descriptions import place_description_service
 from src.services.cache import CacheService
+from src.settings import settings
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +28,12 @@ def setup_scheduler():
     # Add a token cleanup task
     add_token_cleanup_task(scheduler)
 
+    # Add a task requeuing places stuck in pending enrichment
+    add_enrichment_requeue_task(scheduler)
+
+    # Add a task describing popular places ahead of time
+    add_description_pregeneration_task(scheduler)
+
     return scheduler
 
 
@@ -33,13 +48,96 @@ def add_token_cleanup_task(scheduler):
     )
 
 
+def add_enrichment_requeue_task(scheduler):
+    """Add the enrichment requeue task to the scheduler."""
+
+    scheduler.add_job(
+        requeue_enrichment_task,
+        IntervalTrigger(minutes=10),
+        id='place_enrichment_requeue',
+        replace_existing=True,
+    )
+
+
+def add_description_pregeneration_task(scheduler):
+    """Add the description pregeneration task to the scheduler."""
+
+    scheduler.add_job(
+        pregenerate_descriptions_task,
+        IntervalTrigger(hours=24),
+        id='place_description_pregeneration',
+        replace_existing=True,
+    )
+
+
+async def pregenerate_descriptions_task():
+    """Generating descriptions of popular places that are not described yet."""
+    generated_count = await place_description_service.pregenerate_popular(
+        limit=PLACE_DESCRIPTION_PREGENERATE_LIMIT
+    )
+    if generated_count:
+        logger.info(f'Pregenerated descriptions of {generated_count} places.')
+
+
+async def requeue_enrichment_task():
+    """Requeuing enrichment of places that have been pending for too long."""
+    requeued_count = await place_enrichment_service.requeue_stale_jobs()
+    if requeued_count:
+        logger.info(f'Requeued enrichment of {requeued_count} places.')
+
+
 async def cleanup_task():
-    """Cleaning up obsolete tokens."""
+    """Cleaning up obsolete tokens by dropping whole expired partitions."""
+    await prepare_token_blacklist_partitions()
+
     async for session in get_db():
         repository = TokenBlacklistRepository(db_session=session)
 
-        removed_count = await repository.remove_expired_tokens()
-        logger.info(f'Removed {removed_count} expired tokens.')
+        dropped_count = await repository.drop_expired_partitions()
+        logger.info(f'Dropped {dropped_count} expired token blacklist partitions.')
+
+    # Expired digests cannot be removed from a Bloom filter, so rebuild it
+    await revoked_token_filter.rebuild(load_digests=load_revoked_token_digests)
+
+
+async def prepare_token_blacklist_partitions():
+    """Creating the token blacklist partitions for every expiry date a new token can have."""
+    async for session in get_db():
+        repository = TokenBlacklistRepository(db_session=session)
+
+        try:
+            await repository.create_partitions(
+                start=datetime.now(timezone.utc).date(),
+                days=settings.refresh_token_expire + TOKEN_BLACKLIST_PARTITIONS_AHEAD,
+            )
+        except (TokenError, OSError) as e:
+            logger.error(f'Token blacklist partitions were not prepared: {e}')
+
+
+async def load_revoked_token_digests() -> list[str]:
+    """Loading digests of the revoked tokens that have not expired yet."""
+    async for session in get_db():
+        repository = TokenBlacklistRepository(db_session=session)
+
+        return await repository.get_active_token_digests()
+
+
+def start_revoked_token_filter() -> asyncio.Task:
+    """Starting the task that loads and synchronizes the revoked token filter."""
+
+    return asyncio.create_task(revoked_token_filter.run(load_digests=load_revoked_token_digests))
+
+
+def start_place_enrichment_workers():
+    """Starting the background workers that enrich created places."""
+
+    place_enrichment_service.start(workers=PLACE_ENRICHMENT_WORKERS)
+
+
+async def stop_place_enrichment_workers():
+    """Stopping the place enrichment workers."""
+
+    await place_enrichment_service.stop()
 
 
 async def check_redis_connection():
@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLLRUCache:
+    """
+    In-process LRU cache whose entries expire after a time-to-live.
+
+    Intended for small, hot working sets kept per worker in front of Redis.
+    Besides the number of entries, the cache can be bounded by the total size
+    the caller reports for the stored values.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, maxbytes: int | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the value for the key, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None, size: int = 0) -> None:
+        """Stores the value, evicting the least recently used entries if needed."""
+        self.delete(key)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value, size)
+        self.nbytes += size
+
+        while len(self._data) > self.maxsize or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            _, (_, _, evicted_size) = self._data.popitem(last=False)
+            self.nbytes -= evicted_size
+
+    def delete(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,103 @@
+from bisect import bisect_left
+from collections import Counter, deque
+
+
+OTHER_KEYS = '_other'
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class HitRateCounter:
+    """
+    Per-key cache hit and miss counters of a worker.
+
+    At most `max_keys` keys are tracked individually, the traffic of the keys
+    seen after that is counted under a shared `_other` key.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+
+    def record(self, key: str, hit: bool) -> None:
+        if key not in self._hits and key not in self._misses and self._key_count() >= self.max_keys:
+            key = OTHER_KEYS
+
+        if hit:
+            self._hits[key] += 1
+        else:
+            self._misses[key] += 1
+
+    def stats(self, top: int = 50) -> dict:
+        """Returns the overall hit rate and the counters of the busiest keys."""
+        hits, misses = sum(self._hits.values()), sum(self._misses.values())
+        traffic = self._hits + self._misses
+
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else None,
+            'keys': {
+                key: {'hits': self._hits[key], 'misses': self._misses[key]}
+                for key, _ in traffic.most_common(top)
+            },
+        }
+
+    def reset(self) -> None:
+        self._hits.clear()
+        self._misses.clear()
+
+    def _key_count(self) -> int:
+        return len(self._hits.keys() | self._misses.keys())
+
+
+class LatencyStats:
+    """
+    Durations of an operation on a worker, with a histogram of all samples and
+    percentiles over the last `window` samples.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._buckets[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self._recent.append(seconds)
+
+    def stats(self) -> dict:
+        """
+        Returns the count, the mean, percentiles and maximum in milliseconds, and
+        the sample counts by the upper bound of their histogram bucket.
+        """
+        recent = sorted(self._recent)
+
+        def percentile(fraction: float) -> float | None:
+            if not recent:
+                return None
+            return recent[min(int(len(recent) * fraction), len(recent) - 1)] * 1000
+
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else None,
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': self.max * 1000,
+            'histogram_ms': dict(zip([*map(str, LATENCY_BUCKETS_MS), 'inf'], self._buckets)),
+        }
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._recent.clear()
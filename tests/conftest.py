@@ -1,15 +1,24 @@
+import re
+from contextlib import contextmanager
 from datetime import date
 from typing import AsyncGenerator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import NullPool
+from sqlalchemy import NullPool, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.dependencies import get_db
+from src.auth.services.principal_cache import PrincipalCacheService
+from src.auth.services.revoked_tokens import revoked_token_filter
+from src.dependencies import get_db, get_session_factory, get_session_router
 from src.main import app
-from src.models import Place, SocialAccount, User
+from src.models import Location, Place, SocialAccount, User
+from src.places.services.place_descriptions import PlaceDescriptionService
+from src.places.utils.geohash import encode_geohash
 from src.repositories.postgres_base import Base
+from src.repositories.session_router import SessionRouter
+from src.services.cache import CacheService
+from src.settings import settings
 
 
 DATABASE_URL = 'sqlite+aiosqlite:///test.db'
@@ -19,6 +28,32 @@ engine_test = create_async_engine(DATABASE_URL, poolclass=NullPool)
 async_session_maker = async_sessionmaker(bind=engine_test, expire_on_commit=False, future=True)
 
 
+@event.listens_for(engine_test.sync_engine, 'connect')
+def register_sqlite_functions(dbapi_connection, connection_record):  # noqa
+    """Provides the Postgres functions the queries use that SQLite lacks."""
+    dbapi_connection.create_function(
+        'regexp_replace',
+        4,
+        lambda value, pattern, replacement, flags: (
+            None if value is None else re.sub(pattern, replacement, value)
+        ),
+    )
+
+
+@contextmanager
+def captured_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa
+        statements.append((statement, parameters))
+
+    event.listen(engine_test.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine_test.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
 async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async session"""
     async with async_session_maker() as session:
@@ -26,10 +61,16 @@ async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 app.dependency_overrides[get_db] = override_get_async_session
+app.dependency_overrides[get_session_factory] = lambda: async_session_maker
+app.dependency_overrides[get_session_router] = lambda: SessionRouter(replicas=[])
 
 
 @pytest.fixture(autouse=True, scope='function')
 async def init_db():
+    PrincipalCacheService.clear_local()
+    revoked_token_filter.reset()
+    PlaceDescriptionService.clear_local()
+    CacheService.clear_local()
     async with engine_test.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
@@ -90,6 +131,10 @@ async def another_user(async_session: AsyncSession):
 
 @pytest.fixture(scope='function')
 async def mock_place(async_session: AsyncSession, mock_user: User):
+    test_location = Location(city='kyiv', country='ukraine', latitude=50.4501, longitude=30.5234)
+    async_session.add(test_location)
+    await async_session.flush()
+
     test_place = Place(
         place_name='Test place',
         city='Kyiv',
@@ -101,7 +146,18 @@ async def mock_place(async_session: AsyncSession, mock_user: User):
         visit_date=date(2024, 1, 28),
         place_type='visited',
         user_id=mock_user.id,
+        location_id=test_location.id,
+        latitude=test_location.latitude,
+        longitude=test_location.longitude,
+        geohash=encode_geohash(latitude=test_location.latitude, longitude=test_location.longitude),
     )
     async_session.add(test_place)
     await async_session.commit()
     return test_place
+
+
+@pytest.fixture(scope='function')
+def internal_headers(monkeypatch) -> dict[str, str]:
+    """Enables the internal endpoints and returns the headers they require."""
+    monkeypatch.setattr(settings, 'internal_api_token', 'internal-test-token')
+    return {'X-Internal-Token': 'internal-test-token'}
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from src.auth.repositories.user import UserRepository
+from src.auth.services.principal_cache import PrincipalCacheService
+from tests.utils import create_test_token
+
+
+@pytest.mark.asyncio
+async def test_get_me_served_from_principal_cache(
+    async_client: AsyncClient, mock_user, mock_social_account
+):
+    token = create_test_token(user_id=mock_user.id)
+    url = 'api/v1/user/me'
+
+    get_user_by_id = UserRepository.get_user_by_id
+    db_calls = []
+
+    async def counting_get_user_by_id(self, user_id: int):
+        db_calls.append(user_id)
+        return await get_user_by_id(self, user_id=user_id)
+
+    with patch.object(UserRepository, 'get_user_by_id', counting_get_user_by_id):
+        first_response = await async_client.get(url, headers={'Authorization': f'Bearer {token}'})
+        second_response = await async_client.get(url, headers={'Authorization': f'Bearer {token}'})
+
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_200_OK
+    assert first_response.json() == second_response.json()
+    assert second_response.json()['social_accounts'][0]['service'] == 'google'
+    assert db_calls == [mock_user.id]
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidate(async_client: AsyncClient, mock_user):
+    token = create_test_token(user_id=mock_user.id)
+    url = 'api/v1/user/me'
+
+    response = await async_client.get(url, headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == status.HTTP_200_OK
+
+    principal_cache = PrincipalCacheService()
+    assert await principal_cache.get_principal(user_id=mock_user.id) is not None
+
+    await principal_cache.invalidate(user_id=mock_user.id)
+    assert await principal_cache.get_principal(user_id=mock_user.id) is None
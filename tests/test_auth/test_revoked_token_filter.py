@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from src.auth.repositories.token_blacklist import TokenBlacklistRepository
+from src.auth.services.revoked_tokens import revoked_token_filter
+from src.utils.bloom_filter import BloomFilter
+from tests.utils import create_test_token
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f'token_{i}' for i in range(1000)]
+    for item in items:
+        bloom_filter.add(item)
+
+    assert all(item in bloom_filter for item in items)
+    false_positives = sum(f'other_{i}' in bloom_filter for i in range(1000))
+    assert false_positives < 50
+
+
+@pytest.mark.asyncio
+async def test_ready_filter_skips_blacklist_lookup(async_client: AsyncClient, mock_user):
+    token = create_test_token(user_id=mock_user.id)
+    revoked_token_filter.ready = True
+
+    with patch.object(
+        TokenBlacklistRepository, 'is_token_blacklisted', new_callable=AsyncMock
+    ) as mock_is_blacklisted:
+        response = await async_client.get(
+            'api/v1/user/me', headers={'Authorization': f'Bearer {token}'}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_is_blacklisted.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ready_filter_rejects_revoked_token(async_client: AsyncClient, mock_user):
+    token = create_test_token(user_id=mock_user.id)
+    revoked_token_filter.ready = True
+    endpoint = 'api/v1/auth/token/refresh'
+
+    response = await async_client.post(endpoint, json={'refresh_token': token})
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.post(endpoint, json={'refresh_token': token})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
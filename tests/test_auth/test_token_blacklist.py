@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.repositories.token_blacklist import TokenBlacklistRepository
+from src.auth.schemas.auth_schemas import TokenBlacklistRequest
+from src.models import TokenBlacklist
+
+
+def executed_statements(session: AsyncMock) -> list[str]:
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_blacklisting_token_twice_keeps_one_entry(async_session: AsyncSession):
+    repository = TokenBlacklistRepository(db_session=async_session)
+    blacklist_entry = TokenBlacklistRequest(
+        token_hash='a' * 64, expires_at=datetime.now(timezone.utc) + timedelta(days=1)
+    )
+
+    await repository.add_token_to_blacklist(blacklist_entry=blacklist_entry)
+    await repository.add_token_to_blacklist(blacklist_entry=blacklist_entry)
+
+    assert await async_session.scalar(select(func.count()).select_from(TokenBlacklist)) == 1
+    assert await repository.is_token_blacklisted(token_hash='a' * 64)
+
+
+def test_partition_day_ignores_other_tables():
+    assert TokenBlacklistRepository._partition_day('token_blacklist_p20240128') == date(2024, 1, 28)
+    assert TokenBlacklistRepository._partition_day('token_blacklist_default') is None
+    assert TokenBlacklistRepository._partition_day('token_blacklist_pold') is None
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_partitions():
+    today = datetime.now(timezone.utc).date()
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(
+        scalars=MagicMock(
+            return_value=[
+                f'token_blacklist_p{(today - timedelta(days=1)):%Y%m%d}',
+                f'token_blacklist_p{today:%Y%m%d}',
+                'token_blacklist_default',
+            ]
+        )
+    )
+
+    dropped_count = await TokenBlacklistRepository(db_session=session).drop_expired_partitions()
+
+    assert dropped_count == 1
+    statements = executed_statements(session)
+    assert f'DROP TABLE token_blacklist_p{(today - timedelta(days=1)):%Y%m%d}' in statements
+    assert not any(statement.startswith('DROP TABLE token_blacklist_d') for statement in statements)
+    assert any(
+        statement.startswith('DELETE FROM token_blacklist_default') for statement in statements
+    )
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_partitions_skips_existing_and_moves_default_rows():
+    session = AsyncMock(spec=AsyncSession)
+    # The first day has a partition already
+    session.scalar.side_effect = [True, False]
+
+    await TokenBlacklistRepository(db_session=session).create_partitions(
+        start=date(2024, 1, 28), days=2
+    )
+
+    statements = executed_statements(session)
+    assert len(statements) == 3
+    assert statements[0].startswith('CREATE TABLE token_blacklist_p20240129 ')
+    assert 'DELETE FROM token_blacklist_default' in statements[1]
+    assert 'INSERT INTO token_blacklist_p20240129' in statements[1]
+    assert statements[2].startswith('ALTER TABLE token_blacklist ATTACH PARTITION')
+    assert "FROM ('2024-01-29T00:00:00+00:00') TO ('2024-01-30T00:00:00+00:00')" in statements[2]
+    session.commit.assert_awaited_once()
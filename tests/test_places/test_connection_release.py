@@ -0,0 +1,116 @@
+import asyncio
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette import status
+
+from src.dependencies import get_db, get_session_factory
+from src.enums.places import EnrichmentStatus
+from src.main import app
+from src.models import Place
+from src.places.schemas.enrichment import PlaceEnrichmentJob
+from src.places.schemas.openai import PlaceDetailResponse
+from src.places.services.enrichment import PlaceEnrichmentService
+from tests.conftest import DATABASE_URL
+from tests.utils import create_test_token
+
+
+SLOW_CALL_SECONDS = 1
+
+
+@pytest.fixture(scope='function')
+async def single_connection_pool() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Serves the app from a pool of one connection, which times out before slow calls end."""
+    engine = create_async_engine(
+        DATABASE_URL, pool_size=1, max_overflow=0, pool_timeout=SLOW_CALL_SECONDS / 2
+    )
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_maker() as session:
+            yield session
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_maker
+
+    yield session_maker
+
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@patch('src.places.services.places.PlaceEnrichmentQueue.enqueue', new_callable=AsyncMock)
+@patch('src.places.services.places.PlaceService._validate_location', new_callable=AsyncMock)
+async def test_slow_location_validation_does_not_block_reads(
+    mock_validate_location,
+    mock_enqueue,
+    async_client: AsyncClient,
+    mock_user,
+    single_connection_pool,
+):
+    async def validate_location(city, country):
+        await asyncio.sleep(SLOW_CALL_SECONDS)
+        return {}
+
+    mock_validate_location.side_effect = validate_location
+    headers = {'Authorization': f'Bearer {create_test_token(user_id=mock_user.id)}'}
+    place_data = {'place_name': 'Test place', 'city': 'Lviv', 'country': 'Ukraine'}
+
+    create_task = asyncio.create_task(
+        async_client.post(
+            'api/v1/places/', headers=headers, json={**place_data, 'place_type': 'visited'}
+        )
+    )
+    await asyncio.sleep(SLOW_CALL_SECONDS / 4)
+
+    response = await async_client.get('api/v1/places/', headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert not create_task.done()
+
+    response = await create_task
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.asyncio
+async def test_slow_llm_call_does_not_block_reads(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    mock_place: Place,
+    single_connection_pool,
+):
+    mock_place.enrichment_status = EnrichmentStatus.PENDING
+    await async_session.commit()
+
+    async def get_place_detail(place_name, city, country):
+        await asyncio.sleep(SLOW_CALL_SECONDS)
+        return PlaceDetailResponse(
+            description='Generated description', photo_url='https://example.com/photo.jpg'
+        )
+
+    description_service = AsyncMock()
+    description_service.get_place_detail.side_effect = get_place_detail
+    service = PlaceEnrichmentService(
+        queue=AsyncMock(),
+        description_service=description_service,
+        session_factory=single_connection_pool,
+    )
+
+    process_task = asyncio.create_task(
+        service.process(PlaceEnrichmentJob(place_id=mock_place.id, user_id=mock_place.user_id))
+    )
+    await asyncio.sleep(SLOW_CALL_SECONDS / 4)
+
+    response = await async_client.get(
+        f'api/v1/places/{mock_place.id}',
+        headers={'Authorization': f'Bearer {create_test_token(user_id=mock_place.user_id)}'},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert not process_task.done()
+
+    await process_task
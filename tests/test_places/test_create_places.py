@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
 from starlette import status
@@ -53,3 +55,34 @@ async def test_create_place_with_invalid_city_and_country(async_client: AsyncCli
         json=place_data,
     )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+@patch('src.places.services.places.PlaceEnrichmentQueue.enqueue', new_callable=AsyncMock)
+@patch('src.places.services.places.PlaceService._validate_location', new_callable=AsyncMock)
+async def test_create_duplicate_place(
+    mock_validate_location, mock_enqueue, async_client: AsyncClient, mock_user
+):
+    mock_validate_location.return_value = {}
+    token = create_test_token(user_id=mock_user.id)
+    place_data = {
+        'place_name': 'Test place',
+        'city': 'kyiv',
+        'country': 'Ukraine',
+        'visit_date': '2024-01-28',
+        'place_type': 'visited',
+    }
+
+    response = await async_client.post(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}, json=place_data
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()['city'] == 'Kyiv'
+
+    response = await async_client.post(
+        'api/v1/places/',
+        headers={'Authorization': f'Bearer {token}'},
+        json={**place_data, 'city': 'Kyiv'},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert mock_enqueue.await_count == 1
@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from src.models import Place
+from src.places.gazetteer.build import build_index
+from src.places.gazetteer.index import GazetteerIndex
+from src.places.schemas.filters import PlaceFilter
+from src.places.services.places import PlaceService
+from src.places.utils.location_utils import canonicalize_city, canonicalize_location
+from src.services.cache import CacheService
+
+
+COUNTRIES_DUMP = (
+    '#ISO\tISO3\tISO-Numeric\tfips\tCountry\n'
+    'UA\tUKR\t804\tUP\tUkraine\n'
+    'US\tUSA\t840\tUS\tUnited States\n'
+)
+CITIES_DUMP = (
+    '703448\tKyiv\tKyiv\tKiev,Kiew,Київ\t50.45\t30.52\tP\tPPLC\tUA\t\t12\t\t\t\t2797553\n'
+    '5128581\tNew York City\tNew York City\tNew York,NYC\t40.71\t-74.0\tP\tPPL\tUS'
+    '\t\tNY\t\t\t\t8804190\n'
+    '703447\tKyiv Reservoir\tKyiv Reservoir\t\t50.6\t30.4\tH\tRSV\tUA\t\t\t\t\t\t0\n'
+)
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    (tmp_path / 'countryInfo.txt').write_text(COUNTRIES_DUMP, encoding='utf-8')
+    (tmp_path / 'cities.txt').write_text(CITIES_DUMP, encoding='utf-8')
+    build_index(
+        cities_path=str(tmp_path / 'cities.txt'),
+        countries_path=str(tmp_path / 'countryInfo.txt'),
+        output_path=str(tmp_path / 'gazetteer.idx'),
+    )
+
+    index = GazetteerIndex(str(tmp_path / 'gazetteer.idx'))
+    yield index
+    index.close()
+
+
+def test_gazetteer_resolves_names(gazetteer: GazetteerIndex):
+    assert gazetteer.resolve(city='kyiv', country='ukraine') == ('Kyiv', 'Ukraine', 50.45, 30.52)
+    assert gazetteer.resolve(city='Київ', country='UA') == ('Kyiv', 'Ukraine', 50.45, 30.52)
+    assert gazetteer.resolve(city=' new  york ', country='USA') == (
+        'New York City',
+        'United States',
+        40.71,
+        -74.0,
+    )
+
+    assert gazetteer.resolve(city='Kyiv Reservoir', country='Ukraine') is None
+    assert gazetteer.resolve(city='Kyiv', country='United States') is None
+    assert gazetteer.resolve(city='Kyiv', country='Atlantis') is None
+
+
+@pytest.mark.asyncio
+async def test_known_location_is_validated_locally(gazetteer: GazetteerIndex):
+    geo_repository = AsyncMock()
+    place_service = PlaceService(
+        place_repository=AsyncMock(),
+        geo_repository=geo_repository,
+        cache_service=CacheService(),
+        enrichment_queue=AsyncMock(),
+        unit_of_work=AsyncMock(),
+    )
+
+    with patch('src.places.utils.location_utils.get_gazetteer', return_value=gazetteer):
+        location_data = await place_service._validate_location(city='Kyiv', country='Ukraine')
+
+    geo_repository.get_location_data.assert_not_awaited()
+    assert location_data['geometry'] == {'lat': 50.45, 'lng': 30.52}
+
+
+def test_filter_resolves_cities_like_stored_locations(gazetteer: GazetteerIndex):
+    with patch('src.places.utils.location_utils.get_gazetteer', return_value=gazetteer):
+        stored_city, _ = canonicalize_location(city='Kiew', country='UA')
+        query = PlaceFilter(cities=['Kiew'], countries=['ukraine']).filter(select(Place))
+
+        # Alternate names known only to the gazetteer, with and without a country
+        assert canonicalize_city(city='Kiew') == stored_city == 'kyiv'
+        assert canonicalize_city(city='Kiew', country='Ukraine') == stored_city
+
+    assert query.compile().params['city_1'] == ['kyiv']
@@ -2,6 +2,8 @@ import pytest
 from httpx import AsyncClient
 from starlette import status
 
+from src.places.dependencies import get_description_agent
+from tests.conftest import captured_statements
 from tests.utils import create_test_token
 
 
@@ -76,3 +78,57 @@ async def test_get_places_by_filter_non_existent(async_client: AsyncClient, mock
     assert response.status_code == 200
     data = response.json()
     assert data == []
+
+
+@pytest.mark.asyncio
+async def test_get_places_does_not_build_agent(async_client: AsyncClient, mock_user, mock_place):
+    token = create_test_token(user_id=mock_user.id)
+    get_description_agent.cache_clear()
+
+    response = await async_client.get(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert get_description_agent.cache_info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_get_places_with_fields(async_client: AsyncClient, mock_user, mock_place):
+    token = create_test_token(user_id=mock_user.id)
+
+    with captured_statements() as statements:
+        response = await async_client.get(
+            'api/v1/places/?fields=place_name,visit_date',
+            headers={'Authorization': f'Bearer {token}'},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {'id': mock_place.id, 'place_name': mock_place.place_name, 'visit_date': '2024-01-28'}
+    ]
+    (place_statement,) = [statement for statement, _ in statements if 'FROM places' in statement]
+    assert 'description' not in place_statement
+
+
+@pytest.mark.asyncio
+async def test_get_place_by_id_with_fields(async_client: AsyncClient, mock_user, mock_place):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        f'api/v1/places/{mock_place.id}?fields=city, rating',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'id': mock_place.id, 'city': 'Kyiv', 'rating': 5}
+
+
+@pytest.mark.asyncio
+async def test_get_places_with_unknown_fields(async_client: AsyncClient, mock_user, mock_place):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/?fields=place_name,user_id', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == 422
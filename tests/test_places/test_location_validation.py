@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.places.exceptions import LocationValidationError
+from src.places.services.places import PlaceService, geo_cache_stats
+from src.places.utils.location_utils import canonicalize_location
+from src.services.cache import CacheService
+
+
+def create_place_service(geo_repository: AsyncMock) -> PlaceService:
+    return PlaceService(
+        place_repository=AsyncMock(),
+        geo_repository=geo_repository,
+        cache_service=CacheService(),
+        enrichment_queue=AsyncMock(),
+        unit_of_work=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_validations_share_one_geo_request():
+    geo_repository = AsyncMock()
+
+    async def get_location_data(city, country):
+        await asyncio.sleep(0.01)
+        return {
+            'components': {'city': 'Lviv', 'country': 'Ukraine', 'postcode': '79000'},
+            'annotations': {'timezone': {'name': 'Europe/Kyiv'}},
+        }
+
+    geo_repository.get_location_data.side_effect = get_location_data
+    place_service = create_place_service(geo_repository=geo_repository)
+
+    await asyncio.gather(
+        *(place_service._validate_location(city='Lviv', country='Ukraine') for _ in range(5))
+    )
+    assert geo_repository.get_location_data.await_count == 1
+
+    cached_data = await CacheService.get_cache('geo_lviv_ukraine')
+    assert cached_data == {'components': {'city': 'Lviv', 'country': 'Ukraine'}}
+
+
+@pytest.mark.asyncio
+async def test_unknown_location_is_cached():
+    geo_repository = AsyncMock()
+    geo_repository.get_location_data.return_value = {}
+    place_service = create_place_service(geo_repository=geo_repository)
+
+    for _ in range(2):
+        with pytest.raises(LocationValidationError):
+            await place_service._validate_location(city='Nowhere', country='Ukraine')
+
+    assert geo_repository.get_location_data.await_count == 1
+
+
+def test_canonicalize_location():
+    assert canonicalize_location(city='Kiev', country='UA') == ('kyiv', 'ukraine')
+    assert canonicalize_location(city=' Kyiv ', country='Ukraine') == ('kyiv', 'ukraine')
+    assert canonicalize_location(city='München', country='Deutschland') == ('munich', 'germany')
+    assert canonicalize_location(city='New York', country='U.S.A.') == (
+        'new york',
+        'united states',
+    )
+
+
+@pytest.mark.asyncio
+async def test_aliases_share_one_cache_entry():
+    geo_cache_stats.reset()
+    geo_repository = AsyncMock()
+    geo_repository.get_location_data.return_value = {
+        'components': {'city': 'Kyiv', 'country': 'Ukraine'}
+    }
+    place_service = create_place_service(geo_repository=geo_repository)
+
+    await place_service._validate_location(city='Kiev', country='Ukraine')
+    await place_service._validate_location(city='Kyiv', country='Ua')
+
+    assert geo_repository.get_location_data.await_count == 1
+    assert geo_cache_stats.stats()['keys'] == {'geo_kyiv_ukraine': {'hits': 1, 'misses': 1}}
@@ -0,0 +1,234 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.models import Location, Place
+from src.places.services.places import PlaceService
+from src.places.utils.geohash import covering_prefixes, encode_geohash, next_prefix, prefix_ranges
+from src.repositories.unit_of_work import UnitOfWork
+from src.services.cache import CacheService
+from tests.conftest import async_session_maker
+from tests.utils import create_test_token
+
+
+@pytest.fixture(scope='function')
+async def places_around_kyiv(async_session: AsyncSession, mock_user, mock_place):
+    places = []
+    for place_name, latitude, longitude in (
+        ('Brovary park', 50.5110, 30.7909),
+        ('Lviv square', 49.8397, 24.0297),
+        ('Warsaw old town', 52.2297, 21.0122),
+    ):
+        place = Place(
+            place_name=place_name,
+            city='Somewhere',
+            country='Somewhere',
+            place_type='visited',
+            user_id=mock_user.id,
+            latitude=latitude,
+            longitude=longitude,
+            geohash=encode_geohash(latitude=latitude, longitude=longitude),
+        )
+        async_session.add(place)
+        places.append(place)
+    await async_session.commit()
+
+    return places
+
+
+def test_geohash_prefixes_cover_bounding_box():
+    assert encode_geohash(latitude=57.64911, longitude=10.40744, precision=11) == 'u4pruydqqvj'
+    assert next_prefix('u4pz') == 'u4q0'
+    assert next_prefix('zz') is None
+
+    prefixes = covering_prefixes(50.3, 30.3, 50.6, 30.8)
+    assert len(prefixes) <= 16
+    assert any(encode_geohash(50.45, 30.52).startswith(prefix) for prefix in prefixes)
+    assert prefix_ranges(['u8vw', 'u8vx', 'u8vz']) == [('u8vw', 'u8vy'), ('u8vz', 'u8w0')]
+
+
+@pytest.mark.asyncio
+async def test_get_places_nearby(async_client: AsyncClient, mock_user, places_around_kyiv):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/nearby',
+        params={'lat': 50.45, 'lng': 30.52, 'radius_km': 30},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {place['place_name'] for place in response.json()} == {'Test place', 'Brovary park'}
+
+
+@pytest.mark.asyncio
+async def test_get_places_nearby_invalid_radius(async_client: AsyncClient, mock_user):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/nearby',
+        params={'lat': 50.45, 'lng': 30.52, 'radius_km': 0},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_places_within(async_client: AsyncClient, mock_user, places_around_kyiv):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/within',
+        params={'min_lat': 49, 'min_lng': 20, 'max_lat': 51, 'max_lng': 31},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    places = response.json()
+    assert {place['place_name'] for place in places} == {
+        'Test place',
+        'Brovary park',
+        'Lviv square',
+    }
+    assert all(place['latitude'] is not None for place in places)
+
+
+@pytest.fixture(scope='function')
+async def places_around_dateline(async_session: AsyncSession, mock_user):
+    places = []
+    for place_name, longitude in (('Taveuni east', -179.8), ('Taveuni west', 179.95)):
+        place = Place(
+            place_name=place_name,
+            city='Somewhere',
+            country='Somewhere',
+            place_type='visited',
+            user_id=mock_user.id,
+            latitude=-16.8,
+            longitude=longitude,
+            geohash=encode_geohash(latitude=-16.8, longitude=longitude),
+        )
+        async_session.add(place)
+        places.append(place)
+    await async_session.commit()
+
+    return places
+
+
+def test_geohash_prefixes_cover_box_across_dateline():
+    prefixes = covering_prefixes(-17, 179.5, -16.5, -179.5)
+
+    assert any(encode_geohash(-16.8, -179.8).startswith(prefix) for prefix in prefixes)
+    assert any(encode_geohash(-16.8, 179.95).startswith(prefix) for prefix in prefixes)
+    assert not any(encode_geohash(-16.8, 0).startswith(prefix) for prefix in prefixes)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'url, params',
+    [
+        ('api/v1/places/nearby', {'lat': -16.8, 'lng': 179.9, 'radius_km': 50}),
+        (
+            'api/v1/places/within',
+            {'min_lat': -17, 'min_lng': 179.5, 'max_lat': -16.5, 'max_lng': -179.5},
+        ),
+    ],
+)
+async def test_places_across_dateline(
+    async_client: AsyncClient, mock_user, places_around_dateline, url, params
+):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        url, params=params, headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {place['place_name'] for place in response.json()} == {
+        'Taveuni east',
+        'Taveuni west',
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_places_within_invalid_bounds(async_client: AsyncClient, mock_user):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/within',
+        params={'min_lat': 51, 'min_lng': 20, 'max_lat': 49, 'max_lng': 31},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_place_clusters(
+    async_client: AsyncClient, mock_user, mock_place, places_around_kyiv
+):
+    token = create_test_token(user_id=mock_user.id)
+    params = {'min_lat': 49, 'min_lng': 20, 'max_lat': 53, 'max_lng': 31}
+
+    response = await async_client.get(
+        'api/v1/places/clusters',
+        params={**params, 'zoom': 3},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    clusters = response.json()
+    assert sum(cluster['count'] for cluster in clusters) == 4
+    assert len(clusters) < 4
+
+    # Zoomed in around Kyiv, the city and its suburb fall into separate clusters
+    response = await async_client.get(
+        'api/v1/places/clusters',
+        params={'min_lat': 50.3, 'min_lng': 30.3, 'max_lat': 50.7, 'max_lng': 30.9, 'zoom': 12},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    clusters = response.json()
+    assert [cluster['count'] for cluster in clusters] == [1, 1]
+    assert {place_id for cluster in clusters for place_id in cluster['place_ids']} == {
+        mock_place.id,
+        places_around_kyiv[0].id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_location_without_coordinates_gets_them_on_first_use(
+    async_client: AsyncClient, async_session: AsyncSession, mock_user, mock_place
+):
+    # A location backfilled by the migration, without coordinates
+    location = await async_session.get(Location, mock_place.location_id)
+    location.latitude = location.longitude = None
+    mock_place.latitude = mock_place.longitude = mock_place.geohash = None
+    await async_session.commit()
+
+    geo_repository = AsyncMock()
+    geo_repository.get_location_data.return_value = {
+        'components': {'city': 'Kyiv', 'country': 'Ukraine'},
+        'geometry': {'lat': 50.45, 'lng': 30.52},
+    }
+    place_service = PlaceService(
+        place_repository=AsyncMock(),
+        geo_repository=geo_repository,
+        cache_service=CacheService(),
+        enrichment_queue=AsyncMock(),
+        unit_of_work=UnitOfWork(db_session=async_session, session_factory=async_session_maker),
+    )
+
+    stored_location = await place_service._get_location(city='Kyiv', country='Ukraine')
+    assert (stored_location.id, stored_location.latitude) == (location.id, 50.45)
+
+    token = create_test_token(user_id=mock_user.id)
+    response = await async_client.get(
+        'api/v1/places/nearby',
+        params={'lat': 50.45, 'lng': 30.52, 'radius_km': 1},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert [place['id'] for place in response.json()] == [mock_place.id]
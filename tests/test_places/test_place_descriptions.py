@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models import Place
+from src.places.repositories.place_descriptions import PlaceDescriptionRepository
+from src.places.schemas.openai import PlaceDetailResponse
+from src.places.services.place_descriptions import PlaceDescriptionService
+from src.places.utils.location_utils import normalize_place_key
+from tests.conftest import async_session_maker
+
+
+@pytest.mark.asyncio
+async def test_place_description_is_generated_once():
+    openai_repository = AsyncMock()
+
+    async def get_place_detail(prompt):
+        await asyncio.sleep(0.01)
+        return PlaceDetailResponse(
+            description='Generated description', photo_url='https://example.com/photo.jpg'
+        )
+
+    openai_repository.get_place_detail.side_effect = get_place_detail
+    service = PlaceDescriptionService(
+        openai_repository=openai_repository, session_factory=async_session_maker
+    )
+
+    results = await asyncio.gather(
+        service.get_place_detail(place_name='Test place', city='Kyiv', country='Ukraine'),
+        service.get_place_detail(place_name='test  place', city='kyiv', country='UKRAINE'),
+    )
+    assert results[0] == results[1]
+    assert openai_repository.get_place_detail.await_count == 1
+
+    # The description is stored, so other workers do not call OpenAI either
+    PlaceDescriptionService.clear_local()
+    result = await service.get_place_detail(place_name='Test Place', city='Kyiv', country='Ukraine')
+    assert result.description == 'Generated description'
+    assert openai_repository.get_place_detail.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_popular_places_use_description_keys(mock_user, another_user):
+    async with async_session_maker() as session:
+        session.add_all(
+            [
+                Place(
+                    place_name='Eiffel  Tower',
+                    city='Paris',
+                    country='France',
+                    place_type='visited',
+                    user_id=mock_user.id,
+                ),
+                Place(
+                    place_name=' eiffel tower',
+                    city='paris ',
+                    country='FRANCE',
+                    place_type='visited',
+                    user_id=another_user.id,
+                ),
+                Place(
+                    place_name='Louvre',
+                    city='Paris',
+                    country='France',
+                    place_type='visited',
+                    user_id=mock_user.id,
+                ),
+                Place(
+                    place_name='Louvre',
+                    city='Paris',
+                    country='France',
+                    place_type='planned',
+                    user_id=another_user.id,
+                ),
+            ]
+        )
+        await session.commit()
+
+        repository = PlaceDescriptionRepository(db_session=session)
+        await repository.save_description(
+            *normalize_place_key(place_name='Louvre', city='Paris', country='France'),
+            place_detail=PlaceDetailResponse(description='Museum', photo_url='louvre.jpg'),
+        )
+
+        keys = await repository.get_popular_undescribed_places(limit=10)
+
+    assert keys == [normalize_place_key(place_name='Eiffel Tower', city='Paris', country='France')]
@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.enums.places import EnrichmentStatus
+from src.models import Place
+from src.places.exceptions import OpenAIError
+from src.places.schemas.enrichment import PlaceEnrichmentJob
+from src.places.schemas.openai import PlaceDetailResponse
+from src.places.services.enrichment import PlaceEnrichmentService
+from tests.conftest import async_session_maker
+from tests.utils import create_test_token
+
+
+@pytest.mark.asyncio
+@patch('src.places.services.places.PlaceEnrichmentQueue.enqueue', new_callable=AsyncMock)
+@patch('src.places.services.places.PlaceService._validate_location', new_callable=AsyncMock)
+async def test_create_place_returns_pending_place(
+    mock_validate_location, mock_enqueue, async_client: AsyncClient, mock_user
+):
+    mock_validate_location.return_value = {}
+    token = create_test_token(user_id=mock_user.id)
+    place_data = {
+        'place_name': 'Test place',
+        'city': 'Kyiv',
+        'country': 'Ukraine',
+        'place_type': 'visited',
+    }
+
+    response = await async_client.post(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}, json=place_data
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    place = response.json()
+    assert place['enrichment_status'] == 'pending'
+
+    job = mock_enqueue.call_args.kwargs['job']
+    assert job.place_id == place['id']
+
+    response = await async_client.get(
+        f"api/v1/places/{place['id']}/enrichment", headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'place_id': place['id'], 'enrichment_status': 'pending'}
+
+
+@pytest.mark.asyncio
+async def test_process_enrichment_job(async_session: AsyncSession, mock_place: Place):
+    mock_place.enrichment_status = EnrichmentStatus.PENDING
+    await async_session.commit()
+
+    description_service = AsyncMock()
+    description_service.get_place_detail.return_value = PlaceDetailResponse(
+        description='Generated description', photo_url='https://example.com/photo.jpg'
+    )
+    service = PlaceEnrichmentService(
+        queue=AsyncMock(),
+        description_service=description_service,
+        session_factory=async_session_maker,
+    )
+
+    await service.process(PlaceEnrichmentJob(place_id=mock_place.id, user_id=mock_place.user_id))
+
+    await async_session.refresh(mock_place)
+    assert mock_place.enrichment_status == EnrichmentStatus.COMPLETED
+    assert mock_place.description == 'Generated description'
+
+
+@pytest.mark.asyncio
+@patch('src.places.services.enrichment.PLACE_ENRICHMENT_RETRY_DELAY', 0)
+async def test_process_enrichment_job_dead_letter(async_session: AsyncSession, mock_place: Place):
+    mock_place.enrichment_status = EnrichmentStatus.PENDING
+    await async_session.commit()
+
+    description_service = AsyncMock()
+    description_service.get_place_detail.side_effect = OpenAIError()
+    queue = AsyncMock()
+    service = PlaceEnrichmentService(
+        queue=queue, description_service=description_service, session_factory=async_session_maker
+    )
+
+    await service.process(PlaceEnrichmentJob(place_id=mock_place.id, user_id=mock_place.user_id))
+
+    await async_session.refresh(mock_place)
+    assert mock_place.enrichment_status == EnrichmentStatus.FAILED
+    assert description_service.get_place_detail.await_count == 3
+    queue.dead_letter.assert_awaited_once()
@@ -0,0 +1,92 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.models import Place
+from tests.utils import create_test_token
+
+
+@pytest.fixture(scope='function')
+async def rated_places(async_session: AsyncSession, mock_user):
+    places = [
+        Place(
+            place_name=f'Place {index}',
+            city='Kyiv',
+            country='Ukraine',
+            rating=rating,
+            place_type='visited',
+            user_id=mock_user.id,
+        )
+        for index, rating in enumerate((3, None, 5, 3, 1))
+    ]
+    async_session.add_all(places)
+    await async_session.commit()
+
+    return places
+
+
+async def get_all_pages(async_client: AsyncClient, token: str, params: dict) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        response = await async_client.get(
+            'api/v1/places/page',
+            params={**params, 'limit': 2} | ({'cursor': cursor} if cursor else {}),
+            headers={'Authorization': f'Bearer {token}'},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        items.extend(page['items'])
+
+        cursor = page['next_cursor']
+        if cursor is None:
+            return items
+
+
+@pytest.mark.asyncio
+async def test_get_places_pages(async_client: AsyncClient, mock_user, rated_places):
+    token = create_test_token(user_id=mock_user.id)
+
+    items = await get_all_pages(async_client, token=token, params={})
+
+    assert [item['id'] for item in items] == sorted(place.id for place in rated_places)
+
+
+@pytest.mark.asyncio
+async def test_get_places_pages_sorted_by_rating(
+    async_client: AsyncClient, mock_user, rated_places
+):
+    token = create_test_token(user_id=mock_user.id)
+
+    params = {'sortByDateOrRating': '-rating'}
+    items = await get_all_pages(async_client, token=token, params=params)
+
+    response = await async_client.get(
+        'api/v1/places/page',
+        params={**params, 'limit': 100},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert items == response.json()['items']
+    assert len(items) == len(rated_places)
+    assert items[-1]['rating'] is None
+
+
+@pytest.mark.asyncio
+async def test_get_places_page_invalid_cursor(async_client: AsyncClient, mock_user, rated_places):
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/page',
+        params={'limit': 2},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    cursor = response.json()['next_cursor']
+
+    for params in (
+        {'cursor': 'not a cursor'},
+        {'cursor': cursor, 'sortByDateOrRating': 'rating'},
+    ):
+        response = await async_client.get(
+            'api/v1/places/page', params=params, headers={'Authorization': f'Bearer {token}'}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,111 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.enums.places import PlaceRating
+from src.models import PlannedPlace
+from src.places.repositories.places import PlaceRepository
+from src.places.schemas.filters import PlaceFilter
+from tests.conftest import captured_statements, engine_test
+
+
+async def get_query_plan(statement: str, parameters) -> str:
+    async with engine_test.connect() as conn:
+        result = await conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        return '\n'.join(row[-1] for row in result)
+
+
+async def assert_uses_index(statements: list, index_name: str) -> None:
+    (statement, parameters), *_ = [item for item in statements if 'SELECT' in item[0]]
+    plan = await get_query_plan(statement, parameters)
+
+    assert f'INDEX {index_name}' in plan, plan
+    assert 'SCAN places' not in plan, plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'order_by, index_name',
+    [('-rating', 'ix_places_user_id_rating_id'), ('visit_date', 'ix_places_user_id_visit_date_id')],
+)
+async def test_sorted_places_use_index(async_session: AsyncSession, order_by, index_name):
+    with captured_statements() as statements:
+        await PlaceRepository(db_session=async_session).get_places_by_user(
+            filters=PlaceFilter(order_by=[order_by]), user_id=1, limit=10
+        )
+
+    await assert_uses_index(statements, index_name=index_name)
+
+
+@pytest.mark.asyncio
+async def test_places_page_uses_index(async_session: AsyncSession):
+    with captured_statements() as statements:
+        await PlaceRepository(db_session=async_session).get_places_page(
+            filters=PlaceFilter(), user_id=1, sort_field='id', descending=False, after=(None, 10)
+        )
+
+    await assert_uses_index(statements, index_name='ix_places_user_id_id')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'sort_field, descending, after',
+    [
+        ('rating', True, (PlaceRating.FOUR, 10)),
+        ('visit_date', False, (date(2024, 1, 28), 10)),
+        ('rating', False, (None, 10)),
+    ],
+)
+async def test_places_page_after_cursor_seeks_index(
+    async_session: AsyncSession, sort_field, descending, after
+):
+    with captured_statements() as statements:
+        await PlaceRepository(db_session=async_session).get_places_page(
+            filters=PlaceFilter(),
+            user_id=1,
+            sort_field=sort_field,
+            descending=descending,
+            after=after,
+        )
+
+    # The places with a value and the ones without it seek past the cursor in turn
+    selects = [item for item in statements if 'SELECT' in item[0]]
+    assert len(selects) == (1 if after[0] is None else 2)
+    for statement, parameters in selects:
+        plan = await get_query_plan(statement, parameters)
+
+        assert f'INDEX ix_places_user_id_{sort_field}_id (user_id=? AND {sort_field}' in plan, plan
+        assert 'TEMP B-TREE' not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_places_by_type_use_index(async_session: AsyncSession):
+    with captured_statements() as statements:
+        await PlaceRepository(db_session=async_session).get_places_by_user(
+            filters=PlaceFilter(place_type__in=['visited']), user_id=1, limit=10
+        )
+
+    await assert_uses_index(statements, index_name='ix_places_user_id_place_type')
+
+
+@pytest.mark.asyncio
+async def test_planned_places_by_user_use_index(async_session: AsyncSession):
+    with captured_statements() as statements:
+        await async_session.execute(select(PlannedPlace).where(PlannedPlace.user_id == 1))
+
+    (statement, parameters), *_ = statements
+    plan = await get_query_plan(statement, parameters)
+
+    assert 'INDEX ix_planned_places_user_id_geohash' in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_places_by_location_use_index(async_session: AsyncSession):
+    with captured_statements() as statements:
+        await PlaceRepository(db_session=async_session).get_places_by_user(
+            filters=PlaceFilter(city__in=['Kyiv'], country__in=['Ukraine']), user_id=1, limit=10
+        )
+
+    await assert_uses_index(statements, index_name='ix_places_user_id_location_id')
@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import NullPool
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from starlette import status
+
+from src.auth.repositories.token_blacklist import TokenBlacklistRepository
+from src.auth.schemas.auth_schemas import TokenBlacklistRequest
+from src.auth.services.revoked_tokens import revoked_token_filter
+from src.auth.utils.security_utils import hash_token
+from src.dependencies import get_session_router
+from src.main import app
+from src.models import User
+from src.repositories.postgres_base import Base
+from src.repositories.session_router import SessionRouter
+from tests.utils import create_test_token
+
+
+@pytest.fixture(scope='function')
+async def replica_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """A replica that has the users replicated but lags behind on places."""
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path}/replica.db', poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope='function')
+async def replicated_user(replica_engine: AsyncEngine, mock_user: User) -> User:
+    async with replica_engine.begin() as conn:
+        await conn.execute(
+            User.__table__.insert().values(
+                id=mock_user.id, full_name=mock_user.full_name, email=mock_user.email
+            )
+        )
+
+    return mock_user
+
+
+@pytest.fixture(scope='function')
+def replica_router(replica_engine: AsyncEngine) -> AsyncGenerator[SessionRouter, None]:
+    session_router = SessionRouter(replicas=[replica_engine])
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_session_router] = lambda: session_router
+
+    yield session_router
+
+    app.dependency_overrides = overrides
+
+
+def test_replicas_are_used_in_turn():
+    engines = [create_async_engine('sqlite+aiosqlite://') for _ in range(2)]
+    session_router = SessionRouter(replicas=engines)
+
+    factories = [session_router.replica_session_factory() for _ in range(4)]
+
+    assert [factory.kw['bind'] for factory in factories] == engines * 2
+
+
+def test_unhealthy_replicas_are_skipped():
+    engines = [create_async_engine('sqlite+aiosqlite://') for _ in range(2)]
+    session_router = SessionRouter(replicas=engines)
+
+    session_router.replicas[0].mark_unhealthy()
+    assert {session_router.replica_session_factory().kw['bind'] for _ in range(3)} == {engines[1]}
+
+    session_router.replicas[1].mark_unhealthy()
+    assert session_router.replica_session_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_replica_failing_to_connect_is_marked_unhealthy(tmp_path: Path):
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path}/missing/replica.db')
+    session_router = SessionRouter(replicas=[engine])
+
+    with pytest.raises(OperationalError):
+        async with session_router.replica_session_factory()() as session:
+            await session.connection()
+
+    assert not session_router.replicas[0].is_healthy
+    assert session_router.replica_session_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(
+    async_client: AsyncClient, replica_router, replicated_user, mock_place
+):
+    token = create_test_token(user_id=replicated_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_primary_after_write(
+    async_client: AsyncClient, replica_router, replicated_user, mock_place
+):
+    token = create_test_token(user_id=replicated_user.id)
+    await SessionRouter.mark_write(user_id=replicated_user.id)
+
+    response = await async_client.get(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [place['id'] for place in response.json()] == [mock_place.id]
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_checked_on_primary(
+    async_client: AsyncClient, async_session: AsyncSession, replica_router, replicated_user
+):
+    token = create_test_token(user_id=replicated_user.id)
+    # The replica has not received the revocation yet
+    await TokenBlacklistRepository(db_session=async_session).add_token_to_blacklist(
+        blacklist_entry=TokenBlacklistRequest(
+            token_hash=hash_token(token=token),
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=1),
+        )
+    )
+    revoked_token_filter.add_local(token_hash=hash_token(token=token))
+
+    response = await async_client.get(
+        'api/v1/places/', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+@patch('src.places.dependencies.SessionRouter.reads_from_primary', new_callable=AsyncMock)
+async def test_primary_reads_lookup_is_limited_to_authenticated_reads(
+    mock_reads_from_primary, async_client: AsyncClient, replica_router, replicated_user, mock_place
+):
+    mock_reads_from_primary.return_value = False
+    forged_token = create_test_token(user_id=replicated_user.id) + 'forged'
+
+    response = await async_client.get(
+        'api/v1/places/', headers={'Authorization': f'Bearer {forged_token}'}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await async_client.delete(
+        f'api/v1/places/{mock_place.id}',
+        headers={'Authorization': f'Bearer {create_test_token(user_id=replicated_user.id)}'},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    mock_reads_from_primary.assert_not_awaited()
@@ -1,7 +1,11 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.models import Place
 from tests.utils import create_test_token
 
 
@@ -123,3 +127,52 @@ async def test_delete_place_other_user(async_client: AsyncClient, mock_place, an
 
     response = await async_client.delete(url, headers={'Authorization': f'Bearer {token}'})
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+@patch('src.places.services.places.PlaceService._validate_location', new_callable=AsyncMock)
+async def test_partial_update_place_keeps_other_fields(
+    mock_validate_location, async_client: AsyncClient, mock_user, mock_place
+):
+    token = create_test_token(user_id=mock_user.id)
+    url = f'api/v1/places/{mock_place.id}'
+
+    response = await async_client.put(
+        url,
+        headers={'Authorization': f'Bearer {token}'},
+        json={'rating': 3, 'city': 'kyiv', 'country': 'UKRAINE'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert response_data['rating'] == 3
+    assert response_data['place_name'] == mock_place.place_name
+    assert response_data['city'] == 'Kyiv'
+    assert response_data['description'] == mock_place.description
+    mock_validate_location.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_place_to_existing_place(
+    async_client: AsyncClient, async_session: AsyncSession, mock_user, mock_place
+):
+    other_place = Place(
+        place_name='Other place',
+        city=mock_place.city,
+        country=mock_place.country,
+        visit_date=mock_place.visit_date,
+        place_type=mock_place.place_type,
+        user_id=mock_user.id,
+    )
+    async_session.add(other_place)
+    await async_session.commit()
+    token = create_test_token(user_id=mock_user.id)
+
+    response = await async_client.put(
+        f'api/v1/places/{other_place.id}',
+        headers={'Authorization': f'Bearer {token}'},
+        json={'place_name': mock_place.place_name},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert mock_place.place_name in response.json()['detail']
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import cache
+from src.services.cache import CacheService
+from src.services.cache_codecs import encode_value
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_coalesces_concurrent_loads():
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {'city': 'Kyiv'}
+
+    results = await asyncio.gather(
+        *(CacheService.get_or_set(key='geo_kyiv_ukraine', loader=loader) for _ in range(5))
+    )
+    assert results == [{'city': 'Kyiv'}] * 5
+    assert calls == 1
+
+    # Served from the local tier afterwards
+    assert await CacheService.get_or_set(key='geo_kyiv_ukraine', loader=loader) == {'city': 'Kyiv'}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_serves_stale_value_while_refreshing():
+    await CacheService.set_cache(key='geo_lviv_ukraine', value={'version': 1})
+    entry = cache._local_cache.get('geo_lviv_ukraine')
+    cache._local_cache.set(
+        'geo_lviv_ukraine', entry._replace(fresh_until=time.monotonic() - 1), ttl=60
+    )
+
+    async def loader():
+        return {'version': 2}
+
+    assert await CacheService.get_or_set(key='geo_lviv_ukraine', loader=loader) == {'version': 1}
+    await asyncio.gather(*cache._background_tasks)
+    assert await CacheService.get_or_set(key='geo_lviv_ukraine', loader=loader) == {'version': 2}
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_by_memory_budget(monkeypatch):
+    monkeypatch.setattr(cache._local_cache, 'maxbytes', 2_000)
+
+    for index in range(10):
+        await CacheService.set_cache(key=f'geo_city{index}_country', value={'data': 'x' * 500})
+
+    stats = CacheService.local_stats()
+    assert stats['bytes'] <= 2_000
+    assert 0 < stats['entries'] < 10
+    assert await CacheService.get_cache('geo_city9_country') == {'data': 'x' * 500}
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_are_flushed_once():
+    with patch('src.services.cache._flush', new_callable=AsyncMock) as mock_flush:
+        async with CacheService.batch_writes():
+            await CacheService.set_cache(key='principal_1', value={'id': 1})
+            await CacheService.set_many({'principal_2': {'id': 2}, 'principal_3': {'id': 3}})
+            await CacheService.delete_cache(key='principal_3')
+
+            # The local tier is disabled for principals, reads are served from the batch
+            assert await CacheService.get_cache('principal_1') == {'id': 1}
+            assert await CacheService.get_cache('principal_3') is None
+            mock_flush.assert_not_awaited()
+
+    mock_flush.assert_awaited_once()
+    writes = mock_flush.call_args.args[0]
+    assert [(write.key, write.data is None) for write in writes] == [
+        ('principal_1', False),
+        ('principal_2', False),
+        ('principal_3', True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_mget():
+    cached_values = [encode_value({'id': 1}), None, b'\x01\xff']
+    with patch.object(cache.redis_client, 'mget', new_callable=AsyncMock) as mock_mget:
+        mock_mget.return_value = cached_values
+        values = await CacheService.get_many(['principal_1', 'principal_2', 'principal_3'])
+
+    mock_mget.assert_awaited_once_with(['principal_1', 'principal_2', 'principal_3'])
+    assert values == {'principal_1': {'id': 1}, 'principal_2': None, 'principal_3': None}
+
+
+@pytest.mark.asyncio
+async def test_only_opted_in_namespaces_use_local_tier():
+    await CacheService.set_cache(key='geo_odesa_ukraine', value={'city': 'Odesa'})
+    await CacheService.set_cache(key='google_oauth_state_abc', value={'state': 'abc'})
+    await CacheService.set_cache(key='unknown_namespace_key', value={'value': 1})
+
+    assert cache._local_cache.get('geo_odesa_ukraine') is not None
+    assert cache._local_cache.get('google_oauth_state_abc') is None
+    assert cache._local_cache.get('unknown_namespace_key') is None
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from src.services import cache_codecs
+from src.services.cache_codecs import (
+    CACHE_FORMAT_HEADER,
+    CODECS,
+    COMPRESSION_THRESHOLD,
+    COMPRESSORS,
+    JSON_CODEC,
+    NO_COMPRESSION,
+    ZLIB_COMPRESSION,
+    decode_value,
+    encode_value,
+)
+
+
+def test_small_value_is_not_compressed():
+    value = {'city': 'Kyiv', 'country': 'Ukraine'}
+    data = encode_value(value, codec=JSON_CODEC, compression=ZLIB_COMPRESSION)
+
+    assert data[0] == CACHE_FORMAT_HEADER
+    assert data[1] & 0x0F == NO_COMPRESSION
+    assert decode_value(data) == value
+
+
+def test_large_value_is_compressed():
+    value = {'results': [{'formatted': 'Kyiv, Ukraine', 'confidence': 9}] * 100}
+    data = encode_value(value, codec=JSON_CODEC, compression=ZLIB_COMPRESSION)
+
+    assert len(json.dumps(value)) > COMPRESSION_THRESHOLD
+    assert data[1] & 0x0F == ZLIB_COMPRESSION
+    assert len(data) < len(json.dumps(value)) / 10
+    assert decode_value(data) == value
+
+
+def test_legacy_json_value_is_decoded():
+    assert decode_value(json.dumps({'state': 'abc'}).encode()) == {'state': 'abc'}
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError):
+        decode_value(bytes((CACHE_FORMAT_HEADER, 0xF0)) + b'{}')
+
+
+ROUND_TRIP_VALUES = (
+    None,
+    'Київ',
+    [1, 2.5, True, None],
+    {'place': {'name': 'Café', 'tags': ['old town']}},
+    # Non-string keys come back as strings
+    {1: 'one', 2.5: 'two and a half', False: 'no', None: 'nothing'},
+    {'results': [{'formatted': 'Kyiv, Ukraine', 'confidence': 9}] * 100},
+)
+
+
+@pytest.mark.parametrize('orjson_available', [True, False])
+@pytest.mark.parametrize('compression', [NO_COMPRESSION, *COMPRESSORS])
+@pytest.mark.parametrize('codec', list(CODECS))
+@pytest.mark.parametrize('value', ROUND_TRIP_VALUES)
+def test_value_round_trips_as_json(monkeypatch, orjson_available, compression, codec, value):
+    monkeypatch.setattr(
+        cache_codecs, 'ORJSON_AVAILABLE', orjson_available and cache_codecs.ORJSON_AVAILABLE
+    )
+
+    assert decode_value(encode_value(value, codec=codec, compression=compression)) == json.loads(
+        json.dumps(value)
+    )
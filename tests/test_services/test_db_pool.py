@@ -0,0 +1,63 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette import status
+
+from src.repositories.pool_metrics import TimedAsyncQueuePool, get_pool_stats, pool_wait_stats
+from src.utils.metrics import LatencyStats
+from tests.conftest import DATABASE_URL
+
+
+@pytest.fixture(autouse=True)
+def reset_pool_wait_stats():
+    pool_wait_stats.reset()
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkout_waits():
+    engine = create_async_engine(
+        DATABASE_URL, poolclass=TimedAsyncQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.1
+    )
+
+    async with engine.connect():
+        assert get_pool_stats(engine) == {
+            'size': 1,
+            'checked_out': 1,
+            'checked_in': 0,
+            'overflow': 0,
+        }
+
+        with pytest.raises(TimeoutError):
+            async with engine.connect():
+                pass
+
+    await engine.dispose()
+
+    stats = pool_wait_stats.stats()
+    assert stats['count'] == 2
+    assert stats['max_ms'] >= 100
+    assert stats['histogram_ms']['250'] == 1
+
+
+def test_latency_histogram():
+    latency_stats = LatencyStats()
+
+    for seconds in (0.0005, 0.001, 0.003, 7):
+        latency_stats.record(seconds)
+
+    histogram = latency_stats.stats()['histogram_ms']
+    assert histogram['1'] == 2
+    assert histogram['5'] == 1
+    assert histogram['inf'] == 1
+    assert sum(histogram.values()) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_db_pool_stats(async_client: AsyncClient, internal_headers):
+    response = await async_client.get('api/v1/internal/db-pool', headers=internal_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['primary']['checked_out'] == 0
+    assert response.json()['replicas'] == {}
+    assert 'histogram_ms' in response.json()['wait']
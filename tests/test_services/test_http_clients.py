@@ -0,0 +1,70 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from src.services.http_clients import (
+    HTTP_CLIENT_CONFIGS,
+    OPENCAGE_CLIENT,
+    HttpClientRegistry,
+)
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_clients_until_closed():
+    registry = HttpClientRegistry(configs=HTTP_CLIENT_CONFIGS)
+    registry.open()
+
+    client = registry.get(OPENCAGE_CLIENT)
+    assert registry.get(OPENCAGE_CLIENT) is client
+    assert set(registry.stats()) == set(HTTP_CLIENT_CONFIGS)
+
+    await registry.aclose()
+
+    assert client.is_closed
+    assert registry.stats() == {}
+    reopened_client = registry.get(OPENCAGE_CLIENT)
+    assert reopened_client is not client
+    assert not reopened_client.is_closed
+
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_are_available():
+    """Fails when an httpx upgrade changes the pool layout the statistics read."""
+    registry = HttpClientRegistry(configs=HTTP_CLIENT_CONFIGS)
+    registry.get(OPENCAGE_CLIENT)
+
+    assert registry.stats()[OPENCAGE_CLIENT] == {
+        'max_connections': HTTP_CLIENT_CONFIGS[OPENCAGE_CLIENT].max_connections,
+        'available': True,
+        'connections': 0,
+        'active': 0,
+        'idle': 0,
+        'queued': 0,
+    }
+
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_internal_endpoints_require_token(async_client: AsyncClient, internal_headers):
+    response = await async_client.get('api/v1/internal/http-pools')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get(
+        'api/v1/internal/http-pools', headers={'X-Internal-Token': 'wrong'}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get('api/v1/internal/http-pools', headers=internal_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_internal_endpoints_are_disabled_without_token(async_client: AsyncClient):
+    response = await async_client.get(
+        'api/v1/internal/http-pools', headers={'X-Internal-Token': ''}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND